@@ -36,6 +36,29 @@ CATEGORY_WEIGHTS = {
 }
 
 
+# Bump when the formula or weights change, so cached score responses are invalidated
+SCORE_VERSION = 1
+
+
+def score_version(student_profile) -> str:
+    """
+    Cheap fingerprint of everything get_score_breakdown() depends on: the
+    best verified raw_score per category (one GROUP BY over the student's
+    achievements) plus the profile's CGPA and stored score. Moving an
+    achievement to another category or changing a score changes it.
+    """
+    from django.db.models import Max
+    from apps.incoscore.models import Achievement
+
+    best = (
+        Achievement.objects.filter(student=student_profile, verified=True)
+        .values('category').annotate(best=Max('raw_score')).order_by('category')
+        .values_list('category', 'best')
+    )
+    categories = ','.join(f"{category}={score}" for category, score in best)
+    return f"{SCORE_VERSION}:{categories}:{student_profile.cgpa}:{student_profile.incoscore}"
+
+
 def calculate_incoscore(student_profile) -> float:
     """
     Calculate the InCoScore for a given StudentProfile.
@@ -169,13 +192,14 @@ def get_recommendations(student_profile, limit: int = 5) -> list:
     Higher InCoScore students get recommended more competitive opportunities.
     """
     from apps.opportunities.models import Opportunity
+    from apps.opportunities.labels import in_domains
 
     domains = student_profile.domains_of_interest or []
     score = student_profile.incoscore
 
     qs = Opportunity.objects.filter(is_active=True)
     if domains:
-        qs = qs.filter(domain__in=domains)
+        qs = in_domains(qs, domains)
 
     # Higher scoring students see more prestigious opportunities
     if score >= 70:
@@ -1,10 +1,13 @@
+import hashlib
+
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.http import JsonResponse
+from django.views.decorators.http import condition
 
 from .models import Achievement, ScoreHistory, ACHIEVEMENT_CATEGORIES
-from .engine import update_student_score, get_score_breakdown, get_leaderboard, get_recommendations
+from .engine import update_student_score, get_score_breakdown, score_version, get_leaderboard, get_recommendations
 
 
 @login_required
@@ -83,13 +86,33 @@ def global_leaderboard(request):
     })
 
 
+SCORE_FIELDS = ('username', 'incoscore', 'breakdown')
+
+
+def _score_etag(request):
+    version = f"{request.user.pk}:{score_version(request.user.studentprofile)}:{request.GET.get('fields', '')}"
+    return hashlib.md5(version.encode()).hexdigest()
+
+
 @login_required
+@condition(etag_func=_score_etag)
 def api_my_score(request):
-    """JSON API endpoint for current user's InCoScore and breakdown."""
+    """
+    JSON API endpoint for current user's InCoScore and breakdown.
+    `fields=incoscore` skips the breakdown; unchanged scores answer If-None-Match with a 304.
+    """
+    fields = [f.strip() for f in request.GET.get('fields', '').split(',') if f.strip()] or SCORE_FIELDS
+    unknown = [f for f in fields if f not in SCORE_FIELDS]
+    if unknown:
+        return JsonResponse({'error': f"Unknown field(s): {', '.join(unknown)}. Choose from: {', '.join(SCORE_FIELDS)}"},
+                            status=400)
+
     profile = request.user.studentprofile
-    breakdown = get_score_breakdown(profile)
-    return JsonResponse({
-        'username': request.user.username,
-        'incoscore': profile.incoscore,
-        'breakdown': breakdown,
-    })
+    payload = {}
+    if 'username' in fields:
+        payload['username'] = request.user.username
+    if 'incoscore' in fields:
+        payload['incoscore'] = profile.incoscore
+    if 'breakdown' in fields:
+        payload['breakdown'] = get_score_breakdown(profile)
+    return JsonResponse(payload)
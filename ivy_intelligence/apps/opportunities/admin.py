@@ -1,19 +1,173 @@
 from django.contrib import admin
-from .models import Opportunity, ScrapingLog
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+from .models import (
+    Opportunity, OpportunityAlias, OpportunityDomain, OpportunityTag, Tag, ScrapingLog, PageSnapshot, SourceHealth,
+    OpportunityChange, ChangeFeedCheckpoint, SavedSearch, SavedSearchMatch,
+)
+
+
+class OpportunityAliasInline(admin.TabularInline):
+    model = OpportunityAlias
+    extra = 0
+    readonly_fields = ('created_at',)
+
+
+class OpportunityTagInline(admin.TabularInline):
+    model = OpportunityTag
+    extra = 1
+    autocomplete_fields = ('tag',)
+
+
+class OpportunityDomainInline(admin.TabularInline):
+    """The domains an opportunity is listed under; derived from its domain and scores, so read-only."""
+    model = OpportunityDomain
+    extra = 0
+    can_delete = False
+    readonly_fields = ('domain', 'confidence')
+
+    def has_add_permission(self, request, obj=None):
+        return False
 
 
 @admin.register(Opportunity)
 class OpportunityAdmin(admin.ModelAdmin):
     list_display = ('title', 'university', 'domain', 'opportunity_type', 'is_active', 'deadline', 'scraped_at')
-    list_filter = ('university', 'domain', 'opportunity_type', 'is_active')
-    search_fields = ('title', 'description', 'tags')
+    list_filter = ('university', 'domain', 'domain_source', 'opportunity_type', 'is_active', 'deactivated_reason')
+    search_fields = ('title', 'description', 'tags__name')
     list_editable = ('is_active',)
     date_hierarchy = 'scraped_at'
-    readonly_fields = ('scraped_at', 'updated_at')
+    readonly_fields = ('scraped_at', 'updated_at', 'last_seen_at', 'canonical_url', 'simhash',
+                       'domain_confidence', 'domain_scores', 'model_version', 'domain_source', 'domain_verified_at')
+    exclude = ('simhash_b0', 'simhash_b1', 'simhash_b2', 'simhash_b3')
+    inlines = [OpportunityTagInline, OpportunityDomainInline, OpportunityAliasInline]
+    actions = ['verify_domain']
+
+    def save_model(self, request, obj, form, change):
+        """
+        Publish admin edits to the change feed alongside the save. A domain
+        set by staff becomes a training label (see training.py).
+        """
+        from .changefeed import publish
+        if 'domain' in form.changed_data:
+            obj.domain_source = 'ADMIN'
+            obj.domain_verified_at = timezone.now()
+        with transaction.atomic():
+            super().save_model(request, obj, form, change)
+            if not change:
+                publish([obj.pk], 'CREATED')
+            elif form.changed_data:
+                kind = 'DEACTIVATED' if 'is_active' in form.changed_data and not obj.is_active else 'UPDATED'
+                publish([obj.pk], kind, form.changed_data)
+
+    def save_related(self, request, form, formsets, change):
+        """Tag edits come through the inline, so they are published here (save_model already bumped updated_at)."""
+        from .changefeed import publish
+        super().save_related(request, form, formsets, change)
+        if change and any(f.model is OpportunityTag and f.has_changed() for f in formsets):
+            publish([form.instance.pk], 'UPDATED', ['tags'])
+
+    @admin.action(description='Verify domain (use as a classifier training label)')
+    def verify_domain(self, request, queryset):
+        from .changefeed import publish
+        from .labels import sync_labels
+        now = timezone.now()
+        with transaction.atomic():
+            ids = list(queryset.exclude(domain_source='ADMIN').values_list('pk', flat=True))
+            Opportunity.objects.filter(pk__in=ids).update(domain_source='ADMIN', domain_verified_at=now, updated_at=now)
+            sync_labels(ids)
+            publish(ids, 'UPDATED', ['domain_source'])
+        self.message_user(request, f"Verified the domain of {len(ids)} opportunities.")
+
+
+@admin.register(Tag)
+class TagAdmin(admin.ModelAdmin):
+    list_display = ('name', 'slug', 'opportunity_count')
+    search_fields = ('name', 'slug')
+    readonly_fields = ('slug',)
+
+    def get_queryset(self, request):
+        # Meta.ordering is dropped from GROUP BY queries, and autocomplete pages through this
+        return super().get_queryset(request).annotate(opportunity_count=Count('opportunity_links')).order_by('name')
+
+    @admin.display(ordering='opportunity_count')
+    def opportunity_count(self, obj):
+        return obj.opportunity_count
+
+    def save_model(self, request, obj, form, change):
+        from .tags import tag_slug
+        obj.slug = obj.slug or tag_slug(obj.name)
+        super().save_model(request, obj, form, change)
+
+    def delete_model(self, request, obj):
+        self.delete_queryset(request, Tag.objects.filter(pk=obj.pk))
+
+    def delete_queryset(self, request, queryset):
+        """Deleting a tag unlinks it everywhere, so the opportunities carrying it change."""
+        from .tags import touch
+        with transaction.atomic():
+            tagged = OpportunityTag.objects.filter(tag__in=queryset.values('pk')).values_list('opportunity_id', flat=True)
+            touch(tagged)
+            super().delete_queryset(request, queryset)
 
 
 @admin.register(ScrapingLog)
 class ScrapingLogAdmin(admin.ModelAdmin):
-    list_display = ('university', 'status', 'opportunities_found', 'new_opportunities', 'started_at')
+    list_display = ('university', 'status', 'opportunities_found', 'new_opportunities',
+                    'duplicates_skipped', 'classifier_calls', 'bytes_downloaded', 'duration_seconds', 'started_at')
     list_filter = ('university', 'status')
-    readonly_fields = ('started_at', 'finished_at')
+    readonly_fields = ('started_at', 'finished_at', 'stage_seconds', 'fetches', 'bytes_downloaded',
+                       'duplicates_skipped', 'classifier_calls', 'listing_fingerprint')
+
+
+@admin.register(PageSnapshot)
+class PageSnapshotAdmin(admin.ModelAdmin):
+    list_display = ('url', 'university', 'status_code', 'size', 'content_hash', 'fetched_at')
+    list_filter = ('university',)
+    search_fields = ('url', 'content_hash')
+    readonly_fields = ('fetched_at',)
+
+
+@admin.register(SourceHealth)
+class SourceHealthAdmin(admin.ModelAdmin):
+    list_display = ('university', 'state', 'consecutive_failures', 'skipped_runs',
+                    'last_success_at', 'last_failure_at', 'opened_at')
+    list_filter = ('state',)
+    readonly_fields = ('consecutive_failures', 'times_opened', 'opened_at', 'last_success_at',
+                       'last_failure_at', 'last_error', 'skipped_runs')
+    actions = ['close_circuit']
+
+    @admin.action(description='Close circuit (resume scraping)')
+    def close_circuit(self, request, queryset):
+        """Admin action: Reset the breaker so the next scheduled scrape runs."""
+        updated = queryset.update(state='CLOSED', consecutive_failures=0, times_opened=0, opened_at=None)
+        self.message_user(request, f"Closed the circuit for {updated} sources.")
+
+
+@admin.register(OpportunityChange)
+class OpportunityChangeAdmin(admin.ModelAdmin):
+    list_display = ('id', 'kind', 'opportunity', 'changed_fields', 'created_at')
+    list_filter = ('kind',)
+    raw_id_fields = ('opportunity',)
+    readonly_fields = ('opportunity', 'kind', 'changed_fields', 'created_at')
+
+
+@admin.register(ChangeFeedCheckpoint)
+class ChangeFeedCheckpointAdmin(admin.ModelAdmin):
+    list_display = ('consumer', 'position', 'updated_at')
+
+
+@admin.register(SavedSearch)
+class SavedSearchAdmin(admin.ModelAdmin):
+    list_display = ('user', 'name', 'q', 'domain', 'opportunity_type', 'university', 'anchor_key', 'created_at')
+    list_filter = ('domain', 'opportunity_type', 'university')
+    search_fields = ('user__username', 'name', 'q')
+    readonly_fields = ('anchor_key', 'created_at')
+
+
+@admin.register(SavedSearchMatch)
+class SavedSearchMatchAdmin(admin.ModelAdmin):
+    list_display = ('user', 'saved_search', 'opportunity', 'seen', 'created_at')
+    list_filter = ('seen',)
+    raw_id_fields = ('saved_search', 'user', 'opportunity')
@@ -8,9 +8,8 @@ class OpportunitiesConfig(AppConfig):
 
     def ready(self):
         """Train classifier on startup if model doesn't exist."""
-        from pathlib import Path
-        model_path = Path(__file__).resolve().parent / 'domain_classifier.pkl'
-        if not model_path.exists():
+        from apps.opportunities.classifier import model_paths
+        if not all(path.exists() for path in model_paths()):
             try:
                 from apps.opportunities.classifier import train_model
                 train_model()
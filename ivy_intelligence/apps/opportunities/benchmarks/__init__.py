@@ -0,0 +1,7 @@
+"""
+Offline benchmark harness for the scraper and classifier.
+
+fixtures/ holds recorded copies of each source page (one per SCRAPERS key,
+named <university>.html). FixtureServer replays them over a local HTTP
+server so the real fetch path runs without network access.
+"""
@@ -0,0 +1,74 @@
+"""
+Local stand-in HTTP server that replays recorded source pages.
+
+    with FixtureServer() as server:
+        url = server.url_for('HARVARD', page=3)   # http://127.0.0.1:<port>/harvard/3
+        safe_get(url)
+
+Any page number serves the same recorded HTML for that university, so a
+benchmark can fetch as many pages as it needs for a given corpus size.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).resolve().parent / 'fixtures'
+
+
+def fixture_path(university_key: str) -> Path:
+    return FIXTURES_DIR / f"{university_key.lower()}.html"
+
+
+def load_fixtures(university_keys) -> dict:
+    """Read the recorded page for each university, skipping any not recorded."""
+    fixtures = {}
+    for key in university_keys:
+        path = fixture_path(key)
+        if path.exists():
+            fixtures[key.lower()] = path.read_bytes()
+    return fixtures
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    fixtures = {}
+
+    def do_GET(self):
+        university = self.path.strip('/').split('/')[0]
+        body = self.fixtures.get(university)
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # keep benchmark output clean
+
+
+class FixtureServer:
+    """Serve recorded fixtures on 127.0.0.1 from a background thread."""
+
+    def __init__(self, university_keys):
+        handler = type('Handler', (_FixtureHandler,), {'fixtures': load_fixtures(university_keys)})
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def universities(self):
+        return [key.upper() for key in self.httpd.RequestHandlerClass.fixtures]
+
+    def url_for(self, university_key: str, page: int = 0) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/{university_key.lower()}/{page}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,127 @@
+"""
+Change feed for opportunities — a transactional outbox.
+
+Every insert, update and deactivation made by the scraper, the enrichment
+task, the expiry sweeper and the admin appends an OpportunityChange row in
+the same database transaction, so the feed can never disagree with the
+table. Derived data (search and similarity indexes, recommendations,
+digests) reads the feed from its own checkpoint instead of rescanning
+Opportunity ordered by scraped_at.
+
+Producing:
+    with transaction.atomic():
+        opp.save()
+        publish([opp.pk], 'UPDATED', ['title'])
+
+Consuming (at-least-once — the checkpoint only moves after the handler
+returns, so a handler must tolerate seeing a change twice):
+    def handle(changes):
+        ...
+    consume('search-index', handle)
+
+consume() handles each batch in a transaction holding a row lock on the
+consumer's checkpoint (SELECT ... FOR UPDATE), so two workers running the
+same consumer at once — e.g. digest tasks queued by scrapes that finished
+on the same beat tick — take turns instead of handling one window twice.
+
+Ids are allocated when a row is inserted, not when its transaction commits,
+so a reader could see id 11 before a slower transaction commits id 10.
+read() therefore only returns changes at least CHANGE_FEED_SETTLE_SECONDS
+old; every writer here commits in well under that. This is a limit, not
+a guarantee: a change whose transaction commits later than that after its
+insert (a long-running transaction, or one stuck on a lock) can land
+behind a checkpoint that has already moved past it, and is then never
+delivered. Keep transactions that publish() short, or raise the setting.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+SETTLE_SECONDS = 5
+RETENTION_DAYS = 30
+
+
+def publish(opportunity_ids, kind, changed_fields=()):
+    """Append one change per opportunity. Call inside the transaction that made the change."""
+    from apps.opportunities.models import OpportunityChange
+
+    changed_fields = sorted(changed_fields)
+    return OpportunityChange.objects.bulk_create(
+        [OpportunityChange(opportunity_id=pk, kind=kind, changed_fields=changed_fields) for pk in opportunity_ids],
+        batch_size=1000,
+    )
+
+
+def position(consumer) -> int:
+    from apps.opportunities.models import ChangeFeedCheckpoint
+
+    checkpoint = ChangeFeedCheckpoint.objects.filter(consumer=consumer).first()
+    return checkpoint.position if checkpoint else 0
+
+
+def read(consumer, limit=DEFAULT_BATCH_SIZE) -> list:
+    """The next settled changes after the consumer's checkpoint, oldest first."""
+    from apps.opportunities.models import OpportunityChange
+
+    settle = getattr(settings, 'CHANGE_FEED_SETTLE_SECONDS', SETTLE_SECONDS)
+    return list(
+        OpportunityChange.objects
+        .filter(pk__gt=position(consumer), created_at__lte=timezone.now() - timedelta(seconds=settle))
+        .order_by('pk')[:limit]
+    )
+
+
+def acknowledge(consumer, last_id):
+    """Move the consumer's checkpoint forward to last_id (never backwards)."""
+    from apps.opportunities.models import ChangeFeedCheckpoint
+
+    checkpoint, _ = ChangeFeedCheckpoint.objects.get_or_create(consumer=consumer)
+    if last_id > checkpoint.position:
+        checkpoint.position = last_id
+        checkpoint.save(update_fields=['position', 'updated_at'])
+
+
+def consume(consumer, handler, batch_size=DEFAULT_BATCH_SIZE) -> int:
+    """
+    Feed every pending change to handler(changes) in batches, checkpointing
+    after each batch. Concurrent calls for the same consumer are serialized
+    on its checkpoint row. Returns how many changes were handled.
+    """
+    from apps.opportunities.models import ChangeFeedCheckpoint
+
+    ChangeFeedCheckpoint.objects.get_or_create(consumer=consumer)
+    handled = 0
+    while True:
+        with transaction.atomic():
+            # Held until the batch is acknowledged; a second worker waits here and then reads past it
+            ChangeFeedCheckpoint.objects.select_for_update().get(consumer=consumer)
+            changes = read(consumer, batch_size)
+            if not changes:
+                return handled
+            handler(changes)
+            acknowledge(consumer, changes[-1].pk)
+        handled += len(changes)
+        if len(changes) < batch_size:
+            return handled
+
+
+def prune(retention_days=None) -> int:
+    """Drop changes older than the retention window. Consumers further behind than that lose them."""
+    from apps.opportunities.models import ChangeFeedCheckpoint, OpportunityChange
+
+    days = retention_days or getattr(settings, 'CHANGE_FEED_RETENTION_DAYS', RETENTION_DAYS)
+    old = OpportunityChange.objects.filter(created_at__lt=timezone.now() - timedelta(days=days))
+    newest_pruned = old.order_by('-pk').values_list('pk', flat=True).first()
+    if newest_pruned is None:
+        return 0
+    for checkpoint in ChangeFeedCheckpoint.objects.filter(position__lt=newest_pruned):
+        logger.warning(f"Change feed consumer {checkpoint.consumer} is behind the retention window")
+    deleted, _ = old.delete()
+    return deleted
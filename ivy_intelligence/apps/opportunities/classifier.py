@@ -10,17 +10,53 @@ How it works (for viva explanation):
 - TF-IDF (Term Frequency-Inverse Document Frequency) converts text to numerical vectors
 - Logistic Regression then predicts which domain the text belongs to
 - We use a pre-defined seed dataset for initial training
+
+CLASSIFIER_BACKEND selects the model: 'tfidf' (default, above) or
+'hashing' — a stateless HashingVectorizer with an SGD linear model whose
+pruned, sparse coefficients keep the files small however much training
+text is added. `manage.py bench_classifier` compares the two.
 """
 
 import os
+import hashlib
 import joblib
 import logging
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 
+from apps.opportunities.keywords import domains
+
 logger = logging.getLogger(__name__)
 
-MODEL_PATH = Path(__file__).resolve().parent / 'domain_classifier.pkl'
-VECTORIZER_PATH = Path(__file__).resolve().parent / 'tfidf_vectorizer.pkl'
+MODEL_DIR = Path(__file__).resolve().parent
+MODEL_PATH = MODEL_DIR / 'domain_classifier.pkl'
+VECTORIZER_PATH = MODEL_DIR / 'tfidf_vectorizer.pkl'
+
+# CLASSIFIER_BACKEND → (vectorizer file, model file)
+BACKENDS = {
+    'tfidf': (VECTORIZER_PATH.name, MODEL_PATH.name),
+    'hashing': ('hashing_vectorizer.pkl', 'domain_classifier_hashing.pkl'),
+}
+HASHING_FEATURES = 2 ** 18
+PRUNE_RATIO = 0.01  # hashing backend: zero weights under 1% of the largest, then store sparse
+
+
+def current_backend() -> str:
+    from django.conf import settings
+
+    backend = getattr(settings, 'CLASSIFIER_BACKEND', 'tfidf')
+    if backend not in BACKENDS:
+        logger.error(f"Unknown CLASSIFIER_BACKEND {backend!r}; using 'tfidf'")
+        return 'tfidf'
+    return backend
+
+
+def model_paths(backend=None, directory=MODEL_DIR) -> tuple:
+    """(vectorizer path, model path) of a backend, by default the configured one."""
+    vectorizer_name, model_name = BACKENDS[backend or current_backend()]
+    return Path(directory) / vectorizer_name, Path(directory) / model_name
 
 # ─── Training Dataset ───────────────────────────────────────────────
 # Each entry: (text, domain_label)
@@ -81,42 +117,76 @@ TRAINING_DATA = [
 ]
 
 
-def train_model():
+def build_model(texts, labels, backend='tfidf') -> tuple:
+    """Fit and return (vectorizer, classifier) for the given backend."""
+    if backend == 'hashing':
+        from sklearn.feature_extraction.text import HashingVectorizer
+        from sklearn.linear_model import SGDClassifier
+
+        # No vocabulary to store: terms are hashed straight to column numbers
+        vectorizer = HashingVectorizer(
+            n_features=HASHING_FEATURES,
+            ngram_range=(1, 2),
+            stop_words='english',
+            alternate_sign=False,
+            norm='l2',
+        )
+        classifier = SGDClassifier(loss='log_loss', alpha=1e-4, max_iter=1000, tol=1e-4, random_state=42)
+        classifier.fit(vectorizer.transform(texts), labels)
+        prune_coefficients(classifier)
+        return vectorizer, classifier
+
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.linear_model import LogisticRegression
+
+    # Build pipeline: TF-IDF vectorizer → Logistic Regression
+    vectorizer = TfidfVectorizer(
+        ngram_range=(1, 2),       # unigrams and bigrams
+        stop_words='english',
+        max_features=5000,
+        sublinear_tf=True         # apply log normalization
+    )
+
+    classifier = LogisticRegression(
+        max_iter=1000,
+        C=1.0,
+        solver='lbfgs',
+        multi_class='multinomial'
+    )
+
+    # Fit vectorizer and train classifier
+    X = vectorizer.fit_transform(texts)
+    classifier.fit(X, labels)
+    return vectorizer, classifier
+
+
+def prune_coefficients(classifier, ratio=PRUNE_RATIO) -> int:
+    """Zero the weights smaller than ratio × the largest and store coef_ sparse. Returns weights kept."""
+    coef = classifier.coef_
+    coef[abs(coef) < ratio * abs(coef).max()] = 0
+    classifier.sparsify()
+    return classifier.coef_.nnz
+
+
+def train_model(backend=None, extra=()):
     """
-    Train the TF-IDF + Logistic Regression classifier.
+    Train the configured classifier backend (TF-IDF + Logistic Regression by default).
     Saves model and vectorizer to disk using joblib.
     Call this once to create the model files.
+    `extra` adds (text, domain) pairs to TRAINING_DATA, e.g. staff-verified labels.
     """
     try:
-        from sklearn.feature_extraction.text import TfidfVectorizer
-        from sklearn.linear_model import LogisticRegression
-        from sklearn.pipeline import Pipeline
-
-        texts = [item[0] for item in TRAINING_DATA]
-        labels = [item[1] for item in TRAINING_DATA]
-
-        # Build pipeline: TF-IDF vectorizer → Logistic Regression
-        vectorizer = TfidfVectorizer(
-            ngram_range=(1, 2),       # unigrams and bigrams
-            stop_words='english',
-            max_features=5000,
-            sublinear_tf=True         # apply log normalization
-        )
-
-        classifier = LogisticRegression(
-            max_iter=1000,
-            C=1.0,
-            solver='lbfgs',
-            multi_class='multinomial'
-        )
-
-        # Fit vectorizer and train classifier
-        X = vectorizer.fit_transform(texts)
-        classifier.fit(X, labels)
+        backend = backend or current_backend()
+        samples = list(TRAINING_DATA) + list(extra)
+        texts = [item[0] for item in samples]
+        labels = [item[1] for item in samples]
+        vectorizer, classifier = build_model(texts, labels, backend)
 
         # Save both to disk
-        joblib.dump(vectorizer, VECTORIZER_PATH)
-        joblib.dump(classifier, MODEL_PATH)
+        _save_model(vectorizer, classifier, model_paths(backend))
+
+        # This process reloads on next use; others notice the new files (see _ensure_model)
+        _unload_model()
 
         logger.info("Domain classifier trained and saved successfully.")
         return True
@@ -126,26 +196,276 @@ def train_model():
         return False
 
 
+INCREMENTAL_EPOCHS = 5
+
+
+def partial_train(samples, epochs=INCREMENTAL_EPOCHS) -> bool:
+    """
+    Fold (text, domain) pairs into the current hashing-backend model with
+    SGD partial_fit, without refitting on everything seen before: the cost
+    follows len(samples). Only the model file changes (the vectorizer is
+    stateless), and it is swapped in with one os.replace.
+    Returns False when the configured backend cannot learn incrementally.
+    """
+    backend = current_backend()
+    if backend != 'hashing':
+        logger.warning(f"Classifier backend {backend!r} has no partial_fit; retrain it instead")
+        return False
+    if not samples:
+        return True
+
+    paths = model_paths(backend)
+    if not all(path.exists() for path in paths):
+        train_model(backend)
+    vectorizer = joblib.load(paths[0])
+    classifier = joblib.load(paths[1])   # writable copy, not the shared mmap
+    classifier.densify()
+
+    X = vectorizer.transform([text.lower() for text, _ in samples])
+    labels = [domain for _, domain in samples]
+    for _ in range(epochs):
+        classifier.partial_fit(X, labels)
+    prune_coefficients(classifier)
+
+    _save_model(vectorizer, classifier, (None, paths[1]))
+    _unload_model()
+    logger.info(f"Domain classifier updated with {len(samples)} labelled examples")
+    return True
+
+
+def _save_model(vectorizer, classifier, paths):
+    """
+    Write both pickles uncompressed, so their arrays can be memory-mapped,
+    and move them into place with os.replace: processes that have the old
+    files mapped keep reading them intact instead of seeing a truncated file.
+    """
+    staged = []
+    for obj, path in zip((vectorizer, classifier), paths):
+        if path is None:
+            continue
+        tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+        joblib.dump(obj, tmp, compress=0)
+        staged.append((tmp, path))
+    for tmp, path in staged:
+        os.replace(tmp, path)
+
+
 # Module-level cache — load model once, reuse
 _vectorizer = None
 _classifier = None
+_model_files = None     # (inode, mtime, size) of both files as loaded
+_model_version = ''     # content hash of both files; part of every prediction cache key
+_load_stats = {}        # how this process got its model; see preload()
+
+
+def _files_signature(paths):
+    try:
+        return tuple((st.st_ino, st.st_mtime_ns, st.st_size) for st in (p.stat() for p in paths))
+    except OSError:
+        return None
 
 
 def _load_model():
-    """Load model from disk into module-level cache."""
-    global _vectorizer, _classifier
+    """
+    Load model from disk into module-level cache. Arrays are memory-mapped
+    read-only, so every process on the host shares one copy in the page cache.
+    """
+    global _vectorizer, _classifier, _model_files, _model_version
 
-    if not MODEL_PATH.exists() or not VECTORIZER_PATH.exists():
+    paths = model_paths()
+    if not all(path.exists() for path in paths):
         logger.info("Model not found, training now...")
         train_model()
 
     try:
-        _vectorizer = joblib.load(VECTORIZER_PATH)
-        _classifier = joblib.load(MODEL_PATH)
+        _model_files = _files_signature(paths)
+        _vectorizer = joblib.load(paths[0], mmap_mode='r')
+        _classifier = joblib.load(paths[1], mmap_mode='r')
+        if _files_signature(paths) != _model_files:
+            # A retrain replaced the files between the two loads; take the new pair
+            return _load_model()
+        digest = hashlib.sha1()
+        for path in paths:
+            digest.update(path.read_bytes())
+        _model_version = digest.hexdigest()[:12]
+        _predictions.clear()
     except Exception as e:
         logger.error(f"Could not load model: {e}")
 
 
+def _unload_model():
+    global _vectorizer, _classifier, _model_files
+    _vectorizer = _classifier = _model_files = None
+    _predictions.clear()
+
+
+def _ensure_model() -> bool:
+    """Load the model on first use, and again whenever train_model() has written new files."""
+    if _vectorizer is None or _classifier is None or _files_signature(model_paths()) != _model_files:
+        _load_model()
+    return _vectorizer is not None and _classifier is not None
+
+
+def _memory() -> dict:
+    """Resident and shared memory of this process, in MB."""
+    try:
+        with open('/proc/self/statm') as f:
+            resident, shared = (int(v) for v in f.read().split()[1:3])
+        page = os.sysconf('SC_PAGE_SIZE')
+        return {'rss_mb': round(resident * page / 2**20, 1), 'shared_mb': round(shared * page / 2**20, 1)}
+    except (OSError, ValueError):
+        import resource  # not Linux: peak RSS is the best available
+        return {'rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1), 'shared_mb': None}
+
+
+def preload() -> dict:
+    """
+    Load the model now rather than on the first classification. Called in
+    the Celery parent before it forks (config/celery.py) and at web-server
+    import (config/wsgi.py, run by gunicorn --preload), so worker processes
+    inherit a warm model copy-on-write. Logs and returns the load time and
+    memory of this process.
+    """
+    started = time.perf_counter()
+    available = _ensure_model()
+    _load_stats.update(
+        pid=os.getpid(), seconds=round(time.perf_counter() - started, 3),
+        model_version=_model_version if available else '', **_memory(),
+    )
+    logger.info(f"Domain classifier preloaded in {_load_stats['seconds']}s: {_load_stats}")
+    return dict(_load_stats)
+
+
+def load_stats() -> dict:
+    """Model load metrics for this process, with its current memory."""
+    return {
+        'pid': os.getpid(),
+        'loaded': _vectorizer is not None and _classifier is not None,
+        'inherited': bool(_load_stats) and _load_stats.get('pid') != os.getpid(),
+        'model_version': _model_version,
+        'preload': dict(_load_stats),
+        **_memory(),
+    }
+
+
+# ─── Prediction cache ───────────────────────────────────────────────
+# Re-scrapes of unchanged listings, re-classification jobs and confidence
+# displays keep asking about the same texts. Predictions are cached by a
+# hash of the normalized text plus the model version: an in-process LRU,
+# backed by the Django cache named in CLASSIFIER_SHARED_CACHE (if set) so
+# workers share their results. A new model changes the version, so stale
+# entries are never read.
+
+DEFAULT_CACHE_SIZE = 10_000
+
+
+class PredictionCache:
+    """Bounded LRU of text key → (domain, {domain: confidence %}), with hit/miss counters."""
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.shared_hits = self.misses = 0
+
+    def _shared(self):
+        from django.conf import settings
+        from django.core.cache import caches
+
+        alias = getattr(settings, 'CLASSIFIER_SHARED_CACHE', '')
+        return caches[alias] if alias else None
+
+    def get_many(self, keys) -> dict:
+        found = {}
+        with self._lock:
+            for key in keys:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    found[key] = self._entries[key]
+            self.hits += len(found)
+
+        missing = [key for key in keys if key not in found]
+        shared = self._shared() if missing else None
+        remote = shared.get_many(missing) if shared is not None else {}
+        if remote:
+            self._store(remote)
+            found.update(remote)
+        with self._lock:
+            self.shared_hits += len(remote)
+            self.misses += len(missing) - len(remote)
+        return found
+
+    def set_many(self, entries: dict):
+        self._store(entries)
+        shared = self._shared()
+        if shared is not None and entries:
+            shared.set_many(entries)
+
+    def _store(self, entries):
+        from django.conf import settings
+
+        limit = getattr(settings, 'CLASSIFIER_CACHE_SIZE', DEFAULT_CACHE_SIZE)
+        with self._lock:
+            for key, value in entries.items():
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+            while len(self._entries) > limit:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.shared_hits + self.misses
+        return {
+            'model_version': _model_version,
+            'size': len(self._entries),
+            'hits': self.hits,
+            'shared_hits': self.shared_hits,
+            'misses': self.misses,
+            'hit_rate': round((self.hits + self.shared_hits) / lookups, 3) if lookups else None,
+        }
+
+
+_predictions = PredictionCache()
+
+
+def cache_stats() -> dict:
+    """Hit/miss counters of this process's prediction cache."""
+    return _predictions.stats()
+
+
+def clear_cache():
+    """Drop this process's cached predictions (the shared tier expires on its own)."""
+    _predictions.clear()
+
+
+def _cache_key(text: str) -> str:
+    normalized = ' '.join(text.lower().split())
+    return f"clf:{_model_version}:{hashlib.sha1(normalized.encode('utf-8')).hexdigest()}"
+
+
+def _predict(texts: list) -> list:
+    """[(domain, {domain: confidence %}), ...] for texts, running the model only on cache misses."""
+    keys = [_cache_key(text) for text in texts]
+    found = _predictions.get_many(list(dict.fromkeys(keys)))
+
+    pending = {}
+    for key, text in zip(keys, texts):
+        if key not in found:
+            pending.setdefault(key, text)
+    if pending:
+        X = _vectorizer.transform([text.lower() for text in pending.values()])
+        classes = [str(cls) for cls in _classifier.classes_]
+        computed = {}
+        for key, probas in zip(pending, _classifier.predict_proba(X)):
+            best = max(range(len(classes)), key=probas.__getitem__)
+            computed[key] = (classes[best], {cls: round(float(p) * 100, 1) for cls, p in zip(classes, probas)})
+        _predictions.set_many(computed)
+        found.update(computed)
+    return [found[key] for key in keys]
+
+
 def classify_domain(text: str) -> str:
     """
     Given a piece of text (opportunity title + description),
@@ -156,45 +476,55 @@ def classify_domain(text: str) -> str:
         domain = classify_domain("We are looking for AI/ML researchers...")
         # Returns: "AI"
     """
-    global _vectorizer, _classifier
-
-    if _vectorizer is None or _classifier is None:
-        _load_model()
-
-    if _vectorizer is None or _classifier is None:
+    if not _ensure_model():
         # Fallback if model still not available
         return keyword_fallback(text)
 
     try:
-        X = _vectorizer.transform([text.lower()])
-        domain = _classifier.predict(X)[0]
-        return domain
+        return _predict([text])[0][0]
     except Exception as e:
         logger.error(f"Classification error: {e}")
         return keyword_fallback(text)
 
 
+TOP_K_SCORES = 3
+
+
+def predict_domains(texts: list) -> list:
+    """
+    [(domain, {domain: confidence %}), ...] with the full probability table
+    per text. When the model is unavailable the keyword fallback answers
+    with an empty table.
+    """
+    if not texts:
+        return []
+
+    if not _ensure_model():
+        return [(keyword_fallback(text), {}) for text in texts]
+
+    try:
+        return [(domain, dict(scores)) for domain, scores in _predict(texts)]
+    except Exception as e:
+        logger.error(f"Classification error: {e}")
+        return [(keyword_fallback(text), {}) for text in texts]
+
+
+def top_scores(scores: dict, k: int = TOP_K_SCORES) -> dict:
+    """The k most probable domains of a score table, highest first — what Opportunity.domain_scores stores."""
+    return dict(sorted(scores.items(), key=lambda item: -item[1])[:k])
+
+
+def model_version() -> str:
+    """Content hash of the loaded model files, or '' when no model is available."""
+    return _model_version if _ensure_model() else ''
+
+
 def keyword_fallback(text: str) -> str:
     """
     Lightweight keyword-based fallback if ML model fails.
-    Simple but always works.
-    """
-    t = text.lower()
-    if any(kw in t for kw in ['machine learning', 'deep learning', 'ai ', 'neural', 'nlp', 'computer vision']):
-        return 'AI'
-    if any(kw in t for kw in ['law', 'legal', 'policy', 'rights', 'regulation']):
-        return 'LAW'
-    if any(kw in t for kw in ['biology', 'medical', 'health', 'biomedical', 'genetics', 'clinical']):
-        return 'BIO'
-    if any(kw in t for kw in ['electronics', 'circuit', 'vlsi', 'embedded', 'ece', 'signal']):
-        return 'ECE'
-    if any(kw in t for kw in ['software', 'coding', 'programming', 'database', 'cybersecurity']):
-        return 'CS'
-    if any(kw in t for kw in ['business', 'startup', 'finance', 'entrepreneurship', 'mba']):
-        return 'BUSINESS'
-    if any(kw in t for kw in ['environment', 'climate', 'sustainability', 'ecology']):
-        return 'ENV'
-    return 'OTHER'
+    Simple but always works. Keywords and their order: keywords.DOMAIN_KEYWORDS.
+    """
+    return domains.first(text, default='OTHER')
 
 
 def get_confidence_scores(text: str) -> dict:
@@ -202,18 +532,10 @@ def get_confidence_scores(text: str) -> dict:
     Return probability scores for all domains — useful for the UI
     to show confidence percentages.
     """
-    global _vectorizer, _classifier
-
-    if _vectorizer is None or _classifier is None:
-        _load_model()
-
-    if _vectorizer is None or _classifier is None:
+    if not _ensure_model():
         return {}
 
     try:
-        X = _vectorizer.transform([text.lower()])
-        probas = _classifier.predict_proba(X)[0]
-        classes = _classifier.classes_
-        return {cls: round(float(prob) * 100, 1) for cls, prob in zip(classes, probas)}
+        return dict(_predict([text])[0][1])
     except Exception:
         return {}
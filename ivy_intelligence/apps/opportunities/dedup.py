@@ -0,0 +1,174 @@
+"""
+Duplicate detection for scraped opportunities.
+
+Two layers, both applied in save_opportunities() before anything is written:
+
+1. URL canonicalization — lower-cases scheme and host, drops fragments,
+   tracking parameters (utm_*, fbclid, ...) and trailing slashes, and sorts
+   the query string. Two links to the same page end up as the same string.
+
+2. SimHash near-duplicate index — a 64-bit fingerprint of the normalized
+   title and description. Similar texts get fingerprints that differ in only
+   a few bits. Each fingerprint is split into 4 bands of 16 bits stored in
+   indexed columns; by the pigeonhole principle, any two fingerprints within
+   3 bits of each other share at least one band exactly. So a lookup is an
+   indexed equality query on 4 columns followed by a Hamming check on the
+   few candidates — no scan over the table.
+
+A duplicate is not inserted as a new row; its URL is recorded as an
+OpportunityAlias pointing at the canonical Opportunity. Near-duplicates are
+only looked for among active postings of the same university: a new
+edition of a recurring event ("Spring Career Fair") must not be folded
+into last year's expired row, or into another school's event of the same
+name.
+"""
+
+import hashlib
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+SIMHASH_BITS = 64
+BANDS = 4
+BAND_BITS = SIMHASH_BITS // BANDS
+BAND_MASK = (1 << BAND_BITS) - 1
+
+# Fingerprints this close (in differing bits) are treated as the same posting.
+# Must stay below BANDS for the band index to guarantee a candidate match.
+MAX_HAMMING_DISTANCE = 3
+
+# Title tokens outweigh description tokens: listing pages often carry only a
+# stub description, so the same posting scraped from two sites tends to share
+# its title but little else.
+TITLE_WEIGHT = 6
+
+# Only parameters that never select content: generic names like `source`
+# or `ref` often do (a listing's feed, a tab), so they are kept.
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid',
+    '_hsenc', '_hsmi', 'ref_src', 'igshid',
+}
+TRACKING_PREFIXES = ('utm_',)
+
+_word_re = re.compile(r'[a-z0-9]+')
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so trivially different links compare equal.
+
+        canonicalize_url('HTTPS://Events.MIT.edu/event/x/?utm_source=tw#top')
+        # -> 'https://events.mit.edu/event/x'
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and not ((scheme == 'http' and parts.port == 80) or
+                           (scheme == 'https' and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+
+    path = re.sub(r'/{2,}', '/', parts.path).rstrip('/')
+
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query.sort()
+
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+
+def normalize_text(text: str) -> list:
+    """Lower-case word tokens with punctuation stripped."""
+    return _word_re.findall((text or '').lower())
+
+
+def _features(title: str, description: str) -> dict:
+    """
+    Weighted word unigrams and bigrams. The title dominates, and a
+    description that just repeats the title (e.g. "MIT event: <title>")
+    adds almost nothing, so cross-listings of the same posting still match.
+    """
+    title_words = normalize_text(title)
+    desc = (description or '').lower().replace((title or '').lower(), ' ')
+    desc_words = normalize_text(desc)
+
+    features = {}
+    for words, weight in ((title_words, TITLE_WEIGHT), (desc_words, 1)):
+        grams = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+        for gram in grams:
+            features[gram] = features.get(gram, 0) + weight
+    return features
+
+
+def _hash64(token: str) -> int:
+    # blake2b rather than hash(): must be stable across processes and restarts
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def simhash(title: str, description: str = '') -> int:
+    """64-bit SimHash fingerprint (unsigned) of a posting's text."""
+    vector = [0] * SIMHASH_BITS
+    for token, weight in _features(title, description).items():
+        h = _hash64(token)
+        for bit in range(SIMHASH_BITS):
+            vector[bit] += weight if (h >> bit) & 1 else -weight
+
+    fingerprint = 0
+    for bit, total in enumerate(vector):
+        if total > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin((a ^ b) & ((1 << SIMHASH_BITS) - 1)).count('1')
+
+
+def bands(fingerprint: int) -> list:
+    """Split a fingerprint into BANDS integers of BAND_BITS each."""
+    return [(fingerprint >> (i * BAND_BITS)) & BAND_MASK for i in range(BANDS)]
+
+
+def to_signed(fingerprint: int) -> int:
+    """Fit an unsigned 64-bit fingerprint into a signed BigIntegerField."""
+    return fingerprint - (1 << 64) if fingerprint >= (1 << 63) else fingerprint
+
+
+def to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+def fingerprint_fields(title: str, description: str = '') -> dict:
+    """Model field values for Opportunity.simhash and its band columns."""
+    fingerprint = simhash(title, description)
+    fields = {'simhash': to_signed(fingerprint)}
+    for i, band in enumerate(bands(fingerprint)):
+        fields[f'simhash_b{i}'] = band
+    return fields
+
+
+def find_near_duplicate(title: str, description: str = '', university=None, exclude_pk=None):
+    """
+    Return (opportunity_id, distance) for the closest active posting of
+    this university within MAX_HAMMING_DISTANCE bits, or None.
+    """
+    from django.db.models import Q
+    from apps.opportunities.models import Opportunity
+
+    fingerprint = simhash(title, description)
+    match = Q()
+    for i, band in enumerate(bands(fingerprint)):
+        match |= Q(**{f'simhash_b{i}': band})
+
+    candidates = Opportunity.objects.filter(match, is_active=True)
+    if university:
+        candidates = candidates.filter(university=university)
+    if exclude_pk:
+        candidates = candidates.exclude(pk=exclude_pk)
+
+    best = None
+    for pk, stored in candidates.values_list('pk', 'simhash'):
+        distance = hamming_distance(fingerprint, to_unsigned(stored))
+        if distance <= MAX_HAMMING_DISTANCE and (best is None or distance < best[1]):
+            best = (pk, distance)
+    return best
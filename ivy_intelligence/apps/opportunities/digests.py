@@ -0,0 +1,140 @@
+"""
+Email digests of new opportunities, one per student per sweep.
+
+Scanning every student for every new opportunity costs
+students × opportunities. Instead the profiles app keeps a reverse index,
+DigestSubscription, with one row per (student, "<domain>:<type>") — or
+"<domain>:*" for students who want every type. For a batch of new
+opportunities we compute the handful of keys they carry (one pair per
+domain they are listed under, see labels.py), fetch only the
+subscription rows for those keys, and group the opportunities per student.
+The work follows the number of (student, opportunity) pairs actually
+delivered, not the size of the student table.
+
+Messages go out through the configured EMAIL_BACKEND in chunks of
+DIGEST_CHUNK_SIZE over a single connection.
+
+Runs as a change-feed consumer (see changefeed.py); scrape_university
+queues it after every sweep that found something new.
+"""
+
+import logging
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+
+from apps.opportunities.labels import domains_of
+
+logger = logging.getLogger(__name__)
+
+CONSUMER = 'digests'
+KEY_CHUNK = 500
+USER_CHUNK = 1000
+DEFAULT_CHUNK_SIZE = 200
+MAX_ITEMS = 20
+
+
+def opportunity_keys(opp):
+    """Subscription keys for every domain the opportunity is listed under (see labels.py)."""
+    keys = []
+    for domain in sorted(domains_of(opp)):
+        keys += [f"{domain}:{opp.opportunity_type}", f"{domain}:*"]
+    return keys
+
+
+def build_digests(opportunities) -> dict:
+    """{user_id: [opportunity, ...]} for every subscribed student with something new."""
+    from apps.profiles.models import DigestSubscription
+
+    by_key = defaultdict(list)
+    for opp in opportunities:
+        for key in opportunity_keys(opp):
+            by_key[key].append(opp)
+
+    digests = defaultdict(dict)
+    keys = sorted(by_key)
+    for start in range(0, len(keys), KEY_CHUNK):
+        rows = DigestSubscription.objects.filter(key__in=keys[start:start + KEY_CHUNK]).values_list('user_id', 'key')
+        for user_id, key in rows.iterator(chunk_size=5000):
+            for opp in by_key[key]:
+                digests[user_id][opp.pk] = opp
+    return {user_id: list(opps.values()) for user_id, opps in digests.items()}
+
+
+def _site():
+    return getattr(settings, 'SITE_URL', 'http://localhost:8000').rstrip('/')
+
+
+def render_item(opp, site) -> str:
+    return (f"• {opp.title} — {opp.get_university_display()} ({opp.get_opportunity_type_display()})\n"
+            f"  {site}/opportunities/{opp.pk}/")
+
+
+def render_digest(user, opportunities, items=None) -> EmailMessage:
+    """
+    One student's digest. `items` caches each opportunity's rendered lines
+    by pk — the same few postings appear in thousands of digests.
+    """
+    site = _site()
+    items = {} if items is None else items
+    count = len(opportunities)
+    lines = [f"Hi {user.first_name or user.username},", "",
+             f"{count} new opportunit{'y' if count == 1 else 'ies'} matching your interests:", ""]
+    for opp in opportunities[:MAX_ITEMS]:
+        if opp.pk not in items:
+            items[opp.pk] = render_item(opp, site)
+        lines.append(items[opp.pk])
+    if count > MAX_ITEMS:
+        lines += ["", f"…and {count - MAX_ITEMS} more on your dashboard: {site}/dashboard/"]
+    lines += ["", f"Change what you receive: {site}/profiles/edit/"]
+    return EmailMessage(
+        subject=f"Ivy Intelligence: {count} new opportunit{'y' if count == 1 else 'ies'} for you",
+        body='\n'.join(lines),
+        to=[user.email],
+    )
+
+
+def send_digests(digests, chunk_size=None) -> int:
+    """Render and send digests in bulk chunks over one connection. Returns messages sent."""
+    from django.contrib.auth.models import User
+
+    chunk_size = chunk_size or getattr(settings, 'DIGEST_CHUNK_SIZE', DEFAULT_CHUNK_SIZE)
+    user_ids = sorted(digests)
+    items = {}
+    sent = 0
+    connection = get_connection()
+    with connection:
+        outbox = []
+        for start in range(0, len(user_ids), USER_CHUNK):
+            users = User.objects.filter(pk__in=user_ids[start:start + USER_CHUNK], is_active=True).exclude(email='')
+            for user in users.only('id', 'username', 'first_name', 'email'):
+                outbox.append(render_digest(user, digests[user.pk], items))
+                if len(outbox) >= chunk_size:
+                    sent += connection.send_messages(outbox) or 0
+                    outbox = []
+        if outbox:
+            sent += connection.send_messages(outbox) or 0
+    return sent
+
+
+def handle_changes(changes) -> int:
+    """Change-feed handler: one digest per student for the newly created, still active opportunities."""
+    from apps.opportunities.models import Opportunity
+
+    ids = {change.opportunity_id for change in changes if change.kind == 'CREATED'}
+    if not ids:
+        return 0
+    opportunities = Opportunity.objects.filter(pk__in=ids, is_active=True).only(
+        'id', 'title', 'university', 'domain', 'opportunity_type'
+    ).prefetch_related('domain_labels')
+    digests = build_digests(opportunities)
+    sent = send_digests(digests)
+    logger.info(f"Sent {sent} digests for {len(ids)} new opportunities")
+    return sent
+
+
+def run(batch_size=5000) -> int:
+    """Send digests for everything new in the change feed. Returns changes consumed."""
+    from apps.opportunities.changefeed import consume
+    return consume(CONSUMER, handle_changes, batch_size=batch_size)
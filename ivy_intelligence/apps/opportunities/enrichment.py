@@ -0,0 +1,245 @@
+"""
+Detail-page enrichment for newly scraped opportunities.
+
+Listing pages only give us a title and a link, so `description` is often a
+stub like "MIT event: <title>" and `deadline` / `stipend` are empty. This
+module follows each new opportunity's source_url and pulls out:
+- description  (schema.org JSON-LD, meta description, or the main paragraphs)
+- deadline     ("Deadline: March 3, 2026", "apply by 2026-03-03", JSON-LD dates)
+- stipend      ("$4,000/month", "stipend of $6,500")
+- location     (JSON-LD location, or an element classed 'location')
+
+Only rows that have never been enriched are fetched, so the cost of a sweep
+grows with the number of new postings, not with the size of the table.
+Pages already in the snapshot store are reused instead of re-downloaded.
+"""
+
+import json
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from bs4 import BeautifulSoup
+from dateutil import parser as date_parser
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+# Details the listing page also carries, in its shorter form; once a row is
+# enriched, re-extracting the listing must not overwrite them (see scraper.py)
+LISTING_FIELDS = ('description', 'location')
+MIN_DESCRIPTION_LENGTH = 80
+MAX_DESCRIPTION_LENGTH = 2000
+
+_date = (
+    r'((?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}'
+    r'|\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?,?\s+\d{4}'
+    r'|\d{4}-\d{2}-\d{2}'
+    r'|\d{1,2}/\d{1,2}/\d{4})'
+)
+DEADLINE_RE = re.compile(
+    r'(?:deadline|apply by|applications? (?:are )?due|due date|applications? close[sd]?)[^.\n]{0,40}?' + _date,
+    re.IGNORECASE,
+)
+STIPEND_RE = re.compile(
+    r'(\$\s?\d[\d,]*(?:\.\d+)?\s?[kK]?(?:\s?(?:/|per|a)\s?(?:hour|hr|week|wk|month|mo|year|yr|semester|summer))?)'
+)
+STIPEND_CONTEXT_RE = re.compile(r'stipend|salary|compensation|paid|award|funding|per month|/month', re.IGNORECASE)
+
+
+def _json_ld(soup):
+    """Yield every JSON-LD object on the page, flattening @graph lists."""
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string or '')
+        except (TypeError, ValueError):
+            continue
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            if isinstance(item, dict) and '@graph' in item:
+                items.extend(i for i in item['@graph'] if isinstance(i, dict))
+            elif isinstance(item, dict):
+                yield item
+
+
+def _parse_date(text):
+    try:
+        return date_parser.parse(text, fuzzy=True).date()
+    except (ValueError, OverflowError, TypeError):
+        return None
+
+
+def _location_from_ld(value):
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        name = value.get('name', '')
+        address = value.get('address', '')
+        if isinstance(address, dict):
+            address = ', '.join(filter(None, [address.get('addressLocality'), address.get('addressRegion')]))
+        return ', '.join(filter(None, [name, address]))
+    return ''
+
+
+def extract_details(html: str) -> dict:
+    """
+    Pull description, deadline, stipend and location out of a detail page.
+    Keys are only present when something was found.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    details = {}
+
+    # 1. Structured data is the most reliable source when a page has it
+    for item in _json_ld(soup):
+        if item.get('description') and 'description' not in details:
+            details['description'] = BeautifulSoup(item['description'], 'html.parser').get_text(' ', strip=True)
+        if item.get('location') and 'location' not in details:
+            location = _location_from_ld(item['location'])
+            if location:
+                details['location'] = location
+        for key in ('applicationDeadline', 'validThrough', 'startDate'):
+            if item.get(key) and 'deadline' not in details:
+                deadline = _parse_date(item[key])
+                if deadline:
+                    details['deadline'] = deadline
+
+    for script in soup(['script', 'style', 'nav', 'header', 'footer']):
+        script.decompose()
+    text = soup.get_text(' ', strip=True)
+
+    # 2. Description: meta tags, then the body paragraphs of the main content
+    if 'description' not in details:
+        meta = (soup.find('meta', attrs={'property': 'og:description'}) or
+                soup.find('meta', attrs={'name': 'description'}))
+        content = (meta.get('content') or '').strip() if meta else ''
+        main = soup.find('main') or soup.find('article') or soup.body or soup
+        paragraphs = [p.get_text(' ', strip=True) for p in main.find_all('p')]
+        body = ' '.join(p for p in paragraphs if len(p) >= 40)
+        description = body if len(body) > len(content) else content
+        if description:
+            details['description'] = description
+
+    if details.get('description'):
+        details['description'] = details['description'][:MAX_DESCRIPTION_LENGTH]
+
+    # 3. An explicit "Deadline: ..." beats a JSON-LD event date
+    match = DEADLINE_RE.search(text)
+    if match:
+        deadline = _parse_date(match.group(1))
+        if deadline:
+            details['deadline'] = deadline
+
+    # 4. A dollar amount near a pay-related word
+    for match in STIPEND_RE.finditer(text):
+        window = text[max(0, match.start() - 60):match.end() + 20]
+        if STIPEND_CONTEXT_RE.search(window):
+            details['stipend'] = match.group(1).strip()[:100]
+            break
+
+    if 'location' not in details:
+        tag = soup.find(class_=lambda c: c and 'location' in str(c).lower())
+        location = tag.get_text(' ', strip=True) if tag else ''
+        if 3 <= len(location) <= 200:
+            details['location'] = location
+
+    return details
+
+
+def _is_stub(opp) -> bool:
+    """Scraper-generated descriptions that just restate the title."""
+    description = (opp.description or '').strip()
+    return len(description) < MIN_DESCRIPTION_LENGTH or opp.title in description
+
+
+def apply_details(opp, details) -> list:
+    """Copy extracted details onto an Opportunity without clobbering real data. Returns changed field names."""
+    changed = []
+    description = details.get('description', '')
+    if description and _is_stub(opp) and len(description) > len(opp.description or ''):
+        opp.description = description
+        changed.append('description')
+    if details.get('deadline') and not opp.deadline:
+        opp.deadline = details['deadline']
+        changed.append('deadline')
+    if details.get('stipend') and not opp.stipend:
+        opp.stipend = details['stipend']
+        changed.append('stipend')
+    if details.get('location') and details['location'] != opp.location:
+        opp.location = details['location'][:200]
+        changed.append('location')
+    return changed
+
+
+def _fetch(url):
+    """Worker-thread fetch. No DB access here — snapshots are stored by the caller."""
+    from apps.opportunities.scraper import safe_get
+    return safe_get(url, snapshot=False)
+
+
+def enrich_opportunities(opportunity_ids, max_workers=None) -> dict:
+    """
+    Fetch and parse detail pages for the given opportunities with at most
+    max_workers requests in flight. Rows already enriched are skipped.
+    """
+    from apps.opportunities.models import Opportunity, PageSnapshot
+    from apps.opportunities.snapshots import load_snapshot, save_snapshot
+    from apps.opportunities.changefeed import publish
+
+    max_workers = max_workers or getattr(settings, 'SCRAPER_ENRICH_WORKERS', DEFAULT_WORKERS)
+    opportunities = list(Opportunity.objects.filter(pk__in=opportunity_ids, enriched_at__isnull=True))
+    stats = {'checked': len(opportunities), 'fetched': 0, 'cached': 0, 'updated': 0, 'failed': 0}
+    if not opportunities:
+        return stats
+
+    # Reuse stored pages; only go to the network for URLs we have never fetched
+    pages = {}
+    for opp in opportunities:
+        snapshot = PageSnapshot.objects.filter(url=opp.source_url).order_by('-fetched_at').first()
+        if snapshot:
+            try:
+                pages[opp.pk] = load_snapshot(snapshot)
+                stats['cached'] += 1
+            except OSError:
+                pass
+
+    to_fetch = [opp for opp in opportunities if opp.pk not in pages]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for opp, resp in zip(to_fetch, pool.map(_fetch, [opp.source_url for opp in to_fetch])):
+            if resp is None:
+                stats['failed'] += 1
+                continue
+            save_snapshot(opp.source_url, resp.content, university=opp.university,
+                          status_code=resp.status_code, encoding=resp.encoding or '')
+            pages[opp.pk] = resp.text
+            stats['fetched'] += 1
+
+    now = timezone.now()
+    fields = {'enriched_at'}
+    changes = {}
+    for opp in opportunities:
+        html = pages.get(opp.pk)
+        if html is None:
+            continue
+        try:
+            changed = apply_details(opp, extract_details(html))
+        except Exception as e:
+            logger.warning(f"Could not enrich {opp.source_url}: {e}")
+            changed = []
+        if changed:
+            opp.updated_at = now
+            fields.update(changed + ['updated_at'])
+            changes.setdefault(tuple(sorted(changed)), []).append(opp.pk)
+            stats['updated'] += 1
+        opp.enriched_at = now
+
+    with transaction.atomic():
+        Opportunity.objects.bulk_update([o for o in opportunities if o.enriched_at], sorted(fields), batch_size=200)
+        for changed, ids in changes.items():
+            publish(ids, 'UPDATED', changed)
+    logger.info(f"Enrichment: {stats}")
+    return stats
@@ -0,0 +1,123 @@
+"""
+Keep the active opportunity set limited to live postings.
+
+Opportunities are created with is_active=True and, before this module,
+were never deactivated — so every listing query and index carried every
+expired posting ever scraped. The sweeper (run daily by Celery Beat) clears
+is_active for:
+
+- EXPIRED: the deadline has passed
+- STALE:   the posting has not appeared on its source page in the last
+           OPPORTUNITY_STALE_AFTER_SWEEPS successful sweeps of that university
+
+Updates run in fixed-size batches of primary keys so no single statement
+locks a large part of the table. A STALE posting that shows up again on a
+later sweep is re-activated by mark_seen().
+"""
+
+import logging
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STALE_AFTER_SWEEPS = 4
+BATCH_SIZE = 1000
+URL_CHUNK = 500
+
+
+def mark_seen(canonical_urls, now=None) -> int:
+    """
+    Stamp last_seen_at on every opportunity (or alias) found in this sweep.
+    Called by save_opportunities() with the canonical URLs a live sweep
+    processed (not by reextract, whose snapshots may be old).
+    """
+    from apps.opportunities.models import Opportunity, OpportunityAlias
+    from apps.opportunities.changefeed import publish
+
+    now = now or timezone.now()
+    urls = list(canonical_urls)
+    touched = 0
+    for start in range(0, len(urls), URL_CHUNK):
+        chunk = urls[start:start + URL_CHUNK]
+        alias_ids = OpportunityAlias.objects.filter(url__in=chunk).values('opportunity_id')
+        seen = Opportunity.objects.filter(Q(canonical_url__in=chunk) | Q(pk__in=alias_ids))
+        touched += seen.update(last_seen_at=now)
+
+        # Listed again after going stale: bring it back unless the deadline passed meanwhile
+        revived = list(seen.filter(is_active=False, deactivated_reason='STALE').filter(
+            Q(deadline__isnull=True) | Q(deadline__gte=timezone.localdate())
+        ).values_list('pk', flat=True))
+        if revived:
+            with transaction.atomic():
+                Opportunity.objects.filter(pk__in=revived).update(is_active=True, deactivated_reason='', updated_at=now)
+                publish(revived, 'UPDATED', ['is_active', 'deactivated_reason'])
+    return touched
+
+
+def _deactivate_in_batches(queryset, reason, batch_size=BATCH_SIZE) -> int:
+    from apps.opportunities.models import Opportunity
+    from apps.opportunities.changefeed import publish
+
+    total = 0
+    while True:
+        ids = list(queryset.order_by().values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return total
+        with transaction.atomic():
+            total += Opportunity.objects.filter(pk__in=ids).update(
+                is_active=False, deactivated_reason=reason, updated_at=timezone.now()
+            )
+            publish(ids, 'DEACTIVATED', ['is_active', 'deactivated_reason'])
+
+
+def deactivate_expired(today=None, batch_size=BATCH_SIZE) -> int:
+    """Deactivate active opportunities whose deadline is in the past."""
+    from apps.opportunities.models import Opportunity
+
+    today = today or timezone.localdate()
+    expired = Opportunity.objects.filter(is_active=True, deadline__lt=today)
+    return _deactivate_in_batches(expired, 'EXPIRED', batch_size)
+
+
+def stale_cutoff(university, sweeps):
+    """
+    Start time of the Nth most recent successful sweep that found anything,
+    or None if there haven't been that many yet. Empty sweeps are ignored so
+    a broken parser can't wipe out a whole university.
+    """
+    from apps.opportunities.models import ScrapingLog
+
+    starts = ScrapingLog.objects.filter(
+        university=university, status='SUCCESS', opportunities_found__gt=0,
+    ).order_by('-started_at').values_list('started_at', flat=True)[sweeps - 1:sweeps]
+    return starts[0] if starts else None
+
+
+def deactivate_stale(sweeps=None, batch_size=BATCH_SIZE) -> dict:
+    """Deactivate opportunities not re-seen in the last `sweeps` sweeps, per university."""
+    from apps.opportunities.models import Opportunity
+    from apps.opportunities.scraper import SCRAPERS
+
+    sweeps = sweeps or getattr(settings, 'OPPORTUNITY_STALE_AFTER_SWEEPS', DEFAULT_STALE_AFTER_SWEEPS)
+    counts = {}
+    for university in SCRAPERS:
+        cutoff = stale_cutoff(university, sweeps)
+        if cutoff is None:
+            continue
+        stale = Opportunity.objects.filter(university=university, is_active=True, last_seen_at__lt=cutoff)
+        counts[university] = _deactivate_in_batches(stale, 'STALE', batch_size)
+    return counts
+
+
+def sweep() -> dict:
+    """Run both passes. Returns counts for logging."""
+    result = {
+        'expired': deactivate_expired(),
+        'stale': deactivate_stale(),
+    }
+    logger.info(f"Expiry sweep: {result}")
+    return result
@@ -0,0 +1,126 @@
+"""
+Per-source circuit breaker for the scrapers.
+
+When a university site is down, every scrape of it used to pay the full
+request timeout on every URL, then retry. The breaker tracks each source in
+SourceHealth:
+
+    CLOSED     normal; each failed run bumps consecutive_failures, and
+               SOURCE_BREAKER_FAILURES in a row opens the circuit
+    OPEN       scrapes are skipped outright until the cooldown has passed
+               (SOURCE_BREAKER_COOLDOWN_HOURS, doubled on each re-open,
+               capped at a week)
+    HALF_OPEN  one cheap HEAD request probes the first source URL; if it
+               answers, the scrape runs and a success closes the circuit;
+               if not, the circuit re-opens
+
+Usage (see tasks.scrape_university):
+    if not allow_scrape('MIT'):
+        return
+    ... run_scraper('MIT')   # records success / failure itself
+"""
+
+import logging
+from datetime import timedelta
+
+import requests
+from django.conf import settings
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+FAILURE_THRESHOLD = 3
+COOLDOWN_HOURS = 6
+MAX_COOLDOWN = timedelta(days=7)
+PROBE_TIMEOUT = 5  # seconds
+
+
+def _get(university):
+    from apps.opportunities.models import SourceHealth
+    health, _ = SourceHealth.objects.get_or_create(university=university)
+    return health
+
+
+def cooldown(health) -> timedelta:
+    hours = getattr(settings, 'SOURCE_BREAKER_COOLDOWN_HOURS', COOLDOWN_HOURS)
+    return min(timedelta(hours=hours) * 2 ** max(health.times_opened - 1, 0), MAX_COOLDOWN)
+
+
+def probe(university) -> bool:
+    """A single cheap request to see whether the source is answering at all."""
+    from apps.opportunities.scraper import SOURCES, HEADERS
+
+    urls, _ = SOURCES[university]
+    try:
+        resp = requests.head(urls[0], headers=HEADERS, timeout=PROBE_TIMEOUT, allow_redirects=True)
+        # Some servers refuse HEAD (405) — that still proves the host is up
+        return resp.status_code < 500
+    except Exception as e:
+        logger.info(f"Probe of {university} failed: {e}")
+        return False
+
+
+def allow_scrape(university) -> bool:
+    """Should a scrape of this source run now? Moves OPEN → HALF_OPEN when the cooldown is over."""
+    health = _get(university)
+    if health.state == 'CLOSED':
+        return True
+
+    if health.state == 'OPEN' and timezone.now() < health.opened_at + cooldown(health):
+        health.skipped_runs += 1
+        health.save(update_fields=['skipped_runs'])
+        return False
+
+    health.state = 'HALF_OPEN'
+    health.save(update_fields=['state'])
+    if probe(university):
+        return True
+
+    record_failure(university, 'Half-open probe failed')
+    return False
+
+
+def record_success(university):
+    health = _get(university)
+    health.state = 'CLOSED'
+    health.consecutive_failures = 0
+    health.times_opened = 0
+    health.opened_at = None
+    health.last_success_at = timezone.now()
+    health.save()
+
+
+def record_failure(university, error=''):
+    health = _get(university)
+    now = timezone.now()
+    health.consecutive_failures += 1
+    health.last_failure_at = now
+    health.last_error = str(error)[:2000]
+
+    threshold = getattr(settings, 'SOURCE_BREAKER_FAILURES', FAILURE_THRESHOLD)
+    if health.state == 'HALF_OPEN' or health.consecutive_failures >= threshold:
+        if health.state != 'OPEN':
+            health.times_opened += 1
+            logger.warning(f"Circuit opened for {university} after {health.consecutive_failures} failures")
+        health.state = 'OPEN'
+        health.opened_at = now
+    health.save()
+
+
+def health_summary() -> dict:
+    """{university: {...}} for the monitoring endpoint."""
+    from apps.opportunities.models import SourceHealth
+
+    summary = {}
+    for health in SourceHealth.objects.order_by('university'):
+        reopens_at = health.opened_at + cooldown(health) if health.state == 'OPEN' else None
+        summary[health.university] = {
+            'state': health.state,
+            'consecutive_failures': health.consecutive_failures,
+            'skipped_runs': health.skipped_runs,
+            'last_success_at': health.last_success_at,
+            'last_failure_at': health.last_failure_at,
+            'last_error': health.last_error,
+            'retry_after': reopens_at,
+        }
+    return summary
@@ -0,0 +1,123 @@
+"""
+Keyword tables for the rule-based classifiers, each compiled once into a
+single regular expression.
+
+A table is a list of (label, keywords) in priority order: a text gets the
+first label any of whose keywords occurs in it, anywhere, as a plain
+substring. Instead of one `kw in text` scan per keyword, the matcher runs
+one alternation over the text, with the keywords merged into a prefix
+tree (`hack(?:athon)?|intern(?:ship)?|...`) so the regex engine tests
+each position against a few branches rather than every keyword.
+
+The answer is exactly the one the ordered `any(...)` checks gave: after a
+hit the scan resumes one character later, so overlapping keywords are
+still seen, and a hit counts for every keyword that is a prefix of it
+(the tree takes the longest one at each position).
+"""
+
+import re
+
+# classify_type: the event type from a listing title
+OPPORTUNITY_TYPE_KEYWORDS = [
+    ('INTERNSHIP', ['internship', 'intern']),
+    ('HACKATHON', ['hackathon', 'hack']),
+    ('WORKSHOP', ['workshop', 'bootcamp', 'training']),
+    ('CONFERENCE', ['conference', 'symposium', 'summit']),
+    ('SCHOLARSHIP', ['scholarship', 'grant', 'funding']),
+    ('FELLOWSHIP', ['fellowship']),
+    ('COMPETITION', ['competition', 'contest', 'challenge']),
+]
+
+# keyword_fallback: the domain when the ML model is unavailable
+DOMAIN_KEYWORDS = [
+    ('AI', ['machine learning', 'deep learning', 'ai ', 'neural', 'nlp', 'computer vision']),
+    ('LAW', ['law', 'legal', 'policy', 'rights', 'regulation']),
+    ('BIO', ['biology', 'medical', 'health', 'biomedical', 'genetics', 'clinical']),
+    ('ECE', ['electronics', 'circuit', 'vlsi', 'embedded', 'ece', 'signal']),
+    ('CS', ['software', 'coding', 'programming', 'database', 'cybersecurity']),
+    ('BUSINESS', ['business', 'startup', 'finance', 'entrepreneurship', 'mba']),
+    ('ENV', ['environment', 'climate', 'sustainability', 'ecology']),
+]
+
+# parse_yale: which links on a general resources page are opportunities
+LISTING_KEYWORDS = [
+    ('LISTING', ['internship', 'research', 'fellowship', 'scholarship', 'workshop', 'conference', 'hackathon']),
+]
+
+
+def _tree_pattern(words) -> str:
+    """Alternation of words with shared prefixes factored out; greedy, so the longest word wins at a position."""
+    root = {}
+    for word in words:
+        node = root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def branch(node):
+        children = [re.escape(char) + branch(child) for char, child in sorted(node.items()) if char]
+        if not children:
+            return ''
+        body = children[0] if len(children) == 1 else f"(?:{'|'.join(children)})"
+        return f"(?:{body})?" if '' in node else body
+
+    return branch(root)
+
+
+class KeywordMatcher:
+    """
+    Usage:
+        matcher = KeywordMatcher([('INTERNSHIP', ['internship', 'intern']), ...])
+        matcher.first('Summer Research Internship', default='OTHER')  # 'INTERNSHIP'
+        matcher.labels('Hackathon and workshop')                        # ['HACKATHON', 'WORKSHOP']
+    """
+
+    def __init__(self, table):
+        self.table = [(label, list(keywords)) for label, keywords in table]
+        rank = {}
+        for position, (_, keywords) in enumerate(self.table):
+            for keyword in keywords:
+                rank.setdefault(keyword.lower(), position)
+        # A match on a keyword is also a match on each keyword that is a prefix of it
+        self._ranks_of = {
+            keyword: tuple(sorted({r for other, r in rank.items() if keyword.startswith(other)}))
+            for keyword in rank
+        }
+        self.pattern = re.compile(_tree_pattern(rank))
+
+    def _hits(self, text):
+        """Table positions for each keyword hit in text, best first, in text order."""
+        search = self.pattern.search
+        match = search(text)
+        while match:
+            yield self._ranks_of[match.group()]
+            match = search(text, match.start() + 1)
+
+    def first(self, text: str, default=None):
+        """The highest-priority label with a keyword in text."""
+        text = text.lower()
+        search, ranks_of = self.pattern.search, self._ranks_of
+        best = None
+        match = search(text)
+        while match:
+            rank = ranks_of[match.group()][0]
+            if best is None or rank < best:
+                best = rank
+                if rank == 0:
+                    break
+            match = search(text, match.start() + 1)
+        return default if best is None else self.table[best][0]
+
+    def labels(self, text: str) -> list:
+        """Every label with a keyword in text, in priority order."""
+        found = {rank for ranks in self._hits(text.lower()) for rank in ranks}
+        return [self.table[rank][0] for rank in sorted(found)]
+
+    def search(self, text: str) -> bool:
+        """Whether any keyword occurs in text."""
+        return self.pattern.search(text.lower()) is not None
+
+
+opportunity_types = KeywordMatcher(OPPORTUNITY_TYPE_KEYWORDS)
+domains = KeywordMatcher(DOMAIN_KEYWORDS)
+listings = KeywordMatcher(LISTING_KEYWORDS)
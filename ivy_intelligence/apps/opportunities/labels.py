@@ -0,0 +1,71 @@
+"""
+Multi-label domains: the OpportunityDomain set behind domain filtering.
+
+`Opportunity.domain` is the classifier's single best guess, which hides an
+"AI for drug discovery" internship from BIO students. Each opportunity
+therefore also has a row in OpportunityDomain for its primary domain and
+for every other domain the classifier gave at least
+CLASSIFIER_LABEL_THRESHOLD percent. Listings and recommendations filter
+on that set with in_domains(), an indexed semi-join on (domain,
+opportunity), instead of equality on the single column.
+
+Labels are derived from the stored domain and domain_scores (the top
+TOP_K_SCORES probabilities), so any threshold above 100 / (k + 1) percent
+sees every qualifying domain. Staff-verified rows carry only the domain
+staff chose. Writers that bypass Opportunity.save() — bulk_create,
+queryset.update(), bulk_update — call replace_labels() or sync_labels().
+"""
+
+from django.conf import settings
+
+DEFAULT_LABEL_THRESHOLD = 30.0  # percent
+LABEL_FIELDS = {'domain', 'domain_scores', 'domain_source'}
+
+
+def label_threshold() -> float:
+    return getattr(settings, 'CLASSIFIER_LABEL_THRESHOLD', DEFAULT_LABEL_THRESHOLD)
+
+
+def labels_for(domain, scores, source='MODEL', threshold=None) -> dict:
+    """{domain: confidence %} — the primary domain plus every other domain scored at or over the threshold."""
+    scores = scores or {}
+    labels = {domain: scores.get(domain)}
+    if source != 'ADMIN':
+        threshold = label_threshold() if threshold is None else threshold
+        labels.update((other, score) for other, score in scores.items() if score >= threshold)
+    return labels
+
+
+def replace_labels(labelled: dict) -> int:
+    """Make {opportunity_id: {domain: confidence}} the label sets of those opportunities. Returns rows written."""
+    from apps.opportunities.models import OpportunityDomain
+
+    if not labelled:
+        return 0
+    OpportunityDomain.objects.filter(opportunity_id__in=list(labelled)).delete()
+    return len(OpportunityDomain.objects.bulk_create([
+        OpportunityDomain(opportunity_id=pk, domain=domain, confidence=confidence)
+        for pk, labels in labelled.items()
+        for domain, confidence in labels.items()
+    ], batch_size=1000))
+
+
+def sync_labels(ids) -> int:
+    """Recompute the label sets of these opportunities from their stored domain and scores."""
+    from apps.opportunities.models import Opportunity
+
+    rows = Opportunity.objects.filter(pk__in=list(ids)).values_list('pk', 'domain', 'domain_scores', 'domain_source')
+    return replace_labels({pk: labels_for(domain, scores, source) for pk, domain, scores, source in rows})
+
+
+def domains_of(opp) -> set:
+    """The domains an opportunity is listed under; uses prefetched domain_labels when present."""
+    return {label.domain for label in opp.domain_labels.all()} | {opp.domain}
+
+
+def in_domains(queryset, domains):
+    """Opportunities in queryset labelled with any of these domains."""
+    from apps.opportunities.models import OpportunityDomain
+
+    members = OpportunityDomain.objects.filter(domain__in=list(domains)).values('opportunity_id')
+    return queryset.filter(pk__in=members)
@@ -0,0 +1,271 @@
+"""
+Domain classifier benchmark and regression gate.
+Run: python manage.py bench_classifier [--backends tfidf,hashing] [--installed] [--output classifier.json]
+     python manage.py bench_classifier --check                # fail on an accuracy regression vs the stored baseline
+     python manage.py bench_classifier --check --speed-reference before.json   # ...or a slowdown vs an earlier run here
+     python manage.py bench_classifier --update-baseline      # accept the current accuracy numbers
+
+Trains each backend on TRAINING_DATA into a temporary directory (the
+installed model files are not touched) — or, with --installed, takes the
+configured backend's model files as they are — then, in a fresh forked
+process per backend, measures model load time and the resident memory it
+adds, single-item and batch latency (p50/p99), batch throughput, and
+accuracy and F1 (macro and per domain) on the frozen labeled corpus in
+benchmarks/classifier_corpus.jsonl. Predictions go straight to the model,
+bypassing the prediction cache.
+
+--check compares accuracy and F1 against benchmarks/classifier_baseline.json
+and exits with an error listing every metric that got worse beyond the
+tolerances. The committed baseline holds only those metrics: they depend
+on the corpus and the code, not on the machine. Latency and throughput
+do, so they are only checked against --speed-reference, a report written
+with --output by an earlier run on the same machine (e.g. on the base
+branch).
+"""
+
+import json
+import multiprocessing
+import os
+import platform
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from .bench_scrapers import git_revision
+
+BENCHMARKS_DIR = Path(__file__).resolve().parents[2] / 'benchmarks'
+CORPUS_PATH = BENCHMARKS_DIR / 'classifier_corpus.jsonl'
+BASELINE_PATH = BENCHMARKS_DIR / 'classifier_baseline.json'
+# Machine-independent metrics: the only ones stored in the committed baseline
+QUALITY_METRICS = ('accuracy', 'macro_f1', 'f1')
+
+
+def load_corpus(path=CORPUS_PATH):
+    """[(text, domain), ...] from a JSON-lines file of {"text": ..., "domain": ...}."""
+    with open(path) as f:
+        rows = [json.loads(line) for line in f if line.strip()]
+    return [(row['text'], row['domain']) for row in rows]
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 4)
+
+
+def measure(paths, corpus, repeat, batch_size):
+    """Load one backend's files and time it on the corpus. Runs in a forked child."""
+    import joblib
+    from sklearn.metrics import accuracy_score, f1_score
+    from apps.opportunities.classifier import _memory
+    from apps.opportunities.monitoring import percentile
+
+    before = _memory()['rss_mb']
+    started = time.perf_counter()
+    vectorizer = joblib.load(paths[0], mmap_mode='r')
+    classifier = joblib.load(paths[1], mmap_mode='r')
+    load_seconds = time.perf_counter() - started
+    loaded = _memory()['rss_mb']
+
+    texts = [text.lower() for text, _ in corpus]
+    classifier.predict_proba(vectorizer.transform(texts[:1]))  # first call pays for lazy imports
+
+    single = []
+    for _ in range(repeat):
+        for text in texts:
+            started = time.perf_counter()
+            classifier.predict_proba(vectorizer.transform([text]))
+            single.append(time.perf_counter() - started)
+
+    batches = []
+    for _ in range(repeat):
+        for start in range(0, len(texts), batch_size):
+            started = time.perf_counter()
+            classifier.predict_proba(vectorizer.transform(texts[start:start + batch_size]))
+            batches.append(time.perf_counter() - started)
+
+    expected = [domain for _, domain in corpus]
+    predicted = [str(p) for p in classifier.predict(vectorizer.transform(texts))]
+    domains = sorted(set(expected))
+    per_domain = f1_score(expected, predicted, labels=domains, average=None, zero_division=0)
+    return {
+        'load_seconds': round(load_seconds, 4),
+        'rss_added_mb': round(loaded - before, 1),
+        'single_ms': {'p50': _ms(percentile(single, 50)), 'p99': _ms(percentile(single, 99))},
+        'batch_ms': {'size': batch_size, 'p50': _ms(percentile(batches, 50)), 'p99': _ms(percentile(batches, 99))},
+        'items_per_second': round(len(texts) * repeat / sum(batches)),
+        'accuracy': round(accuracy_score(expected, predicted), 4),
+        'macro_f1': round(f1_score(expected, predicted, labels=domains, average='macro', zero_division=0), 4),
+        'f1': {domain: round(float(score), 4) for domain, score in zip(domains, per_domain)},
+    }
+
+
+def _key(result):
+    """Baseline entries are per backend and per source: a freshly trained model and the installed one differ."""
+    return result['backend'], result.get('source', 'trained')
+
+
+def _pairs(results, previous):
+    """(name, new result, previous result) for each result the previous report also measured."""
+    previous = {_key(r): r for r in previous.get('results', [])}
+    for result in results:
+        old = previous.get(_key(result))
+        if old is not None:
+            yield '/'.join(_key(result)), result, old
+
+
+def compare_quality(results, baseline, max_f1_drop, max_domain_f1_drop) -> list:
+    """Human-readable accuracy/F1 regressions of results against a baseline report (empty if none)."""
+    regressions = []
+    for name, result, old in _pairs(results, baseline):
+        for metric, label in (('accuracy', 'accuracy'), ('macro_f1', 'macro F1')):
+            if result[metric] < old[metric] - max_f1_drop:
+                regressions.append(f"{name}: {label} {result[metric]} (baseline {old[metric]})")
+        for domain, score in old['f1'].items():
+            if result['f1'].get(domain, 0) < score - max_domain_f1_drop:
+                regressions.append(f"{name}: {domain} F1 {result['f1'].get(domain, 0)} (baseline {score})")
+    return regressions
+
+
+def compare_speed(results, reference, max_slowdown) -> list:
+    """Human-readable latency/throughput regressions against a report from the same machine (empty if none)."""
+    regressions = []
+    for name, result, old in _pairs(results, reference):
+        for metric in ('single_ms', 'batch_ms'):
+            for pct in ('p50', 'p99'):
+                if result[metric][pct] > old[metric][pct] * max_slowdown:
+                    regressions.append(f"{name}: {metric} {pct} {result[metric][pct]} ms (reference {old[metric][pct]} ms)")
+        if result['items_per_second'] * max_slowdown < old['items_per_second']:
+            regressions.append(f"{name}: throughput {result['items_per_second']}/s (reference {old['items_per_second']}/s)")
+    return regressions
+
+
+class Command(BaseCommand):
+    help = 'Benchmark domain classifier speed and accuracy, optionally gated on a stored baseline'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--backends', default='tfidf,hashing', help='Comma-separated CLASSIFIER_BACKEND values')
+        parser.add_argument('--installed', action='store_true',
+                            help='Benchmark the installed model of the configured backend instead of training')
+        parser.add_argument('--corpus', default=str(CORPUS_PATH), help='Labeled JSON-lines corpus')
+        parser.add_argument('--repeat', type=int, default=5, help='Passes over the corpus per latency measurement')
+        parser.add_argument('--batch-size', type=int, default=32)
+        parser.add_argument('--baseline', default=str(BASELINE_PATH))
+        parser.add_argument('--check', action='store_true',
+                            help='Fail if less accurate than the baseline (or slower than --speed-reference)')
+        parser.add_argument('--update-baseline', action='store_true', help='Store these accuracy results as the baseline')
+        parser.add_argument('--speed-reference',
+                            help='Earlier --output report from this machine to check latency and throughput against')
+        parser.add_argument('--max-slowdown', type=float, default=1.5, help='Allowed latency ratio vs the reference')
+        parser.add_argument('--max-f1-drop', type=float, default=0.02, help='Allowed macro-F1 drop vs baseline')
+        parser.add_argument('--max-domain-f1-drop', type=float, default=0.1, help='Allowed per-domain F1 drop')
+        parser.add_argument('--output', help='Write JSON results to this file instead of stdout')
+
+    def handle(self, *args, **options):
+        from apps.opportunities.classifier import BACKENDS, current_backend
+
+        if options['repeat'] < 1 or options['batch_size'] < 1:
+            raise CommandError('--repeat and --batch-size must be positive')
+        backends = [current_backend()] if options['installed'] else \
+            [b.strip() for b in options['backends'].split(',') if b.strip()]
+        unknown = [b for b in backends if b not in BACKENDS]
+        if unknown:
+            raise CommandError(f"Unknown backend(s): {', '.join(unknown)}. Choose from: {', '.join(BACKENDS)}")
+        corpus = load_corpus(options['corpus'])
+        if not corpus:
+            raise CommandError(f"No labeled rows in {options['corpus']}")
+
+        results = []
+        with tempfile.TemporaryDirectory() as directory:
+            for backend in backends:
+                result = self.run_backend(backend, directory, corpus, options)
+                results.append(result)
+                self.stderr.write(
+                    f"  {backend:<8} {result['file_kb']:>8.1f} KB  load {result['load_seconds'] * 1000:6.1f} ms  "
+                    f"+{result['rss_added_mb']:5.1f} MB  single p50 {result['single_ms']['p50']:.3f} ms  "
+                    f"p99 {result['single_ms']['p99']:.3f} ms  {result['items_per_second']:>8,}/s  "
+                    f"macro-F1 {result['macro_f1']:.3f}"
+                )
+
+        report = {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'corpus': {'path': os.path.relpath(options['corpus']), 'items': len(corpus)},
+            'results': results,
+        }
+        payload = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(payload + '\n')
+            self.stdout.write(self.style.SUCCESS(f"  ✓ Wrote {len(results)} results to {options['output']}"))
+        else:
+            self.stdout.write(payload)
+
+        if options['update_baseline']:
+            self.update_baseline(report, options['baseline'])
+            self.stderr.write(self.style.SUCCESS(f"  ✓ Baseline updated: {options['baseline']}"))
+        elif options['check']:
+            self.check_baseline(results, options)
+
+    def run_backend(self, backend, directory, corpus, options):
+        from apps.opportunities.classifier import TRAINING_DATA, build_model, model_paths, _save_model
+
+        if options['installed']:
+            paths, train_seconds = model_paths(backend), None
+            if not all(path.exists() for path in paths):
+                raise CommandError(f"No installed model for backend {backend!r}")
+        else:
+            started = time.perf_counter()
+            vectorizer, classifier = build_model([t for t, _ in TRAINING_DATA], [d for _, d in TRAINING_DATA], backend)
+            train_seconds = round(time.perf_counter() - started, 4)
+            paths = model_paths(backend, directory)
+            _save_model(vectorizer, classifier, paths)
+
+        with multiprocessing.get_context('fork').Pool(1) as pool:
+            measured = pool.apply(measure, (paths, corpus, options['repeat'], options['batch_size']))
+        return {
+            'backend': backend,
+            'source': 'installed' if options['installed'] else 'trained',
+            'train_seconds': train_seconds,
+            'file_kb': round(sum(os.path.getsize(p) for p in paths) / 1024, 1),
+            **measured,
+        }
+
+    def update_baseline(self, report, path):
+        """Replace the measured entries in the baseline, keeping the others. Only QUALITY_METRICS are stored."""
+        measured = [
+            {'backend': r['backend'], 'source': r['source'], **{m: r[m] for m in QUALITY_METRICS}}
+            for r in report['results']
+        ]
+        try:
+            with open(path) as f:
+                kept = [r for r in json.load(f).get('results', [])
+                        if _key(r) not in {_key(result) for result in measured}]
+        except FileNotFoundError:
+            kept = []
+        with open(path, 'w') as f:
+            f.write(json.dumps({**report, 'results': kept + measured}, indent=2) + '\n')
+
+    def _load_report(self, path, missing):
+        try:
+            with open(path) as f:
+                report = json.load(f)
+        except FileNotFoundError:
+            raise CommandError(f"No report at {path} — {missing}")
+        return report
+
+    def check_baseline(self, results, options):
+        baseline = self._load_report(options['baseline'], 'create one with --update-baseline')
+        known = {_key(r) for r in baseline.get('results', [])}
+        for key in sorted({_key(r) for r in results} - known):
+            self.stderr.write(self.style.WARNING(f"  - No baseline for {'/'.join(key)}, not checked"))
+        regressions = compare_quality(results, baseline, options['max_f1_drop'], options['max_domain_f1_drop'])
+        if options['speed_reference']:
+            reference = self._load_report(options['speed_reference'], 'write one with --output')
+            regressions += compare_speed(results, reference, options['max_slowdown'])
+        if regressions:
+            raise CommandError('Classifier regression:\n  ' + '\n  '.join(regressions))
+        checked = options['baseline'] + (f" and {options['speed_reference']}" if options['speed_reference'] else '')
+        self.stderr.write(self.style.SUCCESS(f"  ✓ Within tolerances ({checked})"))
@@ -0,0 +1,106 @@
+"""
+Digest builder benchmark.
+Run: python manage.py bench_digests [--students 100000] [--opportunities 200] [--output digests.json]
+
+Creates --students synthetic users with random domain/type interests and
+their DigestSubscription rows, then times build_digests() and
+send_digests() for one sweep of --opportunities new postings. Email goes
+to Django's in-memory backend. Everything runs inside a transaction that
+is rolled back, so the database is left untouched.
+"""
+
+import json
+import platform
+import random
+import time
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test.utils import override_settings
+
+from .bench_scrapers import git_revision
+
+
+class Command(BaseCommand):
+    help = 'Benchmark building and sending opportunity digests for many students'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=100_000)
+        parser.add_argument('--opportunities', type=int, default=200, help='New opportunities in the sweep')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--output', help='Write JSON results to this file instead of stdout')
+
+    def handle(self, *args, **options):
+        if options['students'] < 1 or options['opportunities'] < 1:
+            raise CommandError('--students and --opportunities must be positive')
+
+        with override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend'):
+            with transaction.atomic():
+                result = self.run_benchmark(options['students'], options['opportunities'], random.Random(options['seed']))
+                transaction.set_rollback(True)
+
+        report = {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'results': [result],
+        }
+        payload = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(payload + '\n')
+            self.stdout.write(self.style.SUCCESS(f"  ✓ Wrote results to {options['output']}"))
+        else:
+            self.stdout.write(payload)
+
+    def run_benchmark(self, students, count, rng):
+        from django.contrib.auth.models import User
+        from django.core import mail
+        from apps.opportunities.digests import build_digests, send_digests
+        from apps.opportunities.models import Opportunity, DOMAIN_CHOICES, OPPORTUNITY_TYPES
+        from apps.profiles.models import DigestSubscription
+
+        domains = [code for code, _ in DOMAIN_CHOICES]
+        types = [code for code, _ in OPPORTUNITY_TYPES]
+
+        started = time.perf_counter()
+        users = User.objects.bulk_create(
+            [User(username=f'bench-digest-{i}', email=f'bench-digest-{i}@example.edu') for i in range(students)],
+            batch_size=5000,
+        )
+        subscriptions = []
+        for user in users:
+            wanted_types = rng.sample(types, rng.randint(1, 2)) if rng.random() < 0.5 else ['*']
+            for domain in rng.sample(domains, rng.randint(1, 3)):
+                subscriptions += [DigestSubscription(user_id=user.pk, key=f'{domain}:{kind}') for kind in wanted_types]
+        DigestSubscription.objects.bulk_create(subscriptions, batch_size=5000)
+        setup = time.perf_counter() - started
+        self.stderr.write(f'  setup: {students} students, {len(subscriptions)} subscriptions in {setup:.1f}s')
+
+        opportunities = [
+            Opportunity(pk=10_000_000 + i, title=f'Bench opportunity {i}', university='MIT',
+                        domain=rng.choice(domains), opportunity_type=rng.choice(types))
+            for i in range(count)
+        ]
+
+        started = time.perf_counter()
+        digests = build_digests(opportunities)
+        build = time.perf_counter() - started
+
+        mail.outbox = []
+        started = time.perf_counter()
+        sent = send_digests(digests)
+        send = time.perf_counter() - started
+
+        pairs = sum(len(opps) for opps in digests.values())
+        self.stderr.write(f'  build {build:.2f}s, send {send:.2f}s: {sent} digests, {pairs} student/opportunity pairs')
+        return {
+            'students': students,
+            'subscriptions': len(subscriptions),
+            'opportunities': count,
+            'digests': sent,
+            'pairs_delivered': pairs,
+            'naive_pairs_scanned': students * count,
+            'seconds': {'build': round(build, 4), 'send': round(send, 4)},
+        }
@@ -0,0 +1,111 @@
+"""
+Micro-benchmark: compiled keyword matchers vs per-keyword substring scans.
+Run: python manage.py bench_keywords [--count 200000] [--output keywords.json]
+
+Builds --count titles from the recorded fixture pages, the labeled
+classifier corpus and every pair of keywords (so hits from two categories
+meet in one title and the priority order is exercised), then times each
+keyword table — event type, fallback domain and the Yale listing filter —
+matched the old way (`any(kw in text for kw in ...)` per category) and
+with its KeywordMatcher. Fails if the two ever disagree. Needs neither
+the network nor the database.
+"""
+
+import json
+import platform
+import time
+from datetime import datetime
+from itertools import product
+
+from django.core.management.base import BaseCommand, CommandError
+
+from .bench_scrapers import git_revision
+
+
+def scan_table(table, text, default='OTHER'):
+    """The ordered substring checks the matchers replaced."""
+    lowered = text.lower()
+    for label, keywords in table:
+        if any(kw in lowered for kw in keywords):
+            return label
+    return default
+
+
+def build_titles(count):
+    from apps.opportunities.keywords import OPPORTUNITY_TYPE_KEYWORDS, DOMAIN_KEYWORDS
+    from apps.opportunities.scraper import SOURCES
+    from apps.opportunities.benchmarks.server import load_fixtures
+    from .bench_classifier import load_corpus
+
+    base = [text for text, _ in load_corpus()]
+    for university, html in load_fixtures(SOURCES).items():
+        _, parser = SOURCES[university.upper()]
+        base.extend(item.title for item in parser(html.decode('utf-8', errors='replace')))
+    for table in (OPPORTUNITY_TYPE_KEYWORDS, DOMAIN_KEYWORDS):
+        keywords = [kw for _, kws in table for kw in kws]
+        base.extend(f"{a.title()} {b} programme" for a, b in product(keywords, repeat=2))
+    return [f"{base[i % len(base)]} {i}" for i in range(count)]
+
+
+class Command(BaseCommand):
+    help = 'Compare compiled keyword matchers with per-keyword substring scans'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=200_000, help='Titles to classify per table')
+        parser.add_argument('--output', help='Write JSON results to this file instead of stdout')
+
+    def handle(self, *args, **options):
+        from apps.opportunities import keywords
+
+        count = options['count']
+        if count < 1:
+            raise CommandError('--count must be positive')
+        titles = build_titles(count)
+
+        tables = {
+            'opportunity_type': (keywords.OPPORTUNITY_TYPE_KEYWORDS, keywords.opportunity_types),
+            'domain_fallback': (keywords.DOMAIN_KEYWORDS, keywords.domains),
+            'listing_filter': (keywords.LISTING_KEYWORDS, keywords.listings),
+        }
+        results = []
+        for name, (table, matcher) in tables.items():
+            started = time.perf_counter()
+            expected = [scan_table(table, title) for title in titles]
+            scan_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            found = [matcher.first(title, default='OTHER') for title in titles]
+            match_seconds = time.perf_counter() - started
+
+            mismatches = sum(a != b for a, b in zip(expected, found))
+            if mismatches:
+                raise CommandError(f'{name}: matcher disagrees with the substring scan on {mismatches} titles')
+            results.append({
+                'table': name,
+                'titles': count,
+                'keywords': sum(len(kws) for _, kws in table),
+                'hits': sum(label != 'OTHER' for label in found),
+                'scan_seconds': round(scan_seconds, 4),
+                'matcher_seconds': round(match_seconds, 4),
+                'scan_titles_per_second': round(count / scan_seconds),
+                'matcher_titles_per_second': round(count / match_seconds),
+                'speedup': round(scan_seconds / match_seconds, 2),
+            })
+            self.stderr.write(
+                f'  {name:<17} scan {count / scan_seconds:12,.0f}/s  '
+                f'matcher {count / match_seconds:12,.0f}/s  ×{scan_seconds / match_seconds:.2f}'
+            )
+
+        report = {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'results': results,
+        }
+        payload = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(payload + '\n')
+            self.stdout.write(self.style.SUCCESS(f"  ✓ Wrote {len(results)} results to {options['output']}"))
+        else:
+            self.stdout.write(payload)
@@ -0,0 +1,132 @@
+"""
+Memory/throughput benchmark: scraped items as dicts vs ScrapedItem records.
+Run: python manage.py bench_records [--count 100000] [--output records.json]
+
+Parses the recorded fixture pages once, then builds --count items in each
+representation (every item gets its own title and URL, as in a real sweep)
+and reports the traced memory per item and how many items per second can
+be built and read the way the save pipeline reads them. Needs neither the
+network nor the database.
+"""
+
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from .bench_scrapers import git_revision
+
+
+def _fresh(value):
+    """A new string object equal to value, like the ones a parser or the classifier hands back."""
+    return ''.join(list(value))
+
+
+def build_dicts(templates, count):
+    items = []
+    for i in range(count):
+        t = templates[i % len(templates)]
+        items.append({
+            'title': f"{t.title} #{i}",
+            'university': _fresh(t.university),
+            'source_url': f"{t.source_url.rstrip('/')}/{i}",
+            'description': t.description,
+            'location': t.location,
+            'opportunity_type': _fresh(t.opportunity_type),
+            'domain': _fresh('OTHER'),
+        })
+    return items
+
+
+def build_records(templates, count):
+    from apps.opportunities.records import ScrapedItem
+
+    items = []
+    for i in range(count):
+        t = templates[i % len(templates)]
+        items.append(ScrapedItem(
+            title=f"{t.title} #{i}",
+            university=_fresh(t.university),
+            source_url=f"{t.source_url.rstrip('/')}/{i}",
+            description=t.description,
+            location=t.location,
+            opportunity_type=_fresh(t.opportunity_type),
+            domain=_fresh('OTHER'),
+        ))
+    return items
+
+
+def read_dicts(items):
+    return sum(len(o['title']) + len(o['source_url']) + len(o['university']) + len(o['domain']) for o in items)
+
+
+def read_records(items):
+    return sum(len(o.title) + len(o.source_url) + len(o.university) + len(o.domain) for o in items)
+
+
+REPRESENTATIONS = {
+    'dict': (build_dicts, read_dicts),
+    'record': (build_records, read_records),
+}
+
+
+class Command(BaseCommand):
+    help = 'Compare per-item memory and throughput of dict vs ScrapedItem scraped items'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=100_000, help='Items to build per representation')
+        parser.add_argument('--output', help='Write JSON results to this file instead of stdout')
+
+    def handle(self, *args, **options):
+        from apps.opportunities.scraper import SOURCES
+        from apps.opportunities.benchmarks.server import load_fixtures
+
+        count = options['count']
+        if count < 1:
+            raise CommandError('--count must be positive')
+
+        templates = []
+        for university, html in load_fixtures(SOURCES).items():
+            _, parser = SOURCES[university.upper()]
+            templates.extend(parser(html.decode('utf-8', errors='replace')))
+        if not templates:
+            raise CommandError('No fixture pages found — run bench_scrapers --record first')
+
+        results = []
+        for name, (build, read) in REPRESENTATIONS.items():
+            tracemalloc.start()
+            items = build(templates, count)
+            size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del items
+
+            started = time.perf_counter()
+            read(build(templates, count))
+            elapsed = time.perf_counter() - started
+
+            results.append({
+                'representation': name,
+                'items': count,
+                'bytes_per_item': round(size / count, 1),
+                'total_mb': round(size / 1024 / 1024, 2),
+                'seconds': round(elapsed, 4),
+                'items_per_second': round(count / elapsed) if elapsed else None,
+            })
+            self.stderr.write(f'  {name:<7} {size / count:8.1f} B/item  {count / elapsed:12,.0f} items/s')
+
+        report = {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'results': results,
+        }
+        payload = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(payload + '\n')
+            self.stdout.write(self.style.SUCCESS(f"  ✓ Wrote {len(results)} results to {options['output']}"))
+        else:
+            self.stdout.write(payload)
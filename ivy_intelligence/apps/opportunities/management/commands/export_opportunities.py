@@ -0,0 +1,58 @@
+"""
+Export the active opportunity catalogue as NDJSON or CSV.
+Run: python manage.py export_opportunities [--format csv] [--fields title,deadline] [--since 2026-01-01] [--gzip] [--output opps.csv.gz]
+
+Streams keyset-paginated pages straight to the output, so memory stays flat
+and no transaction is held open however many rows there are. Writes to
+stdout unless --output is given; --gzip needs --output.
+"""
+
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Stream active opportunities to NDJSON or CSV'
+
+    def add_arguments(self, parser):
+        from apps.opportunities.export import FORMATS, DEFAULT_CHUNK_SIZE
+
+        parser.add_argument('--format', choices=FORMATS, default='ndjson')
+        parser.add_argument('--fields', help='Comma-separated fields (default: the API fields)')
+        parser.add_argument('--since', help='Only rows updated on/after this ISO date or datetime')
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Rows per database query')
+        parser.add_argument('--gzip', action='store_true', help='gzip-compress the output file')
+        parser.add_argument('--output', help='Write to this file instead of stdout')
+
+    def handle(self, *args, **options):
+        from apps.opportunities.export import parse_fields, parse_since, export_chunks, gzip_chunks
+
+        try:
+            fields = parse_fields(options['fields'])
+            since = parse_since(options['since'])
+        except ValueError as e:
+            raise CommandError(str(e))
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be positive')
+        if options['gzip'] and not options['output']:
+            raise CommandError('--gzip needs --output')
+
+        chunks = export_chunks(options['format'], fields, since=since, chunk_size=options['chunk_size'])
+        started = time.perf_counter()
+        written = 0
+        if not options['output']:
+            for chunk in chunks:
+                sys.stdout.write(chunk)
+            return
+
+        with open(options['output'], 'wb') as f:
+            stream = gzip_chunks(chunks) if options['gzip'] else (chunk.encode('utf-8') for chunk in chunks)
+            for data in stream:
+                f.write(data)
+                written += len(data)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"  ✓ Wrote {written / 1024 / 1024:.1f} MB to {options['output']} in {elapsed:.1f}s"
+        ))
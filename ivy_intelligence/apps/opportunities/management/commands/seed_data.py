@@ -191,14 +191,20 @@ class Command(BaseCommand):
             },
         ]
 
+        from apps.opportunities.tags import parse_tags, set_tags
+
         created_count = 0
+        tagged = {}
         for opp_data in sample_opportunities:
+            tags = parse_tags(opp_data.pop('tags', ''))
             obj, created = Opportunity.objects.get_or_create(
                 source_url=opp_data['source_url'],
                 defaults=opp_data
             )
             if created:
                 created_count += 1
+                tagged[obj.pk] = tags
+        set_tags(tagged)
 
         self.stdout.write(self.style.SUCCESS(f'  ✓ Created {created_count} sample opportunities'))
 
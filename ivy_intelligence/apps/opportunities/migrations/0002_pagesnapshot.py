@@ -0,0 +1,30 @@
+# Generated by Django 4.2.16 on 2026-10-19 06:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('opportunities', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PageSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.URLField(max_length=500)),
+                ('university', models.CharField(db_index=True, max_length=50)),
+                ('content_hash', models.CharField(db_index=True, max_length=64)),
+                ('encoding', models.CharField(blank=True, max_length=40)),
+                ('size', models.IntegerField(default=0, help_text='Uncompressed size in bytes')),
+                ('status_code', models.PositiveSmallIntegerField(default=200)),
+                ('fetched_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-fetched_at'],
+                'indexes': [models.Index(fields=['url', '-fetched_at'], name='opportuniti_url_9be280_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.16 on 2026-10-19 06:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('opportunities', '0002_pagesnapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scrapinglog',
+            name='bytes_downloaded',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='scrapinglog',
+            name='classifier_calls',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='scrapinglog',
+            name='duplicates_skipped',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='scrapinglog',
+            name='fetches',
+            field=models.JSONField(blank=True, default=list, help_text='One entry per URL: url, status, latency_ms, bytes'),
+        ),
+        migrations.AddField(
+            model_name='scrapinglog',
+            name='stage_seconds',
+            field=models.JSONField(blank=True, default=dict, help_text='Seconds spent per stage: fetch, parse, dedup, classify, write'),
+        ),
+        migrations.AddIndex(
+            model_name='scrapinglog',
+            index=models.Index(fields=['university', '-started_at'], name='opportuniti_univers_4c83ed_idx'),
+        ),
+    ]
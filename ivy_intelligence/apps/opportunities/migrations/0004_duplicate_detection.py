@@ -0,0 +1,127 @@
+# Generated by Django 4.2.16 on 2026-10-19 06:19
+
+import hashlib
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# Frozen copy of apps.opportunities.dedup as of this migration, so the
+# backfill does not change when the live module does.
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid',
+    '_hsenc', '_hsmi', 'ref', 'ref_src', 'source', 'igshid',
+}
+TITLE_WEIGHT = 6
+_word_re = re.compile(r'[a-z0-9]+')
+
+
+def canonicalize_url(url):
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and not ((scheme == 'http' and parts.port == 80) or
+                           (scheme == 'https' and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+    path = re.sub(r'/{2,}', '/', parts.path).rstrip('/')
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith('utm_')
+    )
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+
+def fingerprint_fields(title, description):
+    """64-bit SimHash of title + description, signed, plus its four 16-bit bands."""
+    title_words = _word_re.findall((title or '').lower())
+    desc = (description or '').lower().replace((title or '').lower(), ' ')
+    features = {}
+    for words, weight in ((title_words, TITLE_WEIGHT), (_word_re.findall(desc), 1)):
+        for gram in words + [f"{a} {b}" for a, b in zip(words, words[1:])]:
+            features[gram] = features.get(gram, 0) + weight
+
+    vector = [0] * 64
+    for token, weight in features.items():
+        h = int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(64):
+            vector[bit] += weight if (h >> bit) & 1 else -weight
+    fingerprint = sum(1 << bit for bit, total in enumerate(vector) if total > 0)
+
+    fields = {'simhash': fingerprint - (1 << 64) if fingerprint >= (1 << 63) else fingerprint}
+    for i in range(4):
+        fields[f'simhash_b{i}'] = (fingerprint >> (i * 16)) & 0xFFFF
+    return fields
+
+
+def backfill_fingerprints(apps, schema_editor):
+    """Fill canonical_url and SimHash columns for rows scraped before dedup existed."""
+    Opportunity = apps.get_model('opportunities', 'Opportunity')
+    batch = []
+    for opp in Opportunity.objects.only('id', 'source_url', 'title', 'description').iterator(chunk_size=500):
+        opp.canonical_url = canonicalize_url(opp.source_url)
+        for name, value in fingerprint_fields(opp.title, opp.description).items():
+            setattr(opp, name, value)
+        batch.append(opp)
+        if len(batch) >= 500:
+            Opportunity.objects.bulk_update(batch, FIELDS)
+            batch = []
+    if batch:
+        Opportunity.objects.bulk_update(batch, FIELDS)
+
+
+FIELDS = ['canonical_url', 'simhash', 'simhash_b0', 'simhash_b1', 'simhash_b2', 'simhash_b3']
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('opportunities', '0003_scrapinglog_instrumentation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='opportunity',
+            name='canonical_url',
+            field=models.CharField(blank=True, db_index=True, help_text='source_url with tracking params, fragments and trailing slash removed', max_length=500),
+        ),
+        migrations.AddField(
+            model_name='opportunity',
+            name='simhash',
+            field=models.BigIntegerField(blank=True, help_text='64-bit SimHash of title + description', null=True),
+        ),
+        migrations.AddField(
+            model_name='opportunity',
+            name='simhash_b0',
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='opportunity',
+            name='simhash_b1',
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='opportunity',
+            name='simhash_b2',
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='opportunity',
+            name='simhash_b3',
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='OpportunityAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.CharField(help_text='Canonicalized URL', max_length=500, unique=True)),
+                ('distance', models.PositiveSmallIntegerField(blank=True, help_text='SimHash bit distance; empty for an exact URL match', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('opportunity', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='opportunities.opportunity')),
+            ],
+            options={
+                'verbose_name_plural': 'Opportunity aliases',
+            },
+        ),
+        migrations.RunPython(backfill_fingerprints, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.16 on 2026-10-19 06:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('opportunities', '0004_duplicate_detection'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='opportunity',
+            name='enriched_at',
+            field=models.DateTimeField(blank=True, help_text='When the detail page was last read (see enrichment.py)', null=True),
+        ),
+    ]
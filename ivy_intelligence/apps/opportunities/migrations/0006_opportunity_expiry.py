@@ -0,0 +1,36 @@
+# Generated by Django 4.2.16 on 2026-10-19 06:23
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('opportunities', '0005_opportunity_enriched_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='opportunity',
+            name='deactivated_reason',
+            field=models.CharField(blank=True, choices=[('EXPIRED', 'Deadline passed'), ('STALE', 'No longer listed')], max_length=10),
+        ),
+        migrations.AddField(
+            model_name='opportunity',
+            name='last_seen_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, help_text='Last sweep that found this opportunity on its source page'),
+        ),
+        migrations.AddIndex(
+            model_name='opportunity',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-scraped_at'], name='opp_active_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='opportunity',
+            index=models.Index(fields=['is_active', 'deadline'], name='opp_active_deadline_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='opportunity',
+            index=models.Index(fields=['university', 'is_active', 'last_seen_at'], name='opp_uni_last_seen_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.16 on 2026-10-19 06:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('opportunities', '0006_opportunity_expiry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scrapinglog',
+            name='listing_fingerprint',
+            field=models.CharField(blank=True, help_text='Hash of the URLs and titles found; changes when the listing does', max_length=64),
+        ),
+    ]
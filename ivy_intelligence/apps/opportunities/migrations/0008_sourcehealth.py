@@ -0,0 +1,31 @@
+# Generated by Django 4.2.16 on 2026-10-19 06:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('opportunities', '0007_scrapinglog_listing_fingerprint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SourceHealth',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('university', models.CharField(max_length=50, unique=True)),
+                ('state', models.CharField(choices=[('CLOSED', 'Healthy'), ('OPEN', 'Open — skipping'), ('HALF_OPEN', 'Half-open — probing')], default='CLOSED', max_length=10)),
+                ('consecutive_failures', models.IntegerField(default=0)),
+                ('times_opened', models.IntegerField(default=0, help_text='Consecutive openings; lengthens the cooldown')),
+                ('opened_at', models.DateTimeField(blank=True, null=True)),
+                ('last_success_at', models.DateTimeField(blank=True, null=True)),
+                ('last_failure_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('skipped_runs', models.IntegerField(default=0, help_text='Scrapes skipped while the circuit was open')),
+            ],
+            options={
+                'verbose_name_plural': 'Source health',
+            },
+        ),
+    ]
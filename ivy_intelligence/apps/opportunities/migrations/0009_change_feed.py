@@ -0,0 +1,36 @@
+# Generated by Django 4.2.16 on 2026-10-19 06:33
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('opportunities', '0008_sourcehealth'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeFeedCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('consumer', models.CharField(max_length=100, unique=True)),
+                ('position', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='OpportunityChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('CREATED', 'Created'), ('UPDATED', 'Updated'), ('DEACTIVATED', 'Deactivated')], max_length=12)),
+                ('changed_fields', models.JSONField(blank=True, default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('opportunity', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='changes', to='opportunities.opportunity')),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+    ]
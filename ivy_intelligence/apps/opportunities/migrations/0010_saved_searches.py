@@ -0,0 +1,49 @@
+# Generated by Django 4.2.16 on 2026-10-19 06:35
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('opportunities', '0009_change_feed'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SavedSearch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(blank=True, max_length=100)),
+                ('q', models.CharField(blank=True, max_length=200)),
+                ('domain', models.CharField(blank=True, choices=[('AI', 'Artificial Intelligence'), ('LAW', 'Law'), ('BIO', 'Biomedical'), ('ECE', 'Electronics & Communication'), ('CS', 'Computer Science'), ('BUSINESS', 'Business & Management'), ('ENV', 'Environmental Science'), ('OTHER', 'Other')], max_length=20)),
+                ('opportunity_type', models.CharField(blank=True, choices=[('INTERNSHIP', 'Research Internship'), ('HACKATHON', 'Hackathon'), ('WORKSHOP', 'Workshop'), ('CONFERENCE', 'Conference'), ('SCHOLARSHIP', 'Scholarship'), ('FELLOWSHIP', 'Fellowship'), ('COMPETITION', 'Competition'), ('OTHER', 'Other')], max_length=20)),
+                ('university', models.CharField(blank=True, choices=[('HARVARD', 'Harvard University'), ('MIT', 'MIT'), ('YALE', 'Yale University'), ('PRINCETON', 'Princeton University'), ('COLUMBIA', 'Columbia University'), ('CORNELL', 'Cornell University'), ('STANFORD', 'Stanford University'), ('PENN', 'University of Pennsylvania'), ('DARTMOUTH', 'Dartmouth College'), ('BROWN', 'Brown University')], max_length=50)),
+                ('anchor_key', models.CharField(db_index=True, editable=False, help_text='Inverted-index key: one term every match must contain', max_length=40)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='saved_searches', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SavedSearchMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('seen', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('opportunity', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_matches', to='opportunities.opportunity')),
+                ('saved_search', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='matches', to='opportunities.savedsearch')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_matches', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['user', 'seen', '-created_at'], name='match_user_unseen_idx')],
+                'unique_together': {('saved_search', 'opportunity')},
+            },
+        ),
+    ]
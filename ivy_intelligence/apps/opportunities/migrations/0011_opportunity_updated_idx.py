@@ -0,0 +1,17 @@
+# Generated by Django 4.2.16 on 2026-10-19 06:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('opportunities', '0010_saved_searches'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='opportunity',
+            index=models.Index(fields=['updated_at'], name='opp_updated_idx'),
+        ),
+    ]
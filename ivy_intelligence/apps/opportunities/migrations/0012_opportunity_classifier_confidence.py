@@ -0,0 +1,28 @@
+# Generated by Django 4.2.16 on 2026-10-19 06:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('opportunities', '0011_opportunity_updated_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='opportunity',
+            name='domain_confidence',
+            field=models.FloatField(blank=True, help_text='Classifier probability (%) of the stored domain', null=True),
+        ),
+        migrations.AddField(
+            model_name='opportunity',
+            name='domain_scores',
+            field=models.JSONField(blank=True, default=dict, help_text='Top classifier probabilities (%), e.g. {"AI": 71.2, "CS": 12.0}'),
+        ),
+        migrations.AddField(
+            model_name='opportunity',
+            name='model_version',
+            field=models.CharField(blank=True, db_index=True, help_text="Classifier model that produced the confidence ('' = never scored)", max_length=20),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.16 on 2026-10-19 06:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('opportunities', '0012_opportunity_classifier_confidence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='opportunity',
+            name='domain_source',
+            field=models.CharField(choices=[('MODEL', 'Classifier'), ('ADMIN', 'Verified by staff')], db_index=True, default='MODEL', help_text='Staff-verified domains are training labels and never re-classified', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='opportunity',
+            name='domain_verified_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.16 on 2026-10-19 07:06
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def labels_for(domain, scores, source):
+    """Frozen copy of apps.opportunities.labels.labels_for as of this migration."""
+    scores = scores or {}
+    labels = {domain: scores.get(domain)}
+    if source != 'ADMIN':
+        threshold = getattr(settings, 'CLASSIFIER_LABEL_THRESHOLD', 30.0)
+        labels.update((other, score) for other, score in scores.items() if score >= threshold)
+    return labels
+
+
+def backfill_domain_labels(apps, schema_editor):
+    """One OpportunityDomain per stored domain, plus the other domains in domain_scores over the threshold."""
+    Opportunity = apps.get_model('opportunities', 'Opportunity')
+    OpportunityDomain = apps.get_model('opportunities', 'OpportunityDomain')
+    rows = Opportunity.objects.values_list('id', 'domain', 'domain_scores', 'domain_source')
+    last_pk = 0
+    while True:
+        page = list(rows.filter(pk__gt=last_pk).order_by('pk')[:1000])
+        if not page:
+            return
+        last_pk = page[-1][0]
+        OpportunityDomain.objects.bulk_create([
+            OpportunityDomain(opportunity_id=pk, domain=label, confidence=confidence)
+            for pk, domain, scores, source in page
+            for label, confidence in labels_for(domain, scores, source).items()
+        ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('opportunities', '0013_opportunity_domain_source'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OpportunityDomain',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('domain', models.CharField(choices=[('AI', 'Artificial Intelligence'), ('LAW', 'Law'), ('BIO', 'Biomedical'), ('ECE', 'Electronics & Communication'), ('CS', 'Computer Science'), ('BUSINESS', 'Business & Management'), ('ENV', 'Environmental Science'), ('OTHER', 'Other')], max_length=20)),
+                ('confidence', models.FloatField(blank=True, help_text='Classifier probability (%)', null=True)),
+                ('opportunity', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='domain_labels', to='opportunities.opportunity')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='opportunitydomain',
+            constraint=models.UniqueConstraint(fields=('domain', 'opportunity'), name='opp_domain_unique'),
+        ),
+        migrations.RunPython(backfill_domain_labels, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,95 @@
+# Generated by Django 4.2.16 on 2026-10-19 07:40
+
+from django.db import migrations, models
+from django.utils.text import slugify
+import django.db.models.deletion
+
+
+# Frozen copies of apps.opportunities.tags helpers as of this migration
+def tag_slug(name):
+    return slugify(name, allow_unicode=True)[:80]
+
+
+def parse_tags(value):
+    names = {}
+    for name in (value or '').split(','):
+        name = ' '.join(name.split())[:60]
+        slug = tag_slug(name)
+        if slug and slug not in names:
+            names[slug] = name
+    return list(names.values())
+
+
+def backfill_tags(apps, schema_editor):
+    """Tag and OpportunityTag rows from the comma-separated tags strings."""
+    Opportunity = apps.get_model('opportunities', 'Opportunity')
+    Tag = apps.get_model('opportunities', 'Tag')
+    OpportunityTag = apps.get_model('opportunities', 'OpportunityTag')
+    rows = Opportunity.objects.exclude(tags='').values_list('id', 'tags')
+    last_pk = 0
+    while True:
+        page = list(rows.filter(pk__gt=last_pk).order_by('pk')[:1000])
+        if not page:
+            return
+        last_pk = page[-1][0]
+        tagged = {pk: parse_tags(value) for pk, value in page}
+        names = {tag_slug(name): name for names in tagged.values() for name in names}
+        Tag.objects.bulk_create([Tag(name=name, slug=slug) for slug, name in names.items()], ignore_conflicts=True)
+        ids = dict(Tag.objects.filter(slug__in=list(names)).values_list('slug', 'id'))
+        OpportunityTag.objects.bulk_create([
+            OpportunityTag(opportunity_id=pk, tag_id=ids[tag_slug(name)])
+            for pk, names in tagged.items() for name in names
+        ], ignore_conflicts=True)
+
+
+def restore_tag_strings(apps, schema_editor):
+    Opportunity = apps.get_model('opportunities', 'Opportunity')
+    OpportunityTag = apps.get_model('opportunities', 'OpportunityTag')
+    tagged = {}
+    for pk, name in OpportunityTag.objects.order_by('pk').values_list('opportunity_id', 'tag__name'):
+        tagged.setdefault(pk, []).append(name)
+    for pk, names in tagged.items():
+        Opportunity.objects.filter(pk=pk).update(tags=', '.join(names)[:500])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('opportunities', '0014_opportunity_domain_labels'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=60)),
+                ('slug', models.SlugField(allow_unicode=True, max_length=80, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='OpportunityTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('opportunity', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tag_links', to='opportunities.opportunity')),
+                ('tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='opportunity_links', to='opportunities.tag')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='opportunitytag',
+            constraint=models.UniqueConstraint(fields=('tag', 'opportunity'), name='opp_tag_unique'),
+        ),
+        migrations.RunPython(backfill_tags, restore_tag_strings),
+        migrations.RemoveField(
+            model_name='opportunity',
+            name='tags',
+        ),
+        migrations.AddField(
+            model_name='opportunity',
+            name='tags',
+            field=models.ManyToManyField(blank=True, related_name='opportunities', through='opportunities.OpportunityTag', to='opportunities.tag'),
+        ),
+    ]
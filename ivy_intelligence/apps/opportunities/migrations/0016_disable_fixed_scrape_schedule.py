@@ -0,0 +1,37 @@
+# Written by hand on 2026-10-19
+
+from django.db import migrations
+from django.utils import timezone
+
+# Removed from config/celery.py in favour of scrape-due-universities. The
+# DatabaseScheduler copies beat_schedule into the database but never deletes
+# rows, so existing deployments would keep scraping every source every 6 hours.
+OLD_TASK = 'scrape-opportunities-every-6-hours'
+
+
+def _set_enabled(apps, enabled):
+    PeriodicTask = apps.get_model('django_celery_beat', 'PeriodicTask')
+    PeriodicTasks = apps.get_model('django_celery_beat', 'PeriodicTasks')
+    if PeriodicTask.objects.filter(name=OLD_TASK).update(enabled=enabled):
+        # What PeriodicTasks.update_changed() does: tells running beat to reload
+        PeriodicTasks.objects.update_or_create(ident=1, defaults={'last_update': timezone.now()})
+
+
+def disable_fixed_schedule(apps, schema_editor):
+    _set_enabled(apps, False)
+
+
+def enable_fixed_schedule(apps, schema_editor):
+    _set_enabled(apps, True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('opportunities', '0015_normalized_tags'),
+        ('django_celery_beat', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(disable_fixed_schedule, enable_fixed_schedule),
+    ]
@@ -1,4 +1,6 @@
+from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 DOMAIN_CHOICES = [
@@ -12,6 +14,11 @@ DOMAIN_CHOICES = [
     ('OTHER', 'Other'),
 ]
 
+DOMAIN_SOURCES = [
+    ('MODEL', 'Classifier'),
+    ('ADMIN', 'Verified by staff'),
+]
+
 OPPORTUNITY_TYPES = [
     ('INTERNSHIP', 'Research Internship'),
     ('HACKATHON', 'Hackathon'),
@@ -37,6 +44,12 @@ IVY_UNIVERSITIES = [
 ]
 
 
+DEACTIVATION_REASONS = [
+    ('EXPIRED', 'Deadline passed'),
+    ('STALE', 'No longer listed'),
+]
+
+
 class Opportunity(models.Model):
     title = models.CharField(max_length=300)
     university = models.CharField(max_length=50, choices=IVY_UNIVERSITIES)
@@ -48,19 +61,136 @@ class Opportunity(models.Model):
     is_active = models.BooleanField(default=True)
     scraped_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    tags = models.CharField(max_length=500, blank=True, help_text="Comma-separated tags")
+    tags = models.ManyToManyField('Tag', through='OpportunityTag', related_name='opportunities', blank=True)
     stipend = models.CharField(max_length=100, blank=True)
     location = models.CharField(max_length=200, blank=True, default='Remote / On-campus')
+    enriched_at = models.DateTimeField(null=True, blank=True,
+                                       help_text="When the detail page was last read (see enrichment.py)")
+
+    # Expiry (see expiry.py) — rows drop out of the active set once their
+    # deadline passes or they stop appearing on the source page
+    last_seen_at = models.DateTimeField(default=timezone.now,
+                                        help_text="Last sweep that found this opportunity on its source page")
+    deactivated_reason = models.CharField(max_length=10, blank=True, choices=DEACTIVATION_REASONS)
+
+    # Duplicate detection (see dedup.py)
+    canonical_url = models.CharField(max_length=500, blank=True, db_index=True,
+                                     help_text="source_url with tracking params, fragments and trailing slash removed")
+    domain_confidence = models.FloatField(null=True, blank=True,
+                                          help_text="Classifier probability (%) of the stored domain")
+    domain_scores = models.JSONField(default=dict, blank=True,
+                                     help_text='Top classifier probabilities (%), e.g. {"AI": 71.2, "CS": 12.0}')
+    model_version = models.CharField(max_length=20, blank=True, db_index=True,
+                                     help_text="Classifier model that produced the confidence ('' = never scored)")
+    domain_source = models.CharField(max_length=10, choices=DOMAIN_SOURCES, default='MODEL', db_index=True,
+                                     help_text="Staff-verified domains are training labels and never re-classified")
+    domain_verified_at = models.DateTimeField(null=True, blank=True)
+    simhash = models.BigIntegerField(null=True, blank=True, help_text="64-bit SimHash of title + description")
+    simhash_b0 = models.IntegerField(null=True, blank=True, db_index=True)
+    simhash_b1 = models.IntegerField(null=True, blank=True, db_index=True)
+    simhash_b2 = models.IntegerField(null=True, blank=True, db_index=True)
+    simhash_b3 = models.IntegerField(null=True, blank=True, db_index=True)
 
     class Meta:
         ordering = ['-scraped_at']
         verbose_name_plural = 'Opportunities'
+        indexes = [
+            # Listings only ever read the active set; keep their index that size
+            models.Index(fields=['-scraped_at'], condition=models.Q(is_active=True),
+                         name='opp_active_recent_idx'),
+            # Expiry sweeps
+            models.Index(fields=['is_active', 'deadline'], name='opp_active_deadline_idx'),
+            models.Index(fields=['university', 'is_active', 'last_seen_at'], name='opp_uni_last_seen_idx'),
+            # ETag for the JSON API: Max(updated_at)
+            models.Index(fields=['updated_at'], name='opp_updated_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} — {self.get_university_display()}"
 
     def get_tags_list(self):
-        return [t.strip() for t in self.tags.split(',') if t.strip()]
+        return [tag.name for tag in self.tags.all()]
+
+    def save(self, *args, **kwargs):
+        # Rows created outside the scraper (admin, seed_data) still join the dedup index
+        if not self.canonical_url or self.simhash is None:
+            from apps.opportunities.dedup import canonicalize_url, fingerprint_fields
+            self.canonical_url = self.canonical_url or canonicalize_url(self.source_url)
+            if self.simhash is None:
+                for name, value in fingerprint_fields(self.title, self.description).items():
+                    setattr(self, name, value)
+        super().save(*args, **kwargs)
+        # Keep the domain set in step with single-row edits (admin, seed_data, re-scrapes)
+        from apps.opportunities.labels import LABEL_FIELDS, sync_labels
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or LABEL_FIELDS & set(update_fields):
+            sync_labels([self.pk])
+
+
+class Tag(models.Model):
+    """A normalized tag; opportunities share one row per distinct slug (see tags.py)."""
+    name = models.CharField(max_length=60)
+    slug = models.SlugField(max_length=80, unique=True, allow_unicode=True)
+    # Max(updated_at) versions tag names for ETags and the tag cloud
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+
+class OpportunityTag(models.Model):
+    opportunity = models.ForeignKey(Opportunity, on_delete=models.CASCADE, related_name='tag_links')
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name='opportunity_links')
+
+    class Meta:
+        constraints = [
+            # Also the index behind tag filters and facet counts: tag → opportunity ids
+            models.UniqueConstraint(fields=['tag', 'opportunity'], name='opp_tag_unique'),
+        ]
+
+    def __str__(self):
+        return f"{self.opportunity_id} # {self.tag_id}"
+
+
+class OpportunityDomain(models.Model):
+    """
+    One domain an opportunity is listed under: its primary domain, plus any
+    other the classifier scored above CLASSIFIER_LABEL_THRESHOLD (see labels.py).
+    """
+    opportunity = models.ForeignKey(Opportunity, on_delete=models.CASCADE, related_name='domain_labels')
+    domain = models.CharField(max_length=20, choices=DOMAIN_CHOICES)
+    confidence = models.FloatField(null=True, blank=True, help_text="Classifier probability (%)")
+
+    class Meta:
+        constraints = [
+            # Also the index behind in_domains(): domain → opportunity ids
+            models.UniqueConstraint(fields=['domain', 'opportunity'], name='opp_domain_unique'),
+        ]
+
+    def __str__(self):
+        return f"{self.opportunity_id} ∈ {self.domain}"
+
+
+class OpportunityAlias(models.Model):
+    """
+    A URL that turned out to be the same posting as an existing Opportunity —
+    a syndicated copy, a cross-listing, or a near-identical rewrite.
+    Stored instead of a duplicate row so listings stay clean.
+    """
+    url = models.CharField(max_length=500, unique=True, help_text="Canonicalized URL")
+    opportunity = models.ForeignKey(Opportunity, on_delete=models.CASCADE, related_name='aliases')
+    distance = models.PositiveSmallIntegerField(null=True, blank=True,
+                                                help_text="SimHash bit distance; empty for an exact URL match")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name_plural = 'Opportunity aliases'
+
+    def __str__(self):
+        return f"{self.url} → {self.opportunity_id}"
 
 
 class ScrapingLog(models.Model):
@@ -74,5 +204,166 @@ class ScrapingLog(models.Model):
                               choices=[('RUNNING','Running'),('SUCCESS','Success'),('FAILED','Failed')])
     error_message = models.TextField(blank=True)
 
+    # Instrumentation — filled from ScrapeMetrics at the end of each run
+    stage_seconds = models.JSONField(default=dict, blank=True,
+                                     help_text="Seconds spent per stage: fetch, parse, dedup, classify, write")
+    fetches = models.JSONField(default=list, blank=True,
+                               help_text="One entry per URL: url, status, latency_ms, bytes")
+    bytes_downloaded = models.BigIntegerField(default=0)
+    duplicates_skipped = models.IntegerField(default=0)
+    classifier_calls = models.IntegerField(default=0)
+    listing_fingerprint = models.CharField(max_length=64, blank=True,
+                                           help_text="Hash of the URLs and titles found; changes when the listing does")
+
+    class Meta:
+        indexes = [models.Index(fields=['university', '-started_at'])]
+
     def __str__(self):
         return f"{self.university} scrape — {self.started_at.strftime('%Y-%m-%d %H:%M')}"
+
+    def duration_seconds(self):
+        if not self.finished_at:
+            return None
+        return round((self.finished_at - self.started_at).total_seconds(), 2)
+
+
+class PageSnapshot(models.Model):
+    """
+    One fetch of a source page. The HTML itself lives gzip-compressed in the
+    snapshot store under its content hash, so identical pages share one file.
+    """
+    url = models.URLField(max_length=500)
+    university = models.CharField(max_length=50, db_index=True)
+    content_hash = models.CharField(max_length=64, db_index=True)
+    encoding = models.CharField(max_length=40, blank=True)
+    size = models.IntegerField(default=0, help_text="Uncompressed size in bytes")
+    status_code = models.PositiveSmallIntegerField(default=200)
+    fetched_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-fetched_at']
+        indexes = [models.Index(fields=['url', '-fetched_at'])]
+
+    def __str__(self):
+        return f"{self.url} @ {self.fetched_at.strftime('%Y-%m-%d %H:%M')}"
+
+
+BREAKER_STATES = [
+    ('CLOSED', 'Healthy'),
+    ('OPEN', 'Open — skipping'),
+    ('HALF_OPEN', 'Half-open — probing'),
+]
+
+
+class SourceHealth(models.Model):
+    """
+    Circuit-breaker state for one scrape source (see health.py).
+    Opens after repeated failures so a dead site stops tying up workers.
+    """
+    university = models.CharField(max_length=50, unique=True)
+    state = models.CharField(max_length=10, choices=BREAKER_STATES, default='CLOSED')
+    consecutive_failures = models.IntegerField(default=0)
+    times_opened = models.IntegerField(default=0, help_text="Consecutive openings; lengthens the cooldown")
+    opened_at = models.DateTimeField(null=True, blank=True)
+    last_success_at = models.DateTimeField(null=True, blank=True)
+    last_failure_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    skipped_runs = models.IntegerField(default=0, help_text="Scrapes skipped while the circuit was open")
+
+    class Meta:
+        verbose_name_plural = 'Source health'
+
+    def __str__(self):
+        return f"{self.university}: {self.get_state_display()}"
+
+
+CHANGE_KINDS = [
+    ('CREATED', 'Created'),
+    ('UPDATED', 'Updated'),
+    ('DEACTIVATED', 'Deactivated'),
+]
+
+
+class OpportunityChange(models.Model):
+    """
+    Outbox row for the change feed (see changefeed.py). Written in the same
+    transaction as the change itself; the auto-increment id is the feed's
+    sequence number.
+    """
+    opportunity = models.ForeignKey(Opportunity, on_delete=models.CASCADE, related_name='changes')
+    kind = models.CharField(max_length=12, choices=CHANGE_KINDS)
+    changed_fields = models.JSONField(default=list, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ['id']
+
+    def __str__(self):
+        return f"#{self.pk} {self.kind} {self.opportunity_id}"
+
+
+class ChangeFeedCheckpoint(models.Model):
+    """Last change id a named consumer has fully processed."""
+    consumer = models.CharField(max_length=100, unique=True)
+    position = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.consumer} @ {self.position}"
+
+
+class SavedSearch(models.Model):
+    """
+    A student's saved dashboard search (q / domain / type / university).
+    New opportunities are matched against it as they arrive (percolation.py)
+    rather than the student re-running the search.
+    """
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='saved_searches')
+    name = models.CharField(max_length=100, blank=True)
+    q = models.CharField(max_length=200, blank=True)
+    domain = models.CharField(max_length=20, choices=DOMAIN_CHOICES, blank=True)
+    opportunity_type = models.CharField(max_length=20, choices=OPPORTUNITY_TYPES, blank=True)
+    university = models.CharField(max_length=50, choices=IVY_UNIVERSITIES, blank=True)
+    anchor_key = models.CharField(max_length=40, db_index=True, editable=False,
+                                  help_text="Inverted-index key: one term every match must contain")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return self.name or self.describe()
+
+    def save(self, *args, **kwargs):
+        from apps.opportunities.percolation import anchor_key
+        self.anchor_key = anchor_key(self)
+        super().save(*args, **kwargs)
+
+    def describe(self):
+        parts = [f'"{self.q}"'] if self.q else []
+        parts += [v for v in (self.get_domain_display(), self.get_opportunity_type_display(),
+                              self.get_university_display()) if v]
+        return ' · '.join(parts)
+
+    def query_string(self):
+        """Dashboard URL parameters that reproduce this search."""
+        from urllib.parse import urlencode
+        params = {'q': self.q, 'domain': self.domain, 'type': self.opportunity_type, 'university': self.university}
+        return urlencode({k: v for k, v in params.items() if v})
+
+
+class SavedSearchMatch(models.Model):
+    """An opportunity that arrived after a saved search was created and matches it."""
+    saved_search = models.ForeignKey(SavedSearch, on_delete=models.CASCADE, related_name='matches')
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='search_matches')
+    opportunity = models.ForeignKey(Opportunity, on_delete=models.CASCADE, related_name='search_matches')
+    seen = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        unique_together = ['saved_search', 'opportunity']
+        indexes = [models.Index(fields=['user', 'seen', '-created_at'], name='match_user_unseen_idx')]
+
+    def __str__(self):
+        return f"{self.saved_search} → {self.opportunity}"
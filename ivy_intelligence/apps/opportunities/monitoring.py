@@ -0,0 +1,100 @@
+"""
+Aggregate ScrapingLog instrumentation into per-university latency stats.
+
+Used by the staff-only JSON endpoint /api/scraping-stats/ to answer
+"which stage made this sweep slow?" — p50/p95 of each stage, of total run
+time and of per-URL fetch latency, bucketed by day.
+"""
+
+import math
+from collections import defaultdict
+from datetime import timedelta
+
+from django.utils import timezone
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers (None if empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, math.ceil(pct / 100.0 * len(ordered)) - 1)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def summarize(values):
+    return {
+        'count': len(values),
+        'p50': percentile(values, 50),
+        'p95': percentile(values, 95),
+    }
+
+
+def _new_bucket():
+    return {
+        'runs': 0,
+        'failed': 0,
+        'duration': [],
+        'stages': defaultdict(list),
+        'fetch_latency_ms': [],
+        'bytes_downloaded': 0,
+        'duplicates_skipped': 0,
+        'classifier_calls': 0,
+    }
+
+
+def _finish_bucket(bucket):
+    return {
+        'runs': bucket['runs'],
+        'failed': bucket['failed'],
+        'duration_seconds': summarize(bucket['duration']),
+        'stage_seconds': {stage: summarize(v) for stage, v in sorted(bucket['stages'].items())},
+        'fetch_latency_ms': summarize(bucket['fetch_latency_ms']),
+        'bytes_downloaded': bucket['bytes_downloaded'],
+        'duplicates_skipped': bucket['duplicates_skipped'],
+        'classifier_calls': bucket['classifier_calls'],
+    }
+
+
+def scraping_stats(days=30, university=None) -> dict:
+    """
+    Returns {university: {'overall': {...}, 'daily': {'YYYY-MM-DD': {...}}}}
+    for runs started in the last `days` days.
+    """
+    from apps.opportunities.models import ScrapingLog
+
+    logs = ScrapingLog.objects.filter(
+        started_at__gte=timezone.now() - timedelta(days=days),
+        finished_at__isnull=False,
+    )
+    if university:
+        logs = logs.filter(university=university)
+
+    buckets = defaultdict(lambda: defaultdict(_new_bucket))
+    rows = logs.values_list(
+        'university', 'started_at', 'finished_at', 'status', 'stage_seconds', 'fetches',
+        'bytes_downloaded', 'duplicates_skipped', 'classifier_calls',
+    )
+    for (uni, started, finished, status, stages, fetches,
+         size, duplicates, classifier_calls) in rows.iterator(chunk_size=1000):
+        day = timezone.localtime(started).date().isoformat()
+        for key in ('overall', day):
+            bucket = buckets[uni][key]
+            bucket['runs'] += 1
+            bucket['failed'] += status == 'FAILED'
+            bucket['duration'].append((finished - started).total_seconds())
+            for stage, seconds in (stages or {}).items():
+                bucket['stages'][stage].append(seconds)
+            bucket['fetch_latency_ms'].extend(f['latency_ms'] for f in fetches or [])
+            bucket['bytes_downloaded'] += size
+            bucket['duplicates_skipped'] += duplicates
+            bucket['classifier_calls'] += classifier_calls
+
+    result = {}
+    for uni, per_key in sorted(buckets.items()):
+        overall = per_key.pop('overall')
+        result[uni] = {
+            'overall': _finish_bucket(overall),
+            'daily': {day: _finish_bucket(b) for day, b in sorted(per_key.items())},
+        }
+    return result
@@ -0,0 +1,147 @@
+"""
+Saved-search percolation: match each new opportunity against the saved
+searches instead of students re-running those searches on the dashboard.
+
+A saved search matches exactly what the dashboard filter would show:
+`q` is a case-insensitive substring of title or description or names one
+of its tags (same slug, see tags.py), domain (when set) is one of the opportunity's domains (see labels.py), and
+type / university (when set) are equal.
+
+Inverted index
+    Every saved search stores one anchor_key — a term any matching
+    opportunity is guaranteed to contain:
+        a 3-character slice of q ("q:lea")   — a substring match contains
+                                               every slice of q
+        type:X / domain:X / university:X     — when q is too short
+    For a new opportunity we compute all of its keys (every 3-character
+    slice of its text, plus its type/domains/university), look up only the
+    searches anchored on one of them, and verify those. Cost per item
+    follows the number of candidate searches, not the number of searches.
+
+The slice chosen for q is the one made of the rarest letters, so its
+candidate list stays short. Spaces, digits and punctuation are as common
+as anything in listing text, so they score lowest, and slices spanning a
+space are used only when q has no other.
+
+Runs as a change-feed consumer (see changefeed.py) every few minutes.
+"""
+
+import logging
+
+from apps.opportunities.labels import domains_of
+from apps.opportunities.tags import tag_slug
+
+logger = logging.getLogger(__name__)
+
+CONSUMER = 'saved-searches'
+KEY_CHUNK = 500
+# Updates to any of these can change which searches an opportunity matches
+SEARCHABLE_FIELDS = {'title', 'description', 'tags', 'domain', 'opportunity_type', 'university', 'is_active'}
+# English letters from most to least common; rarer letters make better anchors
+LETTER_ORDER = 'etaoinshrdlcumwfgypbvkjxqz'
+_RARITY = {ch: i for i, ch in enumerate(LETTER_ORDER)}
+_NOT_A_LETTER = -1
+
+
+def _slices(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def anchor_key(search) -> str:
+    q = (search.q or '').lower()
+    if len(q) >= 3:
+        slices = sorted(_slices(q))
+        candidates = [s for s in slices if not any(ch.isspace() for ch in s)] or slices
+        rarest = max(candidates, key=lambda s: sum(_RARITY.get(ch, _NOT_A_LETTER) for ch in s))
+        return f'q:{rarest}'
+    if search.opportunity_type:
+        return f'type:{search.opportunity_type}'
+    if search.domain:
+        return f'domain:{search.domain}'
+    if search.university:
+        return f'university:{search.university}'
+    return '*'
+
+
+def _text(opp):
+    tags = [text for tag in opp.tags.all() for text in (tag.name, tag.slug)]
+    return ' '.join((opp.title, opp.description, *tags)).lower()
+
+
+def opportunity_keys(opp) -> set:
+    """Every anchor key a search matching this opportunity could have."""
+    keys = {f'q:{s}' for s in _slices(_text(opp))}
+    keys.update(f'domain:{domain}' for domain in domains_of(opp))
+    keys.update({
+        f'type:{opp.opportunity_type}',
+        f'university:{opp.university}',
+        '*',
+    })
+    return keys
+
+
+def matches(search, opp) -> bool:
+    """The dashboard's filter, applied to one opportunity."""
+    if search.domain and search.domain not in domains_of(opp):
+        return False
+    if search.opportunity_type and opp.opportunity_type != search.opportunity_type:
+        return False
+    if search.university and opp.university != search.university:
+        return False
+    if search.q:
+        q = search.q.lower()
+        if q in opp.title.lower() or q in opp.description.lower():
+            return True
+        return tag_slug(search.q) in {tag.slug for tag in opp.tags.all()}
+    return True
+
+
+def percolate(opportunities) -> int:
+    """Match a batch of opportunities against saved searches. Returns matches created."""
+    from apps.opportunities.models import SavedSearch, SavedSearchMatch
+
+    opportunities = [opp for opp in opportunities if opp.is_active]
+    if not opportunities:
+        return 0
+
+    keys_by_opp = {opp.pk: opportunity_keys(opp) for opp in opportunities}
+    all_keys = sorted(set().union(*keys_by_opp.values()))
+
+    # Only the searches anchored on a key present in this batch are loaded
+    index = {}
+    for start in range(0, len(all_keys), KEY_CHUNK):
+        for search in SavedSearch.objects.filter(anchor_key__in=all_keys[start:start + KEY_CHUNK]):
+            index.setdefault(search.anchor_key, []).append(search)
+
+    new_matches = []
+    for opp in opportunities:
+        for key in keys_by_opp[opp.pk] & index.keys():
+            for search in index[key]:
+                if search.created_at <= opp.scraped_at and matches(search, opp):
+                    new_matches.append(SavedSearchMatch(saved_search=search, user_id=search.user_id, opportunity=opp))
+
+    SavedSearchMatch.objects.bulk_create(new_matches, ignore_conflicts=True, batch_size=500)
+    return len(new_matches)
+
+
+def handle_changes(changes) -> int:
+    """Change-feed handler: percolate created opportunities and ones whose searchable fields changed."""
+    from apps.opportunities.models import Opportunity
+
+    ids = {
+        change.opportunity_id for change in changes
+        if change.kind == 'CREATED' or (change.kind == 'UPDATED' and SEARCHABLE_FIELDS & set(change.changed_fields))
+    }
+    if not ids:
+        return 0
+    return percolate(Opportunity.objects.filter(pk__in=ids).prefetch_related('domain_labels', 'tags'))
+
+
+def run() -> int:
+    """Process everything new in the change feed. Returns changes consumed."""
+    from apps.opportunities.changefeed import consume
+
+    handled = consume(CONSUMER, handle_changes)
+    if handled:
+        logger.info(f"Percolated {handled} opportunity changes against saved searches")
+    return handled
@@ -0,0 +1,182 @@
+"""
+Stored classifier output on Opportunity: domain_confidence, domain_scores
+and model_version.
+
+The scraper fills these in at ingest (see save_opportunities). Rows
+ingested before that, or never scored because the model was unavailable,
+have model_version == '' and are scored by backfill_confidence(), which
+leaves `domain` alone: it records how confident the current model is in
+the label each row already has. Only classifier metadata changes, so
+neither updated_at nor the change feed is touched.
+
+reclassify() re-labels the corpus after a retrain (staff-verified rows
+excepted): the table is read in
+keyset-paginated chunks, each chunk is classified in one vectorized call
+(optionally on a process pool), and every scanned row gets the new
+model's confidence, scores and model_version, so a later stale-only pass
+skips it. Only rows whose domain changed also get a new updated_at and a
+change-feed entry. Both refresh the rows' domain label sets (see labels.py).
+"""
+
+import logging
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 500
+RECLASSIFY_CHUNK_SIZE = 2000
+
+
+def classifier_text(opp) -> str:
+    """The text the scraper classifies: description then title."""
+    return f"{opp.description} {opp.title}"
+
+
+def backfill_confidence(chunk_size=CHUNK_SIZE) -> int:
+    """Score every row with no stored confidence. Returns rows updated."""
+    from apps.opportunities.models import Opportunity
+    from apps.opportunities.classifier import predict_domains, top_scores, model_version
+    from apps.opportunities.labels import labels_for, replace_labels
+
+    version = model_version()
+    if not version:
+        logger.warning("Classifier model unavailable; confidence backfill skipped")
+        return 0
+
+    queryset = Opportunity.objects.filter(model_version='').only('id', 'title', 'description', 'domain', 'domain_source')
+    updated = 0
+    last_pk = 0
+    while True:
+        rows = list(queryset.filter(pk__gt=last_pk).order_by('pk')[:chunk_size])
+        if not rows:
+            break
+        last_pk = rows[-1].pk
+        for row, (_, scores) in zip(rows, predict_domains([classifier_text(row) for row in rows])):
+            row.domain_confidence = scores.get(row.domain)
+            row.domain_scores = top_scores(scores)
+            row.model_version = version
+        with transaction.atomic():
+            updated += Opportunity.objects.bulk_update(rows, ['domain_confidence', 'domain_scores', 'model_version'])
+            replace_labels({row.pk: labels_for(row.domain, row.domain_scores, row.domain_source) for row in rows})
+    logger.info(f"Backfilled classifier confidence on {updated} opportunities")
+    return updated
+
+
+def _pages(queryset, fields, chunk_size):
+    last_pk = 0
+    while True:
+        rows = list(queryset.filter(pk__gt=last_pk).order_by('pk').values_list(*fields)[:chunk_size])
+        if not rows:
+            return
+        last_pk = rows[-1][0]
+        yield rows
+
+
+def classify_chunk(rows) -> list:
+    """
+    [(id, domain, confidence, top scores), ...] for [(id, title, description), ...].
+    Module-level so a process pool can run it.
+    """
+    from apps.opportunities.classifier import predict_domains, top_scores
+
+    predictions = predict_domains([f"{description} {title}" for _, title, description in rows])
+    return [
+        (row[0], domain, scores.get(domain), top_scores(scores))
+        for row, (domain, scores) in zip(rows, predictions)
+    ]
+
+
+def _classified(pages, workers):
+    """(page, results) pairs in order; with workers > 1 a bounded window of chunks runs on a process pool."""
+    if workers <= 1:
+        for page in pages:
+            yield page, classify_chunk([row[:3] for row in page])
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        window = deque()
+        for page in pages:
+            window.append((page, pool.submit(classify_chunk, [row[:3] for row in page])))
+            if len(window) >= workers * 2:
+                page, future = window.popleft()
+                yield page, future.result()
+        while window:
+            page, future = window.popleft()
+            yield page, future.result()
+
+
+def reclassify(chunk_size=RECLASSIFY_CHUNK_SIZE, workers=1, stale_only=False, below=None,
+               dry_run=False) -> dict:
+    """
+    Re-run the current model over stored opportunities.
+
+    stale_only: only rows scored by another model version (or never).
+    below: only rows whose stored confidence is under this percentage.
+    Rows whose label did not change are counted as 'rescored': only their
+    classifier metadata is written.
+
+    Returns {'rows', 'changed', 'rescored', 'seconds', 'rows_per_second', 'model_version'}.
+    """
+    from apps.opportunities.models import Opportunity
+    from apps.opportunities.classifier import model_version
+    from apps.opportunities.changefeed import publish
+    from apps.opportunities.labels import labels_for, replace_labels
+
+    version = model_version()
+    if not version:
+        raise RuntimeError("Classifier model unavailable")
+
+    queryset = Opportunity.objects.exclude(domain_source='ADMIN')  # staff-verified labels stay
+    if stale_only:
+        queryset = queryset.exclude(model_version=version)
+    if below is not None:
+        queryset = queryset.filter(Q(domain_confidence__lt=below) | Q(domain_confidence__isnull=True))
+
+    stats = {'rows': 0, 'changed': 0, 'rescored': 0}
+    started = time.perf_counter()
+    pages = _pages(queryset, ('id', 'title', 'description', 'domain'), chunk_size)
+    for page, results in _classified(pages, workers):
+        stats['rows'] += len(page)
+        relabelled = defaultdict(list)   # new domain -> [pk]
+        unchanged = []
+        rescored = []
+        labelled = {}
+        for (_, _, _, old_domain), (pk, domain, confidence, scores) in zip(page, results):
+            rescored.append(Opportunity(pk=pk, domain_confidence=confidence, domain_scores=scores))
+            if domain != old_domain:
+                relabelled[domain].append(pk)
+            else:
+                unchanged.append(pk)
+            labelled[pk] = labels_for(domain, scores)
+        stats['changed'] += len(rescored) - len(unchanged)
+        stats['rescored'] += len(unchanged)
+        if dry_run:
+            continue
+
+        # Columns shared by many rows go out as one UPDATE per new domain;
+        # bulk_update's per-row CASE is kept to the two per-row columns.
+        with transaction.atomic():
+            now = timezone.now()
+            for domain, ids in relabelled.items():
+                Opportunity.objects.filter(pk__in=ids).update(domain=domain, updated_at=now, model_version=version)
+                publish(ids, 'UPDATED', ['domain'])
+            # Metadata only: no updated_at or change-feed entry for an unchanged label
+            Opportunity.objects.filter(pk__in=unchanged).update(model_version=version)
+            Opportunity.objects.bulk_update(rescored, ['domain_confidence', 'domain_scores'], batch_size=500)
+            replace_labels(labelled)
+
+    elapsed = time.perf_counter() - started
+    stats.update(
+        seconds=round(elapsed, 2),
+        rows_per_second=round(stats['rows'] / elapsed) if elapsed else None,
+        model_version=version,
+    )
+    logger.info(f"Reclassified {stats['rows']} opportunities: {stats['changed']} changed "
+                f"({stats['rows_per_second']} rows/s)")
+    return stats
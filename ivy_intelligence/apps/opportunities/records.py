@@ -0,0 +1,51 @@
+"""
+Compact record type for scraped opportunities.
+
+Parsers yield ScrapedItem objects and the rest of the pipeline (dedup,
+classify, bulk insert, re-extraction workers) reads their attributes.
+Compared with a dict per item there is no per-instance __dict__ or hash
+table, and the enum-like fields (university, opportunity_type, domain)
+are interned so 100k items share a handful of string objects.
+
+`manage.py bench_records` measures the difference.
+"""
+
+import sys
+from dataclasses import dataclass, fields
+
+
+def intern_choice(value):
+    """Intern a short enum-like value (university key, type, domain label)."""
+    return sys.intern(str(value)) if value else ''
+
+
+@dataclass(slots=True)
+class ScrapedItem:
+    title: str
+    university: str
+    source_url: str
+    description: str = ''
+    location: str = 'Remote'
+    opportunity_type: str = 'OTHER'
+    domain: str = ''
+    canonical_url: str = ''
+    domain_confidence: float = None
+    domain_scores: dict = None
+    model_version: str = ''
+
+    def __post_init__(self):
+        intern = sys.intern
+        self.university = intern(self.university)
+        self.opportunity_type = intern(self.opportunity_type or 'OTHER')
+        if self.domain:
+            self.domain = intern(str(self.domain))
+        if self.model_version:
+            self.model_version = intern(self.model_version)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build from a dict with the old item keys; unknown keys are ignored."""
+        return cls(**{f.name: data[f.name] for f in fields(cls) if data.get(f.name) is not None})
+
+    def as_dict(self):
+        return {f.name: getattr(self, f.name) for f in fields(self)}
@@ -0,0 +1,95 @@
+"""
+Adaptive scrape scheduling.
+
+Instead of scraping every university on the same fixed 6-hour crontab,
+each source gets its own interval learned from its ScrapingLog history:
+
+    change  = a successful sweep that found new opportunities, or whose
+              listing_fingerprint differs from the sweep before it
+    rate    = changes / hours covered by the last SCRAPE_HISTORY_RUNS sweeps
+    interval = 1 / (2 × rate), clamped to [SCRAPE_MIN_INTERVAL_HOURS,
+                                           SCRAPE_MAX_INTERVAL_HOURS]
+
+Checking twice per expected change means a busy source is typically picked
+up within half its change period, while a source that never changes drifts
+to the maximum interval. Sources without enough history use
+SCRAPE_DEFAULT_INTERVAL_HOURS.
+
+Celery Beat runs scrape_due_universities every 30 minutes; it only
+launches scrapes for sources whose interval has elapsed.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+DEFAULT_INTERVAL_HOURS = 6
+MIN_INTERVAL_HOURS = 1
+MAX_INTERVAL_HOURS = 24
+HISTORY_RUNS = 10
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def change_rate(university):
+    """
+    Observed changes per hour over recent successful sweeps,
+    or None if there isn't enough history to say.
+    """
+    from apps.opportunities.models import ScrapingLog
+
+    runs = list(
+        ScrapingLog.objects.filter(university=university, status='SUCCESS')
+        .order_by('-started_at')
+        .values('started_at', 'new_opportunities', 'listing_fingerprint')[:_setting('SCRAPE_HISTORY_RUNS', HISTORY_RUNS)]
+    )
+    if len(runs) < 2:
+        return None
+
+    hours = (runs[0]['started_at'] - runs[-1]['started_at']).total_seconds() / 3600
+    if hours <= 0:
+        return None
+
+    # Each run is compared with the one before it, so the oldest run only serves as a baseline
+    changes = sum(
+        1 for run, previous in zip(runs, runs[1:])
+        if run['new_opportunities'] > 0 or run['listing_fingerprint'] != previous['listing_fingerprint']
+    )
+    return changes / hours
+
+
+def scrape_interval(university) -> timedelta:
+    """How long to wait between scrapes of this university."""
+    low = _setting('SCRAPE_MIN_INTERVAL_HOURS', MIN_INTERVAL_HOURS)
+    high = _setting('SCRAPE_MAX_INTERVAL_HOURS', MAX_INTERVAL_HOURS)
+
+    rate = change_rate(university)
+    if rate is None:
+        hours = _setting('SCRAPE_DEFAULT_INTERVAL_HOURS', DEFAULT_INTERVAL_HOURS)
+    elif rate == 0:
+        hours = high
+    else:
+        hours = 1 / (2 * rate)
+    return timedelta(hours=min(max(hours, low), high))
+
+
+def due_universities(now=None) -> dict:
+    """
+    Returns {university: interval} for every source whose interval has
+    elapsed since its last attempt (successful, failed or still running).
+    """
+    from apps.opportunities.models import ScrapingLog
+    from apps.opportunities.scraper import SCRAPERS
+
+    now = now or timezone.now()
+    due = {}
+    for university in SCRAPERS:
+        interval = scrape_interval(university)
+        last = (ScrapingLog.objects.filter(university=university)
+                .order_by('-started_at').values_list('started_at', flat=True).first())
+        if last is None or last + interval <= now:
+            due[university] = interval
+    return due
@@ -4,14 +4,33 @@ Real-Time Web Scraper for Ivy League University Opportunities.
 Each scraper function targets a specific university's events/opportunities page.
 We use requests + BeautifulSoup4 to fetch and parse HTML.
 Change detection: we store source_url as unique, so duplicates are auto-skipped.
+Every fetched page is kept in the snapshot store (see snapshots.py) so the
+parse_* functions can be re-run offline with `manage.py reextract`.
+
+A run is a streaming pipeline of generators:
+    fetch (prefetch thread, bounded queue) → parse → canonicalize/dedup
+    → classify → write, the last three in batches of WRITE_BATCH_SIZE,
+so memory stays flat however many items a source returns and the first
+rows land in the database before the last page has been parsed.
 """
 
+import hashlib
+import queue
+import threading
 import requests
 from bs4 import BeautifulSoup
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime, date
+from itertools import islice
 import logging
 import time
 
+from django.db import transaction
+
+from apps.opportunities.keywords import listings, opportunity_types
+from apps.opportunities.records import ScrapedItem, intern_choice
+
 logger = logging.getLogger(__name__)
 
 HEADERS = {
@@ -23,85 +42,144 @@ HEADERS = {
 }
 
 TIMEOUT = 15  # seconds
+PREFETCH_PAGES = 2  # pages downloaded ahead of the parser
+WRITE_BATCH_SIZE = 50  # items deduplicated, classified and written together
+
 
+class ScrapeMetrics:
+    """
+    Timings and volumes for one scraper run, saved onto its ScrapingLog.
+
+    Usage:
+        metrics = ScrapeMetrics()
+        with metrics.stage('parse'):
+            ...
+    """
 
-def safe_get(url):
-    """Fetch a URL safely, returning None on failure."""
+    def __init__(self):
+        self.stage_seconds = defaultdict(float)
+        self.fetches = []
+        self.bytes_downloaded = 0
+        self.duplicates_skipped = 0
+        self.classifier_calls = 0
+
+    @contextmanager
+    def stage(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_seconds[name] += time.perf_counter() - started
+
+    def timed(self, name, iterable):
+        """Yield from iterable, billing only the time spent producing items to `name`."""
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def record_fetch(self, url, status, latency, size=0):
+        self.fetches.append({
+            'url': url,
+            'status': status,
+            'latency_ms': round(latency * 1000, 1),
+            'bytes': size,
+        })
+        self.bytes_downloaded += size
+
+    def apply_to(self, log):
+        """Copy the collected numbers onto a ScrapingLog (not saved)."""
+        log.stage_seconds = {name: round(t, 4) for name, t in self.stage_seconds.items()}
+        log.fetches = self.fetches
+        log.bytes_downloaded = self.bytes_downloaded
+        log.duplicates_skipped = self.duplicates_skipped
+        log.classifier_calls = self.classifier_calls
+
+
+def safe_get(url, university='', metrics=None, snapshot=True):
+    """
+    Fetch a URL safely, returning None on failure.
+    Every successful response is also written to the snapshot store,
+    so pages can be re-extracted later without hitting the network.
+    Pass snapshot=False from worker threads and store the page afterwards.
+    """
+    metrics = metrics or ScrapeMetrics()
+    resp = None
+    started = time.perf_counter()
     try:
         resp = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
         resp.raise_for_status()
-        return resp
     except Exception as e:
         logger.warning(f"Failed to fetch {url}: {e}")
         return None
+    finally:
+        metrics.record_fetch(
+            url,
+            resp.status_code if resp is not None else None,
+            time.perf_counter() - started,
+            len(resp.content) if resp is not None else 0,
+        )
+
+    if snapshot:
+        from apps.opportunities.snapshots import save_snapshot
+        save_snapshot(url, resp.content, university=university,
+                      status_code=resp.status_code, encoding=resp.encoding or '')
+    return resp
 
 
-def scrape_harvard():
+def parse_harvard(html):
     """
-    Scrape Harvard University events and opportunities.
+    Parse a Harvard events page.
     Target: Harvard Office of Career Services & SEAS events page.
-    Returns a list of opportunity dicts.
+    Yields ScrapedItem records.
     """
-    opportunities = []
-    urls = [
-        'https://www.harvard.edu/events/',
-    ]
-
-    for url in urls:
-        resp = safe_get(url)
-        if not resp:
-            continue
-        soup = BeautifulSoup(resp.text, 'html.parser')
+    soup = BeautifulSoup(html, 'html.parser')
 
-        # Harvard events use article tags with specific classes
-        events = soup.find_all('article', class_=lambda c: c and 'event' in c.lower())
-        if not events:
-            # fallback: look for list items or divs with event data
-            events = soup.find_all(['div', 'li'], class_=lambda c: c and 'event' in str(c).lower())
+    # Harvard events use article tags with specific classes
+    events = soup.find_all('article', class_=lambda c: c and 'event' in c.lower())
+    if not events:
+        # fallback: look for list items or divs with event data
+        events = soup.find_all(['div', 'li'], class_=lambda c: c and 'event' in str(c).lower())
 
-        for event in events[:30]:  # limit to 20 per page
-            title_tag = event.find(['h2', 'h3', 'h4', 'a'])
-            if not title_tag:
-                continue
-            title = title_tag.get_text(strip=True)
-            if len(title) < 5:
-                continue
-
-            link_tag = event.find('a', href=True)
-            if not link_tag:
-                continue
-            href = link_tag['href']
-            if not href.startswith('http'):
-                href = 'https://www.harvard.edu' + href
+    for event in events[:30]:  # limit to 20 per page
+        title_tag = event.find(['h2', 'h3', 'h4', 'a'])
+        if not title_tag:
+            continue
+        title = title_tag.get_text(strip=True)
+        if len(title) < 5:
+            continue
 
-            desc_tag = event.find(['p', 'div'], class_=lambda c: c and 'desc' in str(c).lower())
-            description = desc_tag.get_text(strip=True) if desc_tag else title
+        link_tag = event.find('a', href=True)
+        if not link_tag:
+            continue
+        href = link_tag['href']
+        if not href.startswith('http'):
+            href = 'https://www.harvard.edu' + href
 
-            opportunities.append({
-                'title': title,
-                'university': 'HARVARD',
-                'description': description or title,
-                'source_url': href,
-                'location': 'Cambridge, MA / Remote',
-                'opportunity_type': classify_type(title),
-            })
+        desc_tag = event.find(['p', 'div'], class_=lambda c: c and 'desc' in str(c).lower())
+        description = desc_tag.get_text(strip=True) if desc_tag else title
 
-    logger.info(f"Harvard scraper found {len(opportunities)} opportunities")
-    return opportunities
+        yield ScrapedItem(
+            title=title,
+            university='HARVARD',
+            description=description or title,
+            source_url=href,
+            location='Cambridge, MA / Remote',
+            opportunity_type=classify_type(title),
+        )
 
 
-def scrape_mit():
+def parse_mit(html):
     """
-    Scrape MIT Events and opportunities.
+    Parse the MIT events page.
     Target: MIT events.mit.edu
     """
-    opportunities = []
-    url = 'https://events.mit.edu/'
-    resp = safe_get(url)
-    if not resp:
-        return opportunities
-
-    soup = BeautifulSoup(resp.text, 'html.parser')
+    found = 0
+    soup = BeautifulSoup(html, 'html.parser')
 
     # MIT events page uses specific structure
     event_links = soup.find_all('a', href=True)
@@ -120,31 +198,25 @@ def scrape_mit():
             continue
 
         full_url = href if href.startswith('http') else f'https://events.mit.edu{href}'
-        opportunities.append({
-            'title': title,
-            'university': 'MIT',
-            'description': f"MIT event: {title}",
-            'source_url': full_url,
-            'location': 'Cambridge, MA / Remote',
-            'opportunity_type': classify_type(title),
-        })
-
-    logger.info(f"MIT scraper found {len(opportunities)} opportunities")
-    return opportunities[:30]
-
-
-def scrape_stanford():
+        yield ScrapedItem(
+            title=title,
+            university='MIT',
+            description=f"MIT event: {title}",
+            source_url=full_url,
+            location='Cambridge, MA / Remote',
+            opportunity_type=classify_type(title),
+        )
+        found += 1
+        if found == 30:
+            return
+
+
+def parse_stanford(html):
     """
-    Scrape Stanford University events.
+    Parse the Stanford University events page.
     Target: Stanford Events calendar.
     """
-    opportunities = []
-    url = 'https://events.stanford.edu/'
-    resp = safe_get(url)
-    if not resp:
-        return opportunities
-
-    soup = BeautifulSoup(resp.text, 'html.parser')
+    soup = BeautifulSoup(html, 'html.parser')
     events = soup.find_all(['article', 'div', 'li'], class_=lambda c: c and 'event' in str(c).lower())
 
     for event in events[:25]:
@@ -163,31 +235,23 @@ def scrape_stanford():
         desc_tag = event.find('p')
         description = desc_tag.get_text(strip=True) if desc_tag else title
 
-        opportunities.append({
-            'title': title,
-            'university': 'STANFORD',
-            'description': description,
-            'source_url': href,
-            'location': 'Stanford, CA / Remote',
-            'opportunity_type': classify_type(title),
-        })
+        yield ScrapedItem(
+            title=title,
+            university='STANFORD',
+            description=description,
+            source_url=href,
+            location='Stanford, CA / Remote',
+            opportunity_type=classify_type(title),
+        )
 
-    logger.info(f"Stanford scraper found {len(opportunities)} opportunities")
-    return opportunities
 
-
-def scrape_yale():
+def parse_yale(html):
     """
-    Scrape Yale University opportunities.
+    Parse the Yale University resources page.
     Target: Yale career and events pages.
     """
-    opportunities = []
-    url = 'https://yale.edu/academics/resources'
-    resp = safe_get(url)
-    if not resp:
-        return opportunities
-
-    soup = BeautifulSoup(resp.text, 'html.parser')
+    found = 0
+    soup = BeautifulSoup(html, 'html.parser')
     links = soup.find_all('a', href=True)
 
     for link in links[:50]:
@@ -195,44 +259,110 @@ def scrape_yale():
         href = link['href']
         if len(title) < 10:
             continue
-        if not any(kw in title.lower() for kw in ['internship', 'research', 'fellowship', 'scholarship', 'workshop', 'conference', 'hackathon']):
+        if not listings.search(title):
             continue
 
         full_url = href if href.startswith('http') else f'https://yale.edu{href}'
-        opportunities.append({
-            'title': title,
-            'university': 'YALE',
-            'description': f"Yale University opportunity: {title}",
-            'source_url': full_url,
-            'location': 'New Haven, CT / Remote',
-            'opportunity_type': classify_type(title),
-        })
-
-    logger.info(f"Yale scraper found {len(opportunities)} opportunities")
-    return opportunities[:20]
+        yield ScrapedItem(
+            title=title,
+            university='YALE',
+            description=f"Yale University opportunity: {title}",
+            source_url=full_url,
+            location='New Haven, CT / Remote',
+            opportunity_type=classify_type(title),
+        )
+        found += 1
+        if found == 20:
+            return
 
 
 def classify_type(title: str) -> str:
     """
     Simple keyword-based opportunity type classifier.
     The ML classifier handles domain, this handles the event type.
+    Keywords and their order: keywords.OPPORTUNITY_TYPE_KEYWORDS.
+    """
+    return opportunity_types.first(title, default='OTHER')
+
+
+# Source pages and the parser that understands each one.
+# Parsers take raw HTML so stored snapshots can be replayed through them.
+SOURCES = {
+    'HARVARD': (['https://www.harvard.edu/events/'], parse_harvard),
+    'MIT': (['https://events.mit.edu/'], parse_mit),
+    'STANFORD': (['https://events.stanford.edu/'], parse_stanford),
+    'YALE': (['https://yale.edu/academics/resources'], parse_yale),
+}
+
+
+def fetch_pages(university_key: str, metrics=None):
     """
-    title_lower = title.lower()
-    if any(kw in title_lower for kw in ['internship', 'intern']):
-        return 'INTERNSHIP'
-    if any(kw in title_lower for kw in ['hackathon', 'hack']):
-        return 'HACKATHON'
-    if any(kw in title_lower for kw in ['workshop', 'bootcamp', 'training']):
-        return 'WORKSHOP'
-    if any(kw in title_lower for kw in ['conference', 'symposium', 'summit']):
-        return 'CONFERENCE'
-    if any(kw in title_lower for kw in ['scholarship', 'grant', 'funding']):
-        return 'SCHOLARSHIP'
-    if any(kw in title_lower for kw in ['fellowship']):
-        return 'FELLOWSHIP'
-    if any(kw in title_lower for kw in ['competition', 'contest', 'challenge']):
-        return 'COMPETITION'
-    return 'OTHER'
+    Yield (url, response) for each source page of a university.
+    A background thread downloads up to PREFETCH_PAGES pages ahead, so the
+    next page is on its way while the current one is being parsed and saved.
+    Snapshots are stored here, on the consuming thread.
+    """
+    from apps.opportunities.snapshots import save_snapshot
+
+    metrics = metrics or ScrapeMetrics()
+    urls, _ = SOURCES[university_key]
+    pages = queue.Queue(maxsize=PREFETCH_PAGES)
+    stop = threading.Event()
+
+    def download():
+        for url in urls + [None]:
+            page = (url, safe_get(url, metrics=metrics, snapshot=False)) if url else None
+            # Give up if the consumer went away rather than block forever
+            while not stop.is_set():
+                try:
+                    pages.put(page, timeout=1)
+                    break
+                except queue.Full:
+                    continue
+
+    threading.Thread(target=download, name=f'fetch-{university_key}', daemon=True).start()
+    try:
+        while True:
+            with metrics.stage('fetch'):
+                page = pages.get()
+                if page is None:
+                    return
+                url, resp = page
+                if resp is not None:
+                    save_snapshot(url, resp.content, university=university_key,
+                                  status_code=resp.status_code, encoding=resp.encoding or '')
+            if resp is not None:
+                yield url, resp
+    finally:
+        stop.set()
+
+
+def scrape_source(university_key: str, metrics=None):
+    """Fetch every source page for a university and yield the parsed opportunities."""
+    metrics = metrics or ScrapeMetrics()
+    _, parser = SOURCES[university_key]
+    for _, resp in fetch_pages(university_key, metrics):
+        yield from metrics.timed('parse', parser(resp.text))
+
+
+def scrape_harvard(metrics=None):
+    """Scrape Harvard University events and opportunities."""
+    return scrape_source('HARVARD', metrics)
+
+
+def scrape_mit(metrics=None):
+    """Scrape MIT Events and opportunities."""
+    return scrape_source('MIT', metrics)
+
+
+def scrape_stanford(metrics=None):
+    """Scrape Stanford University events."""
+    return scrape_source('STANFORD', metrics)
+
+
+def scrape_yale(metrics=None):
+    """Scrape Yale University opportunities."""
+    return scrape_source('YALE', metrics)
 
 
 # Registry of all scrapers
@@ -244,44 +374,229 @@ SCRAPERS = {
 }
 
 
+class ListingFingerprint:
+    """
+    Order-independent hash of what a listing currently shows, built one
+    item at a time: the sum of each entry's SHA-256, so no list is kept.
+    """
+
+    def __init__(self):
+        self._total = 0
+
+    def add(self, opp):
+        entry = f"{opp.source_url}\t{opp.title}".encode('utf-8')
+        self._total = (self._total + int.from_bytes(hashlib.sha256(entry).digest(), 'big')) % (1 << 256)
+
+    def hexdigest(self) -> str:
+        return f'{self._total:064x}'
+
+
+def batched(items, size):
+    """Group any iterable into lists of at most `size` items."""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def save_opportunities(raw_opportunities, update_existing=False, metrics=None, live=False) -> dict:
+    """
+    Classify and save scraped opportunities (ScrapedItem records; plain
+    dicts with the same keys are converted). Accepts any iterable — a
+    generator from scrape_source() is consumed in batches of
+    WRITE_BATCH_SIZE, so each batch is deduplicated, classified and
+    written before the next one is pulled and memory stays flat.
+    Existing URLs are skipped, or refreshed in place when update_existing
+    is set (used when re-extracting stored snapshots).
+    live marks items just read from the source site (run_scraper): only
+    then are they stamped as seen, which keeps them out of the stale sweep.
+    A domain already set on an item is trusted as-is.
+    Returns {'new': n, 'updated': n, 'new_ids': [...]}.
+    """
+    metrics = metrics or ScrapeMetrics()
+    stats = {'new': 0, 'updated': 0, 'new_ids': []}
+    items = (opp if isinstance(opp, ScrapedItem) else ScrapedItem.from_dict(opp) for opp in raw_opportunities)
+    for batch in batched(items, WRITE_BATCH_SIZE):
+        _save_batch(batch, update_existing, metrics, stats, live)
+    return stats
+
+
+def _save_batch(batch, update_existing, metrics, stats, live):
+    from apps.opportunities.models import Opportunity, OpportunityAlias
+    from apps.opportunities.classifier import predict_domains, top_scores, model_version
+    from apps.opportunities.changefeed import publish
+    from apps.opportunities.enrichment import LISTING_FIELDS
+    from apps.opportunities.labels import labels_for, replace_labels
+    from apps.opportunities.dedup import (
+        MAX_HAMMING_DISTANCE, bands, canonicalize_url, find_near_duplicate, fingerprint_fields, to_unsigned,
+    )
+
+    with metrics.stage('dedup'):
+        for opp_data in batch:
+            opp_data.canonical_url = canonicalize_url(opp_data.source_url)
+        urls = {opp_data.canonical_url for opp_data in batch}
+        existing = {o.canonical_url: o for o in Opportunity.objects.filter(canonical_url__in=urls)}
+        aliased = set(OpportunityAlias.objects.filter(url__in=urls).values_list('url', flat=True))
+
+        # Near-duplicates within this batch are caught here; earlier batches
+        # are already in the database, where find_near_duplicate finds them.
+        # Either way only postings of the same university are candidates.
+        batch_bands = defaultdict(list)  # (university, band no., value) -> [(index into pending, simhash)]
+        batch_urls = set()
+        pending = []                     # (opp_data, fields, existing row or None)
+        pending_aliases = []             # (url, index into pending of the original, distance)
+        stored_aliases = []              # (url, id of a stored opportunity, distance)
+        for opp_data in batch:
+            url = opp_data.canonical_url
+            fingerprint = fingerprint_fields(opp_data.title, opp_data.description)
+            row = existing.get(url)
+            duplicate = url in aliased or url in batch_urls
+            value = to_unsigned(fingerprint['simhash'])
+            if row is None and not duplicate:
+                match = _batch_near_duplicate(batch_bands, opp_data.university, value, MAX_HAMMING_DISTANCE)
+                if match:
+                    pending_aliases.append((url, *match))
+                else:
+                    match = find_near_duplicate(opp_data.title, opp_data.description, university=opp_data.university)
+                    if match:
+                        stored_aliases.append((url, *match))
+                duplicate = bool(match)
+
+            # Skip if URL already exists (change detection)
+            if duplicate or (row and not update_existing):
+                metrics.duplicates_skipped += 1
+                continue
+
+            fields = {
+                'title': opp_data.title[:300],
+                'university': opp_data.university,
+                'domain': opp_data.domain,
+                'opportunity_type': opp_data.opportunity_type,
+                'description': opp_data.description,
+                'location': opp_data.location,
+                **fingerprint,
+            }
+            if opp_data.domain and opp_data.model_version:
+                # Classified upstream (reextract workers) together with its confidence
+                fields.update(domain_confidence=opp_data.domain_confidence,
+                              domain_scores=opp_data.domain_scores or {}, model_version=opp_data.model_version)
+            if row is None:
+                for band in enumerate(bands(value)):
+                    batch_bands[(opp_data.university, *band)].append((len(pending), value))
+            batch_urls.add(url)
+            pending.append((opp_data, fields, row))
+
+    # Classify domain using AI classifier — one call for the whole batch.
+    # The confidence and model version are stored with it (see reclassify.py).
+    unclassified = [fields for _, fields, _ in pending if not fields['domain']]
+    if unclassified:
+        with metrics.stage('classify'):
+            predictions = predict_domains([f['description'] + ' ' + f['title'] for f in unclassified])
+            version = model_version()
+        for fields, (domain, scores) in zip(unclassified, predictions):
+            fields.update(domain=intern_choice(domain), domain_confidence=scores.get(domain),
+                          domain_scores=top_scores(scores), model_version=version if scores else '')
+        metrics.classifier_calls += len(unclassified)
+
+    # Rows and their change-feed entries commit together (see changefeed.py)
+    with metrics.stage('write'), transaction.atomic():
+        OpportunityAlias.objects.bulk_create([
+            OpportunityAlias(url=url, opportunity_id=opportunity_id, distance=distance)
+            for url, opportunity_id, distance in stored_aliases
+        ], ignore_conflicts=True)
+        new_rows = {}
+        for index, (opp_data, fields, row) in enumerate(pending):
+            if row is None:
+                # The link users follow stays as scraped; dedup works on the canonical form
+                new_rows[index] = Opportunity(source_url=opp_data.source_url, canonical_url=opp_data.canonical_url,
+                                              is_active=True, **fields)
+                continue
+            if row.domain_source == 'ADMIN':
+                # A staff-verified domain outranks the classifier
+                for name in ('domain', 'domain_confidence', 'domain_scores', 'model_version'):
+                    fields.pop(name, None)
+            if row.enriched_at:
+                # The detail page's description and location outrank the listing's stub
+                for name in LISTING_FIELDS:
+                    fields.pop(name, None)
+            changed = [name for name, value in fields.items() if getattr(row, name) != value]
+            if changed:
+                for name in changed:
+                    setattr(row, name, fields[name])
+                row.save(update_fields=changed + ['updated_at'])
+                publish([row.pk], 'UPDATED', changed)
+                stats['updated'] += 1
+
+        if new_rows:
+            created = Opportunity.objects.bulk_create(new_rows.values())
+            stats['new'] += len(created)
+            stats['new_ids'].extend(opp.pk for opp in created)
+            publish([opp.pk for opp in created], 'CREATED')
+            replace_labels({opp.pk: labels_for(opp.domain, opp.domain_scores) for opp in created})
+            OpportunityAlias.objects.bulk_create([
+                OpportunityAlias(url=url, opportunity_id=new_rows[index].pk, distance=distance)
+                for url, index, distance in pending_aliases
+            ], ignore_conflicts=True)
+
+        # One batched UPDATE keeps re-seen postings out of the stale sweep.
+        # Replayed snapshots say nothing about what the site lists today.
+        if live:
+            from apps.opportunities.expiry import mark_seen
+            mark_seen(urls)
+
+
+def _batch_near_duplicate(batch_bands, university, value, max_distance):
+    """(index, distance) of a new row of this university earlier in the batch whose simhash is within max_distance."""
+    from apps.opportunities.dedup import bands, hamming_distance
+
+    for band in enumerate(bands(value)):
+        for index, other in batch_bands.get((university, *band), ()):
+            distance = hamming_distance(value, other)
+            if distance <= max_distance:
+                return index, distance
+    return None
+
+
 def run_scraper(university_key: str) -> dict:
     """
     Run one university scraper, classify domains, save to DB.
+    Per-stage timings and fetch volumes are recorded on the ScrapingLog.
     Returns stats dict.
     """
-    from apps.opportunities.models import Opportunity, ScrapingLog
-    from apps.opportunities.classifier import classify_domain
+    from django.conf import settings
+    from apps.opportunities.models import ScrapingLog
 
     log = ScrapingLog.objects.create(university=university_key, status='RUNNING')
     stats = {'found': 0, 'new': 0, 'errors': 0}
+    metrics = ScrapeMetrics()
 
     try:
         scraper_fn = SCRAPERS.get(university_key)
         if not scraper_fn:
             raise ValueError(f"No scraper for university: {university_key}")
 
-        raw_opportunities = scraper_fn()
-        stats['found'] = len(raw_opportunities)
+        fingerprint = ListingFingerprint()
 
-        for opp_data in raw_opportunities:
-            # Skip if URL already exists (change detection)
-            if Opportunity.objects.filter(source_url=opp_data['source_url']).exists():
-                continue
+        def counted(items):
+            for opp in items:
+                stats['found'] += 1
+                fingerprint.add(opp)
+                yield opp
 
-            # Classify domain using AI classifier
-            domain = classify_domain(opp_data.get('description', '') + ' ' + opp_data.get('title', ''))
-
-            Opportunity.objects.create(
-                title=opp_data['title'][:300],
-                university=opp_data['university'],
-                domain=domain,
-                opportunity_type=opp_data.get('opportunity_type', 'OTHER'),
-                description=opp_data.get('description', ''),
-                source_url=opp_data['source_url'],
-                location=opp_data.get('location', 'Remote'),
-                is_active=True,
-            )
-            stats['new'] += 1
+        # Items stream from the parser straight into batched classify/write
+        saved = save_opportunities(counted(scraper_fn(metrics)), metrics=metrics, live=True)
+        if metrics.fetches and all(not f['status'] or f['status'] >= 400 for f in metrics.fetches):
+            raise RuntimeError(f"All {len(metrics.fetches)} source pages failed to load")
+        logger.info(f"{university_key} scraper found {stats['found']} opportunities")
+        log.listing_fingerprint = fingerprint.hexdigest()
+        stats['new'] = saved['new']
+
+        # Detail pages are fetched for new rows only, off the scrape's critical path
+        if saved['new_ids'] and getattr(settings, 'SCRAPER_ENRICH_DETAILS', False):
+            from apps.opportunities.tasks import enrich_opportunities_task
+            enrich_opportunities_task.delay(saved['new_ids'])
 
         log.opportunities_found = stats['found']
         log.new_opportunities = stats['new']
@@ -295,7 +610,15 @@ def run_scraper(university_key: str) -> dict:
 
     finally:
         from django.utils import timezone
+        metrics.apply_to(log)
         log.finished_at = timezone.now()
         log.save()
 
+    # Feed the per-source circuit breaker (health.py)
+    from apps.opportunities.health import record_success, record_failure
+    if log.status == 'SUCCESS':
+        record_success(university_key)
+    elif university_key in SOURCES:
+        record_failure(university_key, log.error_message)
+
     return stats
@@ -0,0 +1,115 @@
+"""
+Content-addressed store for raw scraped HTML.
+
+Every page the scraper fetches is gzip-compressed and written to disk under
+its SHA-256 hash, so a page that hasn't changed between sweeps is stored only
+once. The PageSnapshot table indexes each fetch by URL and time.
+
+This lets us fix a parser in scraper.py and re-run it over everything we have
+already downloaded (python manage.py reextract) without touching the network.
+
+Layout on disk:
+    SNAPSHOT_ROOT/ab/cd/abcd1234....html.gz
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+def get_snapshot_root() -> Path:
+    return Path(getattr(settings, 'SNAPSHOT_ROOT', settings.BASE_DIR / 'snapshots'))
+
+
+def blob_path(content_hash: str, root=None) -> Path:
+    """Where the compressed blob for a given hash lives."""
+    root = Path(root) if root else get_snapshot_root()
+    return root / content_hash[:2] / content_hash[2:4] / f"{content_hash}.html.gz"
+
+
+def write_blob(content: bytes) -> str:
+    """
+    Store raw page bytes, skipping the write if the hash already exists.
+    Writes go to a temp file first so readers never see a partial blob.
+    Returns the content hash.
+    """
+    content_hash = hashlib.sha256(content).hexdigest()
+    path = blob_path(content_hash)
+    if path.exists():
+        return content_hash
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as gz:
+            gz.write(content)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return content_hash
+
+
+def read_blob(path, encoding='') -> str:
+    """Decompress a stored blob back into HTML text."""
+    with gzip.open(path, 'rb') as f:
+        content = f.read()
+    return content.decode(encoding or 'utf-8', errors='replace')
+
+
+def save_snapshot(url, content: bytes, university='', status_code=200, encoding=''):
+    """
+    Record one fetched page. Never raises — a full disk or a DB hiccup
+    must not break the scrape itself.
+    """
+    if not getattr(settings, 'SCRAPER_SNAPSHOTS_ENABLED', True):
+        return None
+
+    from apps.opportunities.models import PageSnapshot
+    try:
+        content_hash = write_blob(content)
+        return PageSnapshot.objects.create(
+            url=url,
+            university=university,
+            content_hash=content_hash,
+            encoding=encoding,
+            size=len(content),
+            status_code=status_code,
+        )
+    except Exception as e:
+        logger.warning(f"Could not snapshot {url}: {e}")
+        return None
+
+
+def load_snapshot(snapshot) -> str:
+    """Return the HTML for a PageSnapshot row."""
+    return read_blob(blob_path(snapshot.content_hash), snapshot.encoding)
+
+
+def latest_snapshots(university=None, since=None):
+    """
+    Yield the most recent snapshot for each URL, optionally limited to one
+    university or to fetches after a given datetime.
+    """
+    from apps.opportunities.models import PageSnapshot
+
+    qs = PageSnapshot.objects.all()
+    if university:
+        qs = qs.filter(university=university)
+    if since:
+        qs = qs.filter(fetched_at__gte=since)
+
+    last_url = None
+    for snapshot in qs.order_by('url', '-fetched_at').iterator(chunk_size=500):
+        if snapshot.url == last_url:
+            continue
+        last_url = snapshot.url
+        yield snapshot
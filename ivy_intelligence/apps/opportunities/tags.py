@@ -0,0 +1,129 @@
+"""
+Opportunity tags, normalized into Tag (one row per distinct slug) and the
+OpportunityTag through table.
+
+Tags arrive as comma-separated text (seed data, imports); parse_tags()
+splits and cleans them and set_tags() links them, creating any Tag rows
+it has not seen. "Machine Learning" and "machine-learning" share the slug
+machine-learning and so one Tag. Filtering by tag (with_tags) and facet
+counts (tag_counts) join through the unique (tag, opportunity) index
+rather than scanning text, and match whole tags only.
+
+Tags are versioned in the database, not in the cache (which may be a
+per-process LocMem): set_tags() bumps the updated_at of the opportunities
+it relinks — the admin inline saves the opportunity anyway — and Tag has
+its own updated_at for renames. The JSON API's ETag and the tag cloud key
+both read those two indexed maxima, so every worker agrees on when tags
+changed. The cloud of the whole active catalogue is the same for
+everyone, so tag_cloud() caches it under that version for
+TAG_CLOUD_CACHE_SECONDS in the default cache.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.utils import timezone
+from django.utils.text import slugify
+
+CLOUD_CACHE_KEY = 'opportunities:tag-cloud'
+DEFAULT_CLOUD_CACHE_SECONDS = 300
+DEFAULT_CLOUD_SIZE = 30
+MAX_NAME_LENGTH = 60
+
+
+def tag_slug(name: str) -> str:
+    return slugify(name, allow_unicode=True)[:80]
+
+
+def parse_tags(value) -> list:
+    """'AI, Machine Learning, ai' → ['AI', 'Machine Learning']: cleaned names, one per slug, in order."""
+    names = {}
+    for name in (value or '').split(','):
+        name = ' '.join(name.split())[:MAX_NAME_LENGTH]
+        slug = tag_slug(name)
+        if slug and slug not in names:
+            names[slug] = name
+    return list(names.values())
+
+
+def get_or_create_tags(names) -> dict:
+    """{slug: Tag} for these names; new tags are inserted in one statement."""
+    from apps.opportunities.models import Tag
+
+    wanted = {tag_slug(name): name for name in names}
+    wanted.pop('', None)
+    if not wanted:
+        return {}
+    Tag.objects.bulk_create([Tag(name=name, slug=slug) for slug, name in wanted.items()], ignore_conflicts=True)
+    return {tag.slug: tag for tag in Tag.objects.filter(slug__in=list(wanted))}
+
+
+def set_tags(tagged: dict) -> int:
+    """Make {opportunity_id: [tag names]} the tags of those opportunities. Returns links written."""
+    from apps.opportunities.models import OpportunityTag
+
+    if not tagged:
+        return 0
+    touch(tagged)
+    tags = get_or_create_tags({name for names in tagged.values() for name in names})
+    OpportunityTag.objects.filter(opportunity_id__in=list(tagged)).delete()
+    # dict keys: unique links, in the order the names were given
+    links = dict.fromkeys(
+        (pk, tags[tag_slug(name)].pk)
+        for pk, names in tagged.items()
+        for name in names if tag_slug(name) in tags
+    )
+    return len(OpportunityTag.objects.bulk_create(
+        [OpportunityTag(opportunity_id=pk, tag_id=tag_id) for pk, tag_id in links], batch_size=1000,
+    ))
+
+
+def touch(opportunity_ids):
+    """Bump updated_at on opportunities whose tags changed, for ETags, export ?since= and the cloud."""
+    from apps.opportunities.models import Opportunity
+    Opportunity.objects.filter(pk__in=list(opportunity_ids)).update(updated_at=timezone.now())
+
+
+def tagged(slugs):
+    """Subquery of the ids of opportunities carrying any of these tags."""
+    from apps.opportunities.models import OpportunityTag
+    return OpportunityTag.objects.filter(tag__slug__in=list(slugs)).values('opportunity_id')
+
+
+def with_tags(queryset, slugs):
+    """Opportunities in queryset tagged with any of these slugs."""
+    return queryset.filter(pk__in=tagged(slugs))
+
+
+def tag_counts(queryset, limit=DEFAULT_CLOUD_SIZE) -> list:
+    """[{'name', 'slug', 'count'}, ...] over the opportunities in queryset, most used first."""
+    from apps.opportunities.models import Tag
+
+    rows = (
+        Tag.objects.filter(opportunity_links__opportunity__in=queryset.order_by().values('pk'))
+        .annotate(count=Count('opportunity_links'))
+        .order_by('-count', 'name')
+        .values('name', 'slug', 'count')
+    )
+    return list(rows[:limit])
+
+
+def tags_version() -> str:
+    """Latest tag rename or creation; relinking shows in Opportunity.updated_at instead (see touch())."""
+    from apps.opportunities.models import Tag
+
+    latest = Tag.objects.aggregate(latest=Max('updated_at'))['latest']
+    return latest.isoformat() if latest else '-'
+
+
+def tag_cloud(limit=DEFAULT_CLOUD_SIZE) -> list:
+    """tag_counts() of the active catalogue, cached until tags or opportunities change."""
+    from apps.opportunities.models import Opportunity
+
+    latest = Opportunity.objects.aggregate(latest=Max('updated_at'))['latest']
+    key = f"{CLOUD_CACHE_KEY}:{latest.isoformat() if latest else '-'}:{tags_version()}:{limit}"
+    cloud = cache.get(key)
+    if cloud is None:
+        cloud = tag_counts(Opportunity.objects.filter(is_active=True), limit)
+        cache.set(key, cloud, getattr(settings, 'TAG_CLOUD_CACHE_SECONDS', DEFAULT_CLOUD_CACHE_SECONDS))
+    return cloud
@@ -16,22 +16,48 @@ def scrape_university(self, university_key: str):
     """
     Scrape a single university's opportunities.
     Retries up to 3 times on failure (with 5-minute delay).
+    Skipped entirely while the source's circuit breaker is open.
     """
     try:
+        from apps.opportunities.health import allow_scrape
+        if not allow_scrape(university_key):
+            logger.info(f"Skipping {university_key}: circuit open")
+            return {'skipped': 'circuit open'}
+
         from apps.opportunities.scraper import run_scraper
         stats = run_scraper(university_key)
         logger.info(f"Scraped {university_key}: {stats}")
+
+        if stats['new']:
+            # Wait out the change feed's settle window so this sweep's rows are visible
+            from django.conf import settings
+            send_opportunity_digests.apply_async(countdown=getattr(settings, 'CHANGE_FEED_SETTLE_SECONDS', 5) + 1)
         return stats
     except Exception as exc:
         logger.error(f"Task failed for {university_key}: {exc}")
         raise self.retry(exc=exc)
 
 
+@shared_task
+def scrape_due_universities():
+    """
+    Adaptive scheduler tick: scrape only the universities whose learned
+    interval has elapsed (see scheduling.py). Called by Celery Beat every 30 minutes.
+    """
+    from apps.opportunities.scheduling import due_universities
+    due = due_universities()
+    for university_key, interval in due.items():
+        scrape_university.delay(university_key)
+        logger.info(f"Scheduling {university_key} (interval {interval})")
+    return {key: interval.total_seconds() / 3600 for key, interval in due.items()}
+
+
 @shared_task
 def scrape_all_universities():
     """
     Master task: kicks off scraping for all supported universities.
-    Called by Celery Beat every 6 hours.
+    Used by the manual "Trigger Scrape" button; periodic scraping goes
+    through scrape_due_universities instead.
     """
     from apps.opportunities.scraper import SCRAPERS
     results = {}
@@ -42,12 +68,108 @@ def scrape_all_universities():
     return results
 
 
+@shared_task
+def enrich_opportunities_task(opportunity_ids):
+    """
+    Fetch detail pages for newly inserted opportunities and fill in
+    description, deadline, stipend and location.
+    Queued by run_scraper when SCRAPER_ENRICH_DETAILS is on.
+    """
+    from apps.opportunities.enrichment import enrich_opportunities
+    return enrich_opportunities(opportunity_ids)
+
+
+@shared_task
+def expire_opportunities():
+    """
+    Deactivate past-deadline and no-longer-listed opportunities.
+    Runs daily via Celery Beat.
+    """
+    from apps.opportunities.expiry import sweep
+    return sweep()
+
+
+@shared_task
+def percolate_saved_searches():
+    """
+    Match newly ingested opportunities against students' saved searches.
+    Reads the change feed; runs every 5 minutes via Celery Beat.
+    """
+    from apps.opportunities.percolation import run
+    return {'changes': run()}
+
+
+@shared_task
+def send_opportunity_digests():
+    """
+    Email each subscribed student one digest of the new opportunities in
+    their domains. Queued by scrape_university after a sweep with new rows.
+    """
+    from apps.opportunities.digests import run
+    return {'changes': run()}
+
+
+@shared_task
+def prune_change_feed():
+    """
+    Drop change-feed rows older than CHANGE_FEED_RETENTION_DAYS.
+    Runs daily via Celery Beat.
+    """
+    from apps.opportunities.changefeed import prune
+    return {'deleted': prune()}
+
+
+@shared_task
+def backfill_domain_confidence(chunk_size: int = 500):
+    """
+    Store classifier confidence and model version on opportunities that
+    predate them. Run once after migrating; safe to re-run.
+    """
+    from apps.opportunities.reclassify import backfill_confidence
+    return {'updated': backfill_confidence(chunk_size=chunk_size)}
+
+
+@shared_task
+def train_classifier_from_corrections():
+    """
+    Fold domains verified by staff since the last run into the classifier
+    (partial_fit on the hashing backend). Runs nightly via Celery Beat.
+    """
+    from apps.opportunities.classifier import current_backend
+    from apps.opportunities import training
+    if current_backend() != 'hashing':
+        return {'skipped': "incremental training needs CLASSIFIER_BACKEND='hashing'"}
+    return {'changes': training.run()}
+
+
+@shared_task
+def refit_classifier():
+    """Retrain from scratch on the seed data plus every staff-verified label, then re-label."""
+    from apps.opportunities.training import refit
+    used = refit()
+    reclassify_opportunities.delay()
+    return {'verified_labels': used}
+
+
+@shared_task
+def reclassify_opportunities(stale_only: bool = True, chunk_size: int = 2000):
+    """
+    Re-label stored opportunities with the current classifier. Every scanned
+    row is stamped with the current model version; only rows whose domain
+    changed get a change-feed entry. Queued by train_classifier_task.
+    """
+    from apps.opportunities.reclassify import reclassify
+    return reclassify(chunk_size=chunk_size, stale_only=stale_only)
+
+
 @shared_task
 def train_classifier_task():
     """
-    Re-train the domain classifier.
+    Re-train the domain classifier, then re-label existing opportunities.
     Can be triggered manually from admin or scheduled monthly.
     """
     from apps.opportunities.classifier import train_model
     success = train_model()
+    if success:
+        reclassify_opportunities.delay()
     return {'success': success}
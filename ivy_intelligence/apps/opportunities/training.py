@@ -0,0 +1,89 @@
+"""
+Training the domain classifier from staff-verified labels.
+
+When staff change an opportunity's domain in the admin (or confirm it with
+the "Verify domain" action) the row is marked domain_source='ADMIN' and
+the edit goes out on the change feed. The nightly job reads only those new
+corrections from its checkpoint and folds them into the hashing-backend
+model with partial_fit, so its cost follows the number of new labels, not
+the size of the table. refit() rebuilds from TRAINING_DATA plus every
+verified row, streamed in keyset chunks, for the TF-IDF backend (which
+cannot learn incrementally) or to start over.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+CONSUMER = 'classifier-training'
+CHUNK_SIZE = 1000
+TRAINING_FIELDS = {'domain', 'domain_source'}
+
+
+def training_text(opp) -> str:
+    """Same text the scraper classifies (see reclassify.classifier_text)."""
+    return f"{opp.description} {opp.title}"
+
+
+def verified_chunks(chunk_size=CHUNK_SIZE):
+    """Lists of (text, domain) for every staff-verified opportunity, one short query per chunk."""
+    from apps.opportunities.models import Opportunity
+
+    queryset = Opportunity.objects.filter(domain_source='ADMIN').only('id', 'title', 'description', 'domain')
+    last_pk = 0
+    while True:
+        rows = list(queryset.filter(pk__gt=last_pk).order_by('pk')[:chunk_size])
+        if not rows:
+            return
+        last_pk = rows[-1].pk
+        yield [(training_text(row), row.domain) for row in rows]
+
+
+def handle_changes(changes) -> int:
+    """Change-feed handler: partial_fit on the rows whose domain staff set or confirmed in this batch."""
+    from apps.opportunities.models import Opportunity
+    from apps.opportunities.classifier import partial_train
+
+    ids = {c.opportunity_id for c in changes if c.kind == 'CREATED' or TRAINING_FIELDS & set(c.changed_fields or ())}
+    if not ids:
+        return 0
+    rows = Opportunity.objects.filter(pk__in=ids, domain_source='ADMIN').only('id', 'title', 'description', 'domain')
+    samples = [(training_text(row), row.domain) for row in rows]
+    if samples and not partial_train(samples):
+        raise RuntimeError("Incremental training needs CLASSIFIER_BACKEND='hashing'")
+    return len(samples)
+
+
+def run(batch_size=5000) -> int:
+    """Fold new corrections into the model. Returns changes consumed."""
+    from apps.opportunities.changefeed import consume
+    return consume(CONSUMER, handle_changes, batch_size=batch_size)
+
+
+def refit(chunk_size=CHUNK_SIZE) -> int:
+    """
+    Retrain from scratch on TRAINING_DATA plus all verified rows, and move
+    the feed checkpoint to now. Returns the number of verified rows used.
+    """
+    from apps.opportunities.models import OpportunityChange
+    from apps.opportunities.changefeed import acknowledge
+    from apps.opportunities.classifier import current_backend, partial_train, train_model
+
+    # Corrections made while this runs are folded in again by the next run()
+    start = OpportunityChange.objects.order_by('-pk').values_list('pk', flat=True).first() or 0
+    used = 0
+    if current_backend() == 'hashing':
+        if not train_model():
+            raise RuntimeError("Classifier training failed")
+        for samples in verified_chunks(chunk_size):
+            partial_train(samples)
+            used += len(samples)
+    else:
+        # TF-IDF learns its vocabulary from the whole set at once
+        samples = [sample for chunk in verified_chunks(chunk_size) for sample in chunk]
+        if not train_model(extra=samples):
+            raise RuntimeError("Classifier training failed")
+        used = len(samples)
+    acknowledge(CONSUMER, start)
+    logger.info(f"Domain classifier refitted with {used} verified labels")
+    return used
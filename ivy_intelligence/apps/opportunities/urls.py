@@ -7,5 +7,10 @@ urlpatterns = [
     path('opportunities/', views.opportunity_list, name='opportunity_list'),
     path('opportunities/<int:pk>/', views.opportunity_detail, name='opportunity_detail'),
     path('opportunities/scrape/', views.trigger_scrape, name='trigger_scrape'),
+    path('saved-searches/', views.save_search, name='save_search'),
+    path('saved-searches/<int:pk>/delete/', views.delete_saved_search, name='delete_saved_search'),
+    path('saved-searches/seen/', views.mark_matches_seen, name='mark_matches_seen'),
     path('api/opportunities/', views.api_opportunities, name='api_opportunities'),
+    path('api/opportunities/export/', views.api_export_opportunities, name='api_export_opportunities'),
+    path('api/scraping-stats/', views.api_scraping_stats, name='api_scraping_stats'),
 ]
@@ -1,11 +1,17 @@
+import hashlib
+
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
-from django.db.models import Q
+from django.db.models import Count, Max, Q
+from django.urls import reverse
 from django.contrib import messages
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.core.paginator import Paginator
+from django.views.decorators.http import condition
 
-from .models import Opportunity, ScrapingLog, DOMAIN_CHOICES, OPPORTUNITY_TYPES
+from .models import Opportunity, ScrapingLog, SavedSearch, SavedSearchMatch, DOMAIN_CHOICES, OPPORTUNITY_TYPES
+from .labels import in_domains
+from .tags import tag_counts, tag_cloud, tag_slug, tagged, with_tags
 
 
 def home(request):
@@ -41,19 +47,19 @@ def dashboard(request):
         no_domains_set = True
         opportunities = Opportunity.objects.none()
     else:
-        opportunities = Opportunity.objects.filter(is_active=True).filter(domain__in=domains)
+        opportunities = in_domains(Opportunity.objects.filter(is_active=True), domains)
 
     # Search
     q = request.GET.get('q', '')
     if q:
         opportunities = opportunities.filter(
-            Q(title__icontains=q) | Q(description__icontains=q) | Q(tags__icontains=q)
+            Q(title__icontains=q) | Q(description__icontains=q) | Q(pk__in=tagged([tag_slug(q)]))
         )
 
     # Domain filter from URL
     domain_filter = request.GET.get('domain', '')
     if domain_filter:
-        opportunities = opportunities.filter(domain=domain_filter)
+        opportunities = in_domains(opportunities, [domain_filter])
 
     # Type filter
     type_filter = request.GET.get('type', '')
@@ -69,6 +75,14 @@ def dashboard(request):
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
 
+    # "New for you": postings matched to saved searches since the last visit
+    new_for_you = SavedSearchMatch.objects.filter(
+        user=request.user, seen=False, opportunity__is_active=True
+    ).select_related('opportunity', 'saved_search')[:6]
+    saved_searches = request.user.saved_searches.annotate(
+        unseen=Count('matches', filter=Q(matches__seen=False))
+    )
+
     return render(request, 'opportunities/dashboard.html', {
         'page_obj': page_obj,
         'domain_choices': DOMAIN_CHOICES,
@@ -78,9 +92,50 @@ def dashboard(request):
         'type_filter': type_filter,
         'user_domains': domains,
         'no_domains_set': no_domains_set,
+        'uni_filter': uni_filter,
+        'new_for_you': new_for_you,
+        'saved_searches': saved_searches,
     })
 
 
+@login_required
+def save_search(request):
+    """Save the dashboard's current filters. POST only."""
+    if request.method == 'POST':
+        search = SavedSearch(
+            user=request.user,
+            q=request.POST.get('q', '').strip()[:200],
+            domain=request.POST.get('domain', ''),
+            opportunity_type=request.POST.get('type', ''),
+            university=request.POST.get('university', ''),
+        )
+        if not (search.q or search.domain or search.opportunity_type or search.university):
+            messages.error(request, "Add a search term or filter before saving.")
+        else:
+            search.name = request.POST.get('name', '').strip()[:100] or search.describe()[:100]
+            search.save()
+            messages.success(request, "Search saved — new matches will appear under \"New for you\".")
+        return redirect(f"{reverse('dashboard')}?{search.query_string()}")
+    return redirect('dashboard')
+
+
+@login_required
+def delete_saved_search(request, pk):
+    """Remove one of the user's saved searches. POST only."""
+    if request.method == 'POST':
+        get_object_or_404(SavedSearch, pk=pk, user=request.user).delete()
+        messages.success(request, "Saved search removed.")
+    return redirect('dashboard')
+
+
+@login_required
+def mark_matches_seen(request):
+    """Clear the "New for you" list. POST only."""
+    if request.method == 'POST':
+        SavedSearchMatch.objects.filter(user=request.user, seen=False).update(seen=True)
+    return redirect('dashboard')
+
+
 def opportunity_list(request):
     """Public listing of all opportunities with filters."""
     opportunities = Opportunity.objects.filter(is_active=True)
@@ -93,12 +148,20 @@ def opportunity_list(request):
 
     domain_filter = request.GET.get('domain', '')
     if domain_filter:
-        opportunities = opportunities.filter(domain=domain_filter)
+        opportunities = in_domains(opportunities, [domain_filter])
 
     type_filter = request.GET.get('type', '')
     if type_filter:
         opportunities = opportunities.filter(opportunity_type=type_filter)
 
+    tag_filter = request.GET.get('tag', '')
+    if tag_filter:
+        opportunities = with_tags(opportunities, [tag_filter])
+
+    # Tag facets: counted over the filtered results, or the cached cloud when unfiltered
+    filtered = q or domain_filter or type_filter or tag_filter
+    tag_facets = tag_counts(opportunities, 20) if filtered else tag_cloud(20)
+
     paginator = Paginator(opportunities, 15)
     page_obj = paginator.get_page(request.GET.get('page'))
 
@@ -109,12 +172,14 @@ def opportunity_list(request):
         'q': q,
         'domain_filter': domain_filter,
         'type_filter': type_filter,
+        'tag_filter': tag_filter,
+        'tag_facets': tag_facets,
     })
 
 
 def opportunity_detail(request, pk):
     """Full detail page for a single opportunity."""
-    opportunity = get_object_or_404(Opportunity, pk=pk)
+    opportunity = get_object_or_404(Opportunity.objects.prefetch_related('tags'), pk=pk)
     similar = Opportunity.objects.filter(
         domain=opportunity.domain,
         is_active=True
@@ -129,6 +194,7 @@ def opportunity_detail(request, pk):
 
     return render(request, 'opportunities/detail.html', {
         'opportunity': opportunity,
+        'also_in': opportunity.domain_labels.exclude(domain=opportunity.domain),
         'similar': similar,
         'user_applied': user_applied,
     })
@@ -149,10 +215,90 @@ def trigger_scrape(request):
     return redirect('dashboard')
 
 
+API_FIELDS = ('id', 'title', 'university', 'domain', 'opportunity_type', 'deadline', 'source_url', 'location', 'scraped_at')
+
+
+def _opportunities_etag(request):
+    """
+    Version of the opportunity table: every write path bumps updated_at
+    (indexed, and set_tags() bumps it too), and the active count catches
+    deletions. Tag renames don't touch the rows, so Tag.updated_at is
+    read as well (tags.py). A few index lookups instead of building the
+    payload.
+    """
+    from .tags import tags_version
+
+    latest = Opportunity.objects.aggregate(latest=Max('updated_at'))['latest']
+    active = Opportunity.objects.filter(is_active=True).count()
+    version = f"{latest.isoformat() if latest else '-'}:{active}:{tags_version()}:{request.GET.get('fields', '')}"
+    return hashlib.md5(version.encode()).hexdigest()
+
+
+@condition(etag_func=_opportunities_etag)
 def api_opportunities(request):
-    """REST API endpoint returning opportunities as JSON."""
-    opportunities = Opportunity.objects.filter(is_active=True).values(
-        'id', 'title', 'university', 'domain', 'opportunity_type',
-        'deadline', 'source_url', 'location', 'scraped_at'
-    )[:50]
-    return JsonResponse({'results': list(opportunities)})
+    """
+    REST API endpoint returning opportunities as JSON.
+    `fields=title,deadline` narrows the columns; unchanged data answers If-None-Match with a 304.
+    """
+    from .export import EXPORT_FIELDS, fill_tags, parse_fields
+
+    try:
+        fields = parse_fields(request.GET.get('fields'), default=API_FIELDS, allowed=EXPORT_FIELDS)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    # tags is many-to-many: .values() would give one row per tag, so names are filled in per page
+    columns = [f for f in fields if f != 'tags']
+    opportunities = list(Opportunity.objects.filter(is_active=True).values(*columns)[:50])
+    return JsonResponse({'results': fill_tags(opportunities, fields)})
+
+
+def api_export_opportunities(request):
+    """
+    Stream the full active catalogue as NDJSON (default) or CSV.
+    Query params: format=ndjson|csv, fields=title,deadline,..., since=<ISO date/datetime on updated_at>.
+    The body is gzip-encoded when the client sends Accept-Encoding: gzip.
+    """
+    from .export import FORMATS, CONTENT_TYPES, parse_fields, parse_since, export_chunks, gzip_chunks
+
+    fmt = request.GET.get('format', 'ndjson')
+    if fmt not in FORMATS:
+        return JsonResponse({'error': f"format must be one of: {', '.join(FORMATS)}"}, status=400)
+    try:
+        fields = parse_fields(request.GET.get('fields'))
+        since = parse_since(request.GET.get('since'))
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    chunks = export_chunks(fmt, fields, since=since)
+    compress = 'gzip' in request.headers.get('Accept-Encoding', '')
+    response = StreamingHttpResponse(
+        gzip_chunks(chunks) if compress else (chunk.encode('utf-8') for chunk in chunks),
+        content_type=f'{CONTENT_TYPES[fmt]}; charset=utf-8',
+    )
+    if compress:
+        response['Content-Encoding'] = 'gzip'
+    response['Vary'] = 'Accept-Encoding'
+    response['Content-Disposition'] = f'attachment; filename="opportunities.{fmt}"'
+    return response
+
+
+@login_required
+def api_scraping_stats(request):
+    """Staff-only JSON: p50/p95 scrape timings per university, by day."""
+    if not request.user.is_staff:
+        return JsonResponse({'error': 'Staff only'}, status=403)
+
+    from .monitoring import scraping_stats
+    from .health import health_summary
+    from .classifier import cache_stats, load_stats
+    try:
+        days = min(int(request.GET.get('days', 30)), 365)
+    except ValueError:
+        days = 30
+    return JsonResponse({
+        'days': days,
+        'universities': scraping_stats(days=days, university=request.GET.get('university') or None),
+        'health': health_summary(),
+        'classifier_cache': cache_stats(),
+        'classifier_model': load_stats(),
+    })
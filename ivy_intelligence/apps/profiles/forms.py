@@ -3,6 +3,7 @@ from django.contrib.auth.models import User
 from crispy_forms.helper import FormHelper
 from crispy_forms.layout import Layout, Submit, Row, Column, Field
 from .models import StudentProfile, DOMAIN_CHOICES
+from apps.opportunities.models import OPPORTUNITY_TYPES
 
 
 class ProfileUpdateForm(forms.ModelForm):
@@ -15,6 +16,14 @@ class ProfileUpdateForm(forms.ModelForm):
         help_text="Select all domains you are interested in."
     )
 
+    types_of_interest = forms.MultipleChoiceField(
+        choices=OPPORTUNITY_TYPES,
+        widget=forms.CheckboxSelectMultiple,
+        required=False,
+        label="Opportunity types for email digests",
+        help_text="Leave empty to hear about every type."
+    )
+
     skills_input = forms.CharField(
         max_length=500,
         required=False,
@@ -27,7 +36,7 @@ class ProfileUpdateForm(forms.ModelForm):
         model = StudentProfile
         fields = [
             'bio', 'avatar', 'university', 'year_of_study',
-            'cgpa', 'resume', 'linkedin_url', 'github_url',
+            'cgpa', 'resume', 'linkedin_url', 'github_url', 'email_digest',
         ]
         widgets = {
             'bio': forms.Textarea(attrs={'rows': 3, 'placeholder': 'Tell us about yourself...'}),
@@ -37,6 +46,8 @@ class ProfileUpdateForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
         if self.instance and self.instance.domains_of_interest:
             self.fields['domains_of_interest'].initial = self.instance.domains_of_interest
+        if self.instance and self.instance.types_of_interest:
+            self.fields['types_of_interest'].initial = self.instance.types_of_interest
         if self.instance and self.instance.skills:
             self.fields['skills_input'].initial = ', '.join(self.instance.skills)
 
@@ -51,6 +62,8 @@ class ProfileUpdateForm(forms.ModelForm):
             ),
             Field('skills_input'),
             Field('domains_of_interest'),
+            Field('email_digest'),
+            Field('types_of_interest'),
             Row(
                 Column('linkedin_url', css_class='col-md-6'),
                 Column('github_url', css_class='col-md-6'),
@@ -66,6 +79,7 @@ class ProfileUpdateForm(forms.ModelForm):
         instance.skills = [s.strip() for s in skills_str.split(',') if s.strip()]
         # Save domain choices as list
         instance.domains_of_interest = self.cleaned_data.get('domains_of_interest', [])
+        instance.types_of_interest = self.cleaned_data.get('types_of_interest', [])
         if commit:
             instance.save()
         return instance
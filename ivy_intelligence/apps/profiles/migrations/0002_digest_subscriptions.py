@@ -0,0 +1,58 @@
+# Generated by Django 4.2.16 on 2026-10-19 06:37
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def digest_keys(profile):
+    """Frozen copy of apps.profiles.models.digest_keys as of this migration."""
+    if not profile.email_digest:
+        return set()
+    types = profile.types_of_interest or ['*']
+    return {f"{domain}:{kind}" for domain in profile.domains_of_interest or [] for kind in types}
+
+
+def backfill_subscriptions(apps, schema_editor):
+    """Index existing students' domains of interest for digests."""
+    StudentProfile = apps.get_model('profiles', 'StudentProfile')
+    DigestSubscription = apps.get_model('profiles', 'DigestSubscription')
+    rows = [
+        DigestSubscription(user_id=profile.user_id, key=key)
+        for profile in StudentProfile.objects.iterator(chunk_size=500)
+        for key in digest_keys(profile)
+    ]
+    DigestSubscription.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('profiles', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentprofile',
+            name='email_digest',
+            field=models.BooleanField(default=True, help_text='Email a digest of new matching opportunities'),
+        ),
+        migrations.AddField(
+            model_name='studentprofile',
+            name='types_of_interest',
+            field=models.JSONField(blank=True, default=list, help_text='Opportunity type codes for the digest; empty means all types'),
+        ),
+        migrations.CreateModel(
+            name='DigestSubscription',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(db_index=True, max_length=40)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='digest_subscriptions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'unique_together': {('user', 'key')},
+            },
+        ),
+        migrations.RunPython(backfill_subscriptions, migrations.RunPython.noop),
+    ]
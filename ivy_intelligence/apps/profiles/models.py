@@ -34,6 +34,9 @@ class StudentProfile(models.Model):
     year_of_study = models.CharField(max_length=5, choices=YEAR_CHOICES, blank=True)
     cgpa = models.FloatField(null=True, blank=True, help_text="On a 10 point scale")
     domains_of_interest = models.JSONField(default=list, help_text="List of domain codes")
+    types_of_interest = models.JSONField(default=list, blank=True,
+                                         help_text="Opportunity type codes for the digest; empty means all types")
+    email_digest = models.BooleanField(default=True, help_text="Email a digest of new matching opportunities")
     skills = models.JSONField(default=list, help_text="List of skill strings")
     resume = models.FileField(upload_to='resumes/', blank=True, null=True)
     linkedin_url = models.URLField(blank=True)
@@ -61,6 +64,31 @@ class StudentProfile(models.Model):
         super().save(*args, **kwargs)
 
 
+class DigestSubscription(models.Model):
+    """
+    Reverse index for notification digests: one row per (student, key)
+    where key is "<domain>:<type>", or "<domain>:*" for students who want
+    every type. Rebuilt from the profile whenever it is saved, so the
+    digest builder can go from a new opportunity straight to the students
+    who want it (see apps/opportunities/digests.py).
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='digest_subscriptions')
+    key = models.CharField(max_length=40, db_index=True)
+
+    class Meta:
+        unique_together = ['user', 'key']
+
+    def __str__(self):
+        return f"{self.user} ← {self.key}"
+
+
+def digest_keys(profile) -> set:
+    if not profile.email_digest:
+        return set()
+    types = profile.types_of_interest or ['*']
+    return {f"{domain}:{kind}" for domain in profile.domains_of_interest or [] for kind in types}
+
+
 @receiver(post_save, sender=User)
 def create_student_profile(sender, instance, created, **kwargs):
     """Automatically create a StudentProfile when a new User registers."""
@@ -73,3 +101,16 @@ def save_student_profile(sender, instance, **kwargs):
     """Automatically save profile when user is saved."""
     if hasattr(instance, 'studentprofile'):
         instance.studentprofile.save()
+
+
+@receiver(post_save, sender=StudentProfile)
+def sync_digest_subscriptions(sender, instance, **kwargs):
+    """Keep the user's DigestSubscription rows in step with their interests."""
+    wanted = digest_keys(instance)
+    current = set(instance.user.digest_subscriptions.values_list('key', flat=True))
+    if current - wanted:
+        instance.user.digest_subscriptions.filter(key__in=current - wanted).delete()
+    if wanted - current:
+        DigestSubscription.objects.bulk_create(
+            [DigestSubscription(user=instance.user, key=key) for key in wanted - current], ignore_conflicts=True
+        )
@@ -14,3 +14,9 @@ application = ProtocolTypeRouter({
         )
     ),
 })
+
+# Warm the domain classifier before the first request (see config/wsgi.py)
+from django.conf import settings  # noqa: E402
+if getattr(settings, 'CLASSIFIER_PRELOAD', True):
+    from apps.opportunities.classifier import preload  # noqa: E402
+    preload()
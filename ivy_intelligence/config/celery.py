@@ -7,13 +7,54 @@ app = Celery('ivy_intelligence')
 app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
 
+
+# Load the domain classifier once in the worker's parent process, before the
+# prefork pool starts, so every child inherits it copy-on-write instead of
+# loading its own on the first task.
+from celery.signals import worker_init, worker_process_init
+
+
+@worker_init.connect
+def preload_classifier(**kwargs):
+    from django.conf import settings
+    if getattr(settings, 'CLASSIFIER_PRELOAD', True):
+        from apps.opportunities.classifier import preload
+        preload()
+
+
+@worker_process_init.connect
+def report_classifier_memory(**kwargs):
+    import logging
+    from apps.opportunities.classifier import load_stats
+    logging.getLogger(__name__).info(f"Worker process classifier: {load_stats()}")
+
 # Periodic task schedule
 from celery.schedules import crontab
 
 app.conf.beat_schedule = {
-    'scrape-opportunities-every-6-hours': {
-        'task': 'apps.opportunities.tasks.scrape_all_universities',
-        'schedule': crontab(minute=0, hour='*/6'),
+    # Each university is scraped on its own learned interval; this tick
+    # just checks which ones are due (see apps/opportunities/scheduling.py)
+    'scrape-due-universities': {
+        'task': 'apps.opportunities.tasks.scrape_due_universities',
+        'schedule': crontab(minute='*/30'),
+    },
+    'expire-opportunities-daily': {
+        'task': 'apps.opportunities.tasks.expire_opportunities',
+        'schedule': crontab(minute=30, hour=1),  # 1:30 AM daily
+    },
+    # Saved searches are matched against new postings from the change feed
+    'percolate-saved-searches': {
+        'task': 'apps.opportunities.tasks.percolate_saved_searches',
+        'schedule': crontab(minute='*/5'),
+    },
+    'prune-change-feed-daily': {
+        'task': 'apps.opportunities.tasks.prune_change_feed',
+        'schedule': crontab(minute=45, hour=1),  # 1:45 AM daily
+    },
+    # Staff domain corrections are folded into the classifier incrementally
+    'train-classifier-nightly': {
+        'task': 'apps.opportunities.tasks.train_classifier_from_corrections',
+        'schedule': crontab(minute=15, hour=3),  # 3:15 AM daily
     },
     'recalculate-incoscores-daily': {
         'task': 'apps.incoscore.tasks.recalculate_all_scores',
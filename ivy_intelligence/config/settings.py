@@ -143,6 +143,52 @@ CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'Asia/Kolkata'
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
 
+# Scraper snapshot store — raw HTML of every fetched page, gzip-compressed
+# and deduplicated by content hash. Used by `manage.py reextract`.
+SCRAPER_SNAPSHOTS_ENABLED = config('SCRAPER_SNAPSHOTS', default=True, cast=bool)
+SNAPSHOT_ROOT = BASE_DIR / 'snapshots'
+
+# Detail-page enrichment — after each sweep, fetch the pages of newly inserted
+# opportunities (at most SCRAPER_ENRICH_WORKERS at a time) to fill in
+# description, deadline, stipend and location.
+SCRAPER_ENRICH_DETAILS = config('SCRAPER_ENRICH_DETAILS', default=False, cast=bool)
+SCRAPER_ENRICH_WORKERS = config('SCRAPER_ENRICH_WORKERS', default=4, cast=int)
+
+# Adaptive scrape scheduling — each university's interval is learned from
+# how often its listing changes, within these bounds (see scheduling.py)
+SCRAPE_DEFAULT_INTERVAL_HOURS = config('SCRAPE_DEFAULT_INTERVAL_HOURS', default=6, cast=float)
+SCRAPE_MIN_INTERVAL_HOURS = config('SCRAPE_MIN_INTERVAL_HOURS', default=1, cast=float)
+SCRAPE_MAX_INTERVAL_HOURS = config('SCRAPE_MAX_INTERVAL_HOURS', default=24, cast=float)
+
+# Change feed (outbox) — consumers only see changes this many seconds old,
+# and rows are kept for CHANGE_FEED_RETENTION_DAYS (see changefeed.py)
+CHANGE_FEED_SETTLE_SECONDS = config('CHANGE_FEED_SETTLE_SECONDS', default=5, cast=int)
+CHANGE_FEED_RETENTION_DAYS = config('CHANGE_FEED_RETENTION_DAYS', default=30, cast=int)
+
+# Per-source circuit breaker — after this many failed runs in a row a
+# source is skipped until the cooldown passes (see health.py)
+SOURCE_BREAKER_FAILURES = config('SOURCE_BREAKER_FAILURES', default=3, cast=int)
+SOURCE_BREAKER_COOLDOWN_HOURS = config('SOURCE_BREAKER_COOLDOWN_HOURS', default=6, cast=float)
+
+# Domain classifier prediction cache — per-process LRU size, and optionally
+# the name of a CACHES alias shared by all workers (see classifier.py)
+CLASSIFIER_CACHE_SIZE = config('CLASSIFIER_CACHE_SIZE', default=10000, cast=int)
+CLASSIFIER_SHARED_CACHE = config('CLASSIFIER_SHARED_CACHE', default='')
+# 'tfidf' (TF-IDF + logistic regression) or 'hashing' (HashingVectorizer + pruned SGD)
+CLASSIFIER_BACKEND = config('CLASSIFIER_BACKEND', default='tfidf')
+# Load the model at worker/web-server start instead of on first use
+CLASSIFIER_PRELOAD = config('CLASSIFIER_PRELOAD', default=True, cast=bool)
+# Opportunities are also listed under every other domain scored at least
+# this many percent (see labels.py)
+CLASSIFIER_LABEL_THRESHOLD = config('CLASSIFIER_LABEL_THRESHOLD', default=30.0, cast=float)
+
+# How long the tag cloud of the active catalogue is cached (see tags.py)
+TAG_CLOUD_CACHE_SECONDS = config('TAG_CLOUD_CACHE_SECONDS', default=300, cast=int)
+
+# Expiry — an opportunity missing from its source page for this many
+# successful sweeps in a row is deactivated as stale (see expiry.py)
+OPPORTUNITY_STALE_AFTER_SWEEPS = config('OPPORTUNITY_STALE_AFTER_SWEEPS', default=4, cast=int)
+
 # Django Channels
 if DEBUG:
     CHANNEL_LAYERS = {
@@ -174,6 +220,11 @@ REST_FRAMEWORK = {
 
 # Email (console for dev)
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='Ivy Intelligence <noreply@ivyintelligence.local>')
+
+# Opportunity digests — absolute links in emails, and messages per SMTP batch
+SITE_URL = config('SITE_URL', default='http://localhost:8000')
+DIGEST_CHUNK_SIZE = config('DIGEST_CHUNK_SIZE', default=200, cast=int)
 
 User = get_user_model()
 
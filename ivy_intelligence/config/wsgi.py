@@ -3,4 +3,11 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 application = get_wsgi_application()
+
+# With `gunicorn --preload` this runs once in the master, and the workers it
+# forks share the loaded classifier (see apps/opportunities/classifier.py)
+from django.conf import settings  # noqa: E402
+if getattr(settings, 'CLASSIFIER_PRELOAD', True):
+    from apps.opportunities.classifier import preload  # noqa: E402
+    preload()
 app = application  # Required for Vercel
@@ -3,7 +3,7 @@ import django
 import sys
 
 # Set up Django environment manually
-project_path = r'c:\Users\srini\Downloads\ivy_intelligence_project\ivy_intelligence'
+project_path = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(project_path)
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 django.setup()